@@ -0,0 +1,187 @@
+from sqlalchemy import inspect, text
+
+# Schema migrations for databases created by older versions of the portal.
+#
+# db.create_all() only creates missing tables, so a change to an existing
+# table (a new index, column or constraint) needs a migration here. New
+# databases are built from the models directly and then run every migration
+# too, so each one must be a no-op when the change is already in place.
+# Append new migrations at the end; never reorder or remove them.
+MIGRATIONS = []
+MAX_REPORTED_ROWS = 20
+
+class MigrationError(Exception):
+    """Data a migration will not change on its own; its transaction is rolled back."""
+
+def migration(function):
+    MIGRATIONS.append(function)
+    return function
+
+def _create_indexes(connection, indexes):
+    """CREATE INDEX IF NOT EXISTS for each (name, table, columns, unique).
+
+    Every migration spells out its own indexes: the models describe the
+    latest schema, which may use columns a later migration adds.
+    """
+    for name, table, columns, unique in indexes:
+        connection.execute(text(
+            f"CREATE {'UNIQUE ' if unique else ''}INDEX IF NOT EXISTS {name} ON {table} ({', '.join(columns)})"
+        ))
+
+def _add_missing_columns(connection, table, columns):
+    """Add the ``columns`` ({name: type and default}) that ``table`` lacks."""
+    existing = {column["name"] for column in inspect(connection).get_columns(table)}
+    for name, definition in columns.items():
+        if name not in existing:
+            connection.execute(text(f"ALTER TABLE {table} ADD COLUMN {name} {definition}"))
+
+@migration
+def add_hot_path_indexes(connection):
+    """Indexes for the dashboard filters, joins and keyset sort keys."""
+    _create_indexes(connection, [
+        ("ix_student_created", "student", ("created_at", "student_id"), False),
+        ("ix_student_graduation_year", "student", ("student_graduation_year",), False),
+        ("ix_company_created", "company", ("created_at", "company_id"), False),
+        ("ix_company_approved_created", "company", ("company_is_approved", "created_at", "company_id"), False),
+        ("ix_drive_company_status", "placement_drive", ("company_id", "drive_status"), False),
+        ("ix_drive_status_deadline", "placement_drive", ("drive_status", "application_deadline"), False),
+        ("ix_drive_approved_deadline", "placement_drive", ("drive_is_approved", "application_deadline"), False),
+        ("ix_drive_created", "placement_drive", ("created_at", "drive_id"), False),
+        ("ix_application_student_status", "application", ("student_id", "application_status"), False),
+        ("ix_application_job_status", "application", ("job_id", "application_status"), False),
+        ("ix_application_date", "application", ("application_date", "application_id"), False),
+        ("ix_placement_statistics_year", "placement_statistics", ("year",), True),
+    ])
+
+@migration
+def add_drive_eligibility_criteria(connection):
+    """Structured eligibility criteria on drives."""
+    _add_missing_columns(connection, "placement_drive", {
+        "min_cgpa": "FLOAT",
+        "allowed_departments": "VARCHAR(200)",
+        "allowed_graduation_years": "VARCHAR(100)",
+        "exclude_blacklisted": "BOOLEAN DEFAULT TRUE",
+    })
+
+@migration
+def add_application_uniqueness(connection):
+    """One application per student and drive, and per-student idempotency keys."""
+    # There was no apply route before, so duplicates can only come from manual
+    # inserts. Which of them is the real one (its status, interview notes) is
+    # for an admin to decide, so stop and list them.
+    duplicates = {}
+    for application_id, student_id, job_id in connection.execute(text(
+        "SELECT application_id, student_id, job_id FROM application WHERE (student_id, job_id) IN "
+        "(SELECT student_id, job_id FROM application GROUP BY student_id, job_id HAVING COUNT(*) > 1) "
+        "ORDER BY student_id, job_id, application_id"
+    )):
+        duplicates.setdefault((student_id, job_id), []).append(application_id)
+    if duplicates:
+        lines = [
+            f"student {student_id}, drive {job_id}: applications {', '.join(map(str, ids))}"
+            for (student_id, job_id), ids in list(duplicates.items())[:MAX_REPORTED_ROWS]
+        ]
+        if len(duplicates) > MAX_REPORTED_ROWS:
+            lines.append(f"... and {len(duplicates) - MAX_REPORTED_ROWS} more")
+        raise MigrationError(
+            f"{len(duplicates)} student and drive pairs have more than one application. Delete all but "
+            "one application of each pair and run the upgrade again:\n  " + "\n  ".join(lines)
+        )
+
+    _add_missing_columns(connection, "application", {"idempotency_key": "VARCHAR(64)"})
+    _create_indexes(connection, [
+        ("uq_application_student_job", "application", ("student_id", "job_id"), True),
+        ("uq_application_idempotency_key", "application", ("student_id", "idempotency_key"), True),
+    ])
+
+@migration
+def add_drive_salary_columns(connection):
+    """Numeric salary parsed from job_salary_range, filled in for existing drives."""
+    from Services.salary import backfill_salaries
+
+    _add_missing_columns(connection, "placement_drive", {
+        "salary_min": "FLOAT",
+        "salary_max": "FLOAT",
+        "salary_currency": "VARCHAR(3)",
+        "salary_period": "VARCHAR(10)",
+    })
+    _create_indexes(connection, [
+        ("ix_drive_salary_min", "placement_drive", ("salary_currency", "salary_period", "salary_min"), False),
+        ("ix_drive_salary_max", "placement_drive", ("salary_currency", "salary_period", "salary_max"), False),
+    ])
+    backfill_salaries(connection)
+
+@migration
+def add_application_status_index(connection):
+    """Index for the placement reports, which start from every Selected application."""
+    _create_indexes(connection, [
+        ("ix_application_status_student", "application", ("application_status", "student_id", "job_id"), False),
+    ])
+
+@migration
+def fill_eligibility_of_closed_drives(connection):
+    """drive_eligibility used to drop the rows of closed and rejected drives, recompute it for every drive."""
+    from Services.eligibility import refresh_drives
+
+    # Without the table (db-upgrade before any init-db) init-db builds it from scratch
+    if inspect(connection).has_table("drive_eligibility"):
+        refresh_drives(connection)
+
+@migration
+def add_account_display_name(connection):
+    """Navbar name on the account row, copied from the student, company and admin tables."""
+    # Without the table (db-upgrade before any init-db) backfill_accounts fills it in
+    if not inspect(connection).has_table("account"):
+        return
+    _add_missing_columns(connection, "account", {"account_display_name": "VARCHAR(80)"})
+    for role, table, id_column, name_column in (
+        ("student", "student", "student_id", "student_name"),
+        ("company", "company", "company_id", "company_name"),
+        ("admin", "admin", "admin_id", "admin_username"),
+    ):
+        connection.execute(text(
+            f"UPDATE account SET account_display_name = "
+            f"(SELECT {name_column} FROM {table} WHERE {id_column} = account.account_user_id) "
+            f"WHERE account_role = :role AND account_display_name IS NULL"
+        ), {"role": role})
+
+@migration
+def prune_eligibility_of_finished_drives(connection):
+    """drive_eligibility keeps only pending and open drives, refreshed in the background when marked stale."""
+    _add_missing_columns(connection, "placement_drive", {"eligibility_stale": "BOOLEAN NOT NULL DEFAULT FALSE"})
+    _create_indexes(connection, [
+        ("ix_drive_eligibility_stale", "placement_drive", ("eligibility_stale",), False),
+    ])
+    # Without the table (db-upgrade before any init-db) init-db builds it from scratch
+    if inspect(connection).has_table("drive_eligibility"):
+        connection.execute(text(
+            "DELETE FROM drive_eligibility WHERE drive_id IN "
+            "(SELECT drive_id FROM placement_drive WHERE drive_status NOT IN ('pending', 'open'))"
+        ))
+
+#Runner
+def current_version(connection):
+    connection.execute(text("CREATE TABLE IF NOT EXISTS schema_version (version INTEGER NOT NULL)"))
+    version = connection.execute(text("SELECT version FROM schema_version")).scalar()
+    if version is None:
+        connection.execute(text("INSERT INTO schema_version (version) VALUES (0)"))
+        version = 0
+    return version
+
+def upgrade(engine, target=None):
+    """Apply every migration the database has not seen yet, each in its own transaction.
+
+    ``target`` stops at that schema version instead of the latest one.
+    Returns the names of the migrations applied.
+    """
+    with engine.begin() as connection:
+        version = current_version(connection)
+
+    applied = []
+    for number, step in enumerate(MIGRATIONS[version:target], start=version + 1):
+        with engine.begin() as connection:
+            step(connection)
+            connection.execute(text("UPDATE schema_version SET version = :version"), {"version": number})
+        applied.append(step.__name__)
+
+    return applied
@@ -1,10 +1,42 @@
 from sqlalchemy import Date
+from sqlalchemy.orm import joinedload, selectinload
 from werkzeug.security import generate_password_hash, check_password_hash
 from flask_sqlalchemy import SQLAlchemy
 from datetime import datetime
 
 db = SQLAlchemy()
 
+# Loading strategy used when a listing asks for a relationship eagerly.
+# 'joined' folds the related row into the listing query with a LEFT OUTER JOIN
+# (best for many-to-one), 'selectin' issues one extra SELECT ... IN per
+# relationship (best for one-to-many). Either way the number of statements is
+# fixed, no matter how many rows the listing returns.
+EAGER_LOADING = {
+    'Application.student': 'joined',
+    'Application.placement_drive': 'joined',
+    'PlacementDrive.company': 'joined',
+    'PlacementDrive.applications': 'selectin',
+    'Company.placement_drive': 'selectin',
+    'Student.applications': 'selectin',
+}
+
+_LOADERS = {'joined': joinedload, 'selectin': selectinload}
+
+def eager_load(*path):
+    """Build a loader option for a relationship path using EAGER_LOADING.
+
+    eager_load(Application.placement_drive, PlacementDrive.company) loads the
+    drive of every application and the company of every drive up front.
+    """
+    option = None
+    for attribute in path:
+        strategy = EAGER_LOADING.get(f"{attribute.class_.__name__}.{attribute.key}", 'selectin')
+        if option is None:
+            option = _LOADERS[strategy](attribute)
+        else:
+            option = getattr(option, _LOADERS[strategy].__name__)(attribute)
+    return option
+
 class Admin(db.Model):
     __tablename__ = 'admin'
     admin_id = db.Column(db.Integer, primary_key=True)
@@ -38,6 +70,11 @@ class Student(db.Model):
     student_is_blacklisted = db.Column(db.Boolean, default=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
+    __table_args__ = (
+        db.Index('ix_student_created', 'created_at', 'student_id'),
+        db.Index('ix_student_graduation_year', 'student_graduation_year'),
+    )
+
     #Relations
     applications = db.relationship('Application', backref='student', lazy=True)
     
@@ -65,6 +102,11 @@ class Company(db.Model):
     company_is_blacklisted = db.Column(db.Boolean, default=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
+    __table_args__ = (
+        db.Index('ix_company_created', 'created_at', 'company_id'),
+        db.Index('ix_company_approved_created', 'company_is_approved', 'created_at', 'company_id'),
+    )
+
     #Relations
     placement_drive = db.relationship('PlacementDrive', backref='company', lazy=True)
 
@@ -85,15 +127,37 @@ class PlacementDrive(db.Model):
     job_location = db.Column(db.String(100), nullable=False)
     job_type = db.Column(db.String(50), nullable=True)
     job_salary_range = db.Column(db.String(50), nullable=False)
+    # Parsed from job_salary_range by Services/salary.py, in currency units per period
+    salary_min = db.Column(db.Float, nullable=True)
+    salary_max = db.Column(db.Float, nullable=True)
+    salary_currency = db.Column(db.String(3), nullable=True)
+    salary_period = db.Column(db.String(10), nullable=True)
     job_eligibility_criteria = db.Column(db.Text, nullable=True)
+    # Structured criteria, matched by Services/eligibility.py (empty = no restriction)
+    min_cgpa = db.Column(db.Float, nullable=True)
+    allowed_departments = db.Column(db.String(200), nullable=True)  # comma separated
+    allowed_graduation_years = db.Column(db.String(100), nullable=True)  # comma separated
+    exclude_blacklisted = db.Column(db.Boolean, default=True)
     job_no_of_positions = db.Column(db.Integer, nullable=True)
     application_deadline = db.Column(db.Date, nullable=False)
     drive_date_posted = db.Column(db.DateTime, default=datetime.utcnow)
     drive_is_approved = db.Column(db.Boolean, default=False)
     drive_is_rejected = db.Column(db.Boolean, default=False)
     drive_status = db.Column(db.String(20), default='pending')
+    # Set when drive_eligibility needs recomputing for this drive, see Services/eligibility.py
+    eligibility_stale = db.Column(db.Boolean, nullable=False, default=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
+    __table_args__ = (
+        db.Index('ix_drive_company_status', 'company_id', 'drive_status'),
+        db.Index('ix_drive_eligibility_stale', 'eligibility_stale'),
+        db.Index('ix_drive_status_deadline', 'drive_status', 'application_deadline'),
+        db.Index('ix_drive_approved_deadline', 'drive_is_approved', 'application_deadline'),
+        db.Index('ix_drive_created', 'created_at', 'drive_id'),
+        db.Index('ix_drive_salary_min', 'salary_currency', 'salary_period', 'salary_min'),
+        db.Index('ix_drive_salary_max', 'salary_currency', 'salary_period', 'salary_max'),
+    )
+
     #relations
     applications = db.relationship('Application', backref='placement_drive', lazy=True)
 
@@ -105,14 +169,99 @@ class Application(db.Model):
     application_date = db.Column(db.DateTime, default=datetime.utcnow)
     application_status = db.Column(db.String(20), default='pending')
     remarks = db.Column(db.Text, nullable=True)
+    # Client supplied key of the apply request, so a retried submit is answered, not repeated
+    idempotency_key = db.Column(db.String(64), nullable=True)
+
+    __table_args__ = (
+        db.Index('uq_application_student_job', 'student_id', 'job_id', unique=True),
+        db.Index('uq_application_idempotency_key', 'student_id', 'idempotency_key', unique=True),
+        db.Index('ix_application_student_status', 'student_id', 'application_status'),
+        db.Index('ix_application_job_status', 'job_id', 'application_status'),
+        db.Index('ix_application_date', 'application_date', 'application_id'),
+        db.Index('ix_application_status_student', 'application_status', 'student_id', 'job_id'),
+    )
 
 class PlacementStatistics(db.Model):
     __tablename__ = 'placement_statistics'
     stats_id = db.Column(db.Integer, primary_key=True)
-    year = db.Column(db.Integer, nullable=False)
+    year = db.Column(db.Integer, unique=True, nullable=False)
     total_students = db.Column(db.Integer, nullable=False)
     placed_students = db.Column(db.Integer, nullable=False)
     company_participation = db.Column(db.Integer, nullable=False)
     average_salary = db.Column(db.Float, nullable=True)
     highest_salary = db.Column(db.Float, nullable=True)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
\ No newline at end of file
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+class DashboardCounter(db.Model):
+    __tablename__ = 'dashboard_counter'
+    counter_name = db.Column(db.String(50), primary_key=True)
+    counter_value = db.Column(db.Integer, nullable=False, default=0)
+
+class Account(db.Model):
+    # One row per login email across students, companies and admins
+    __tablename__ = 'account'
+    account_id = db.Column(db.Integer, primary_key=True)
+    account_email = db.Column(db.String(120), unique=True, nullable=False)
+    account_role = db.Column(db.String(20), nullable=False)
+    account_user_id = db.Column(db.Integer, nullable=False)
+    account_password_hash = db.Column(db.String(128), nullable=False)
+    # Navbar name (student/company name, admin username), stored so login needs no second lookup
+    account_display_name = db.Column(db.String(80), nullable=True)
+
+    __table_args__ = (
+        db.UniqueConstraint('account_role', 'account_user_id'),
+    )
+
+    def check_password(self, password):
+        return check_password_hash(self.account_password_hash, password)
+
+class StudentImport(db.Model):
+    # CSV uploaded by an admin, imported in the background by Services/student_import.py
+    __tablename__ = 'student_import'
+    import_id = db.Column(db.Integer, primary_key=True)
+    csv_filename = db.Column(db.String(200), nullable=False)
+    original_filename = db.Column(db.String(200), nullable=True)
+    import_status = db.Column(db.String(20), nullable=False, default='pending')
+    imported = db.Column(db.Integer, nullable=False, default=0)
+    skipped = db.Column(db.Integer, nullable=False, default=0)
+    errors = db.Column(db.Text, nullable=True)  # JSON [[line, email, message], ...], the first MAX_REPORTED_ERRORS
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    finished_at = db.Column(db.DateTime, nullable=True)
+
+    __table_args__ = (
+        db.Index('ix_student_import_status', 'import_status', 'import_id'),
+    )
+
+class ResumeJob(db.Model):
+    # Queue of resumes waiting for text extraction, worked by `flask resume-worker`
+    __tablename__ = 'resume_job'
+    job_id = db.Column(db.Integer, primary_key=True)
+    student_id = db.Column(db.Integer, db.ForeignKey('student.student_id'), nullable=False)
+    resume_filename = db.Column(db.String(200), nullable=False)
+    job_status = db.Column(db.String(20), nullable=False, default='pending')
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    error = db.Column(db.Text, nullable=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        db.Index('ix_resume_job_status', 'job_status', 'job_id'),
+    )
+
+class ResumeText(db.Model):
+    # Text extracted from a student's current resume, indexed for skill search
+    __tablename__ = 'resume_text'
+    student_id = db.Column(db.Integer, db.ForeignKey('student.student_id'), primary_key=True)
+    resume_filename = db.Column(db.String(200), nullable=False)
+    resume_text = db.Column(db.Text, nullable=False)
+    extracted_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+class DriveEligibility(db.Model):
+    # One row per (drive, eligible student) of the pending and open drives
+    __tablename__ = 'drive_eligibility'
+    drive_id = db.Column(db.Integer, db.ForeignKey('placement_drive.drive_id'), primary_key=True)
+    student_id = db.Column(db.Integer, db.ForeignKey('student.student_id'), primary_key=True)
+
+    __table_args__ = (
+        db.Index('ix_drive_eligibility_student', 'student_id', 'drive_id'),
+    )
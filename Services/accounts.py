@@ -0,0 +1,108 @@
+from sqlalchemy import event, exists, insert, select, update, delete, literal
+from sqlalchemy.orm import attributes
+from Models.model import db, Account, Student, Company, Admin
+
+# role -> (model, email column, id column, password hash column, display
+# name column), in the order the old login searched the tables. The order
+# decides which row wins when a legacy database has the same email in two
+# tables.
+ACCOUNT_SOURCES = {
+    "student": (Student, "student_email", "student_id", "student_password_hash", "student_name"),
+    "company": (Company, "company_email", "company_id", "company_password_hash", "company_name"),
+    "admin": (Admin, "admin_email", "admin_id", "admin_password_hash", "admin_username"),
+}
+
+# role -> column shown as the user's name in the navbar
+DISPLAY_NAMES = {
+    role: getattr(model, name_attr) for role, (model, *_, name_attr) in ACCOUNT_SOURCES.items()
+}
+
+account_table = Account.__table__
+
+def email_taken(email):
+    return db.session.query(exists().where(Account.account_email == email)).scalar()
+
+def find_account(email):
+    return Account.query.filter_by(account_email=email).first()
+
+def display_name(role, user_id):
+    """Name of a logged in user, read with a single-column primary key lookup."""
+    column = DISPLAY_NAMES.get(role)
+    if column is None:
+        return None
+    model = column.class_
+    return db.session.execute(
+        select(column).where(model.__mapper__.primary_key[0] == user_id)
+    ).scalar()
+
+def _register_sync(role, model, email_attr, id_attr, hash_attr, name_attr):
+
+    def account_row(target):
+        return (account_table.c.account_role == role) & (account_table.c.account_user_id == getattr(target, id_attr))
+
+    @event.listens_for(model, "after_insert")
+    def account_insert(mapper, connection, target):
+        connection.execute(insert(account_table).values(
+            account_email=getattr(target, email_attr),
+            account_role=role,
+            account_user_id=getattr(target, id_attr),
+            account_password_hash=getattr(target, hash_attr),
+            account_display_name=getattr(target, name_attr)
+        ))
+
+    @event.listens_for(model, "after_update")
+    def account_update(mapper, connection, target):
+        changed = [
+            name for name in (email_attr, hash_attr, name_attr)
+            if attributes.get_history(target, name).has_changes()
+        ]
+        if changed:
+            connection.execute(update(account_table).where(account_row(target)).values(
+                account_email=getattr(target, email_attr),
+                account_password_hash=getattr(target, hash_attr),
+                account_display_name=getattr(target, name_attr)
+            ))
+
+    @event.listens_for(model, "after_delete")
+    def account_delete(mapper, connection, target):
+        connection.execute(delete(account_table).where(account_row(target)))
+
+for role, source in ACCOUNT_SOURCES.items():
+    _register_sync(role, *source)
+
+def backfill_accounts():
+    """Create the missing account rows for existing students, companies and admins.
+
+    Returns {role: rows added} and the emails skipped because an earlier role
+    already uses them.
+    """
+    added = {}
+    for role, (model, email_attr, id_attr, hash_attr, name_attr) in ACCOUNT_SOURCES.items():
+        email = getattr(model, email_attr)
+        user_id = getattr(model, id_attr)
+
+        missing = select(
+            email, literal(role), user_id, getattr(model, hash_attr), getattr(model, name_attr)
+        ).where(
+            ~exists().where(Account.account_email == email),
+            ~exists().where((Account.account_role == role) & (Account.account_user_id == user_id))
+        )
+
+        result = db.session.execute(
+            insert(account_table).from_select(
+                ["account_email", "account_role", "account_user_id", "account_password_hash", "account_display_name"],
+                missing
+            )
+        )
+        added[role] = result.rowcount
+
+    skipped = []
+    for role, (model, email_attr, id_attr, hash_attr, name_attr) in ACCOUNT_SOURCES.items():
+        skipped += db.session.execute(
+            select(getattr(model, email_attr)).where(
+                ~exists().where((Account.account_role == role) & (Account.account_user_id == getattr(model, id_attr)))
+            )
+        ).scalars().all()
+
+    db.session.commit()
+    return added, skipped
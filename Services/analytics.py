@@ -0,0 +1,177 @@
+import threading
+import time
+from flask import current_app
+from sqlalchemy import and_, case, func, select
+from Models.model import db, Student, Company, PlacementDrive, Application
+from Services.salary import LAKH
+from Services.statistics import SALARY_CURRENCY
+
+# Placement analytics for the admin dashboard. Every report is a single
+# GROUP BY (or window) query over application joined to student, drive and
+# company; salaries are the upper end of each drive's annual INR package, in
+# lakhs. The figures move slowly and the queries read every selected
+# application, so results are cached per process for ANALYTICS_TTL seconds.
+DEFAULT_TTL = 300
+PERCENTILES = (25, 50, 75, 90)
+
+class TTLCache:
+    """Values computed on first use and kept for ``ttl`` seconds."""
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, key, compute, ttl):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry and entry[0] > now:
+            return entry[1]
+
+        value = compute()
+        with self._lock:
+            self._entries[key] = (now + ttl, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+analytics_cache = TTLCache()
+
+def _lakhs(value):
+    return round(value / LAKH, 2) if value is not None else None
+
+def _annual_salary():
+    return case(
+        (and_(PlacementDrive.salary_currency == SALARY_CURRENCY, PlacementDrive.salary_period == "year"),
+         PlacementDrive.salary_max)
+    )
+
+def _selected_applications(*columns):
+    return (
+        select(*columns)
+        .select_from(Application)
+        .join(Student, Student.student_id == Application.student_id)
+        .join(PlacementDrive, PlacementDrive.drive_id == Application.job_id)
+        .where(Application.application_status == "Selected")
+    )
+
+#Reports
+def placement_rates():
+    """Students and placed students per graduation year and department."""
+    placed = (
+        select(Application.student_id)
+        .where(Application.application_status == "Selected")
+        .group_by(Application.student_id)
+        .subquery()
+    )
+    rows = db.session.execute(
+        select(
+            Student.student_graduation_year,
+            Student.student_department,
+            func.count(Student.student_id),
+            func.count(placed.c.student_id),
+        )
+        .outerjoin(placed, placed.c.student_id == Student.student_id)
+        .group_by(Student.student_graduation_year, Student.student_department)
+        .order_by(Student.student_graduation_year.desc(), Student.student_department)
+    ).all()
+
+    return [
+        {
+            "year": year,
+            "department": department,
+            "students": students,
+            "placed": placed_count,
+            "placement_rate": round(placed_count * 100 / students, 1) if students else 0,
+        }
+        for year, department, students, placed_count in rows
+    ]
+
+def salary_distribution():
+    """Offer count, min/avg/max and nearest-rank percentiles per graduation year, in LPA."""
+    salary = _annual_salary()
+    ranked = (
+        _selected_applications(
+            Student.student_graduation_year.label("year"),
+            PlacementDrive.salary_max.label("salary"),
+            func.row_number().over(
+                partition_by=Student.student_graduation_year, order_by=PlacementDrive.salary_max
+            ).label("position"),
+            func.count().over(partition_by=Student.student_graduation_year).label("offers"),
+        )
+        .where(salary.is_not(None))
+        .subquery()
+    )
+
+    def percentile(p):
+        # Integer ceil(p% of offers): the rank of the nearest-rank percentile
+        return func.max(case((ranked.c.position == (ranked.c.offers * p + 99) // 100, ranked.c.salary)))
+
+    rows = db.session.execute(
+        select(
+            ranked.c.year,
+            func.count(),
+            func.min(ranked.c.salary),
+            func.avg(ranked.c.salary),
+            func.max(ranked.c.salary),
+            *(percentile(p) for p in PERCENTILES),
+        )
+        .group_by(ranked.c.year)
+        .order_by(ranked.c.year.desc())
+    ).all()
+
+    return [
+        {
+            "year": year,
+            "offers": offers,
+            "min": _lakhs(lowest),
+            "average": _lakhs(average),
+            "max": _lakhs(highest),
+            **{f"p{p}": _lakhs(value) for p, value in zip(PERCENTILES, values)},
+        }
+        for year, offers, lowest, average, highest, *values in rows
+    ]
+
+def offers_breakdown():
+    """Offers, placed students and salaries per department, graduation year and industry."""
+    salary = _annual_salary()
+    rows = db.session.execute(
+        _selected_applications(
+            Student.student_department,
+            Student.student_graduation_year,
+            Company.company_industry,
+            func.count(Application.application_id),
+            func.count(func.distinct(Application.student_id)),
+            func.avg(salary),
+            func.max(salary),
+        )
+        .join(Company, Company.company_id == PlacementDrive.company_id)
+        .group_by(Student.student_department, Student.student_graduation_year, Company.company_industry)
+        .order_by(Student.student_graduation_year.desc(), func.count(Application.application_id).desc())
+    ).all()
+
+    return [
+        {
+            "department": department,
+            "year": year,
+            "industry": industry,
+            "offers": offers,
+            "placed": placed,
+            "average_salary": _lakhs(average),
+            "highest_salary": _lakhs(highest),
+        }
+        for department, year, industry, offers, placed, average, highest in rows
+    ]
+
+REPORTS = {
+    "placement_rates": placement_rates,
+    "salary_distribution": salary_distribution,
+    "offers": offers_breakdown,
+}
+
+def placement_analytics():
+    """Every report, each served from the cache while younger than ANALYTICS_TTL."""
+    ttl = current_app.config.get("ANALYTICS_TTL", DEFAULT_TTL)
+    return {name: analytics_cache.get(name, report, ttl) for name, report in REPORTS.items()}
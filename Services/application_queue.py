@@ -0,0 +1,317 @@
+import queue
+import threading
+import time
+from datetime import date, datetime
+from sqlalchemy import Date, DateTime, bindparam, exists, func, insert, literal, or_, select, tuple_
+from sqlalchemy.exc import IntegrityError, OperationalError
+from Models.model import db, Application, PlacementDrive, DriveEligibility
+from Services.fragment_cache import bump_versions
+from Services.live_updates import record_applications
+from Services.statistics import StatisticsChanges
+
+# Student applications are written by a single thread per process that takes
+# every request queued while its previous transaction was committing and
+# writes them all in one transaction ("group commit"). Under a deadline rush
+# that turns thousands of tiny SQLite write transactions, each waiting for the
+# write lock and a sync, into a few large ones.
+#
+# Each application is one INSERT ... SELECT that only produces a row while the
+# drive is open, approved, before its deadline and has fewer Selected
+# applications than job_no_of_positions (when set), the student is in
+# drive_eligibility and has not applied yet, so the checks and the write
+# cannot be separated by a concurrent close or a second submit. The unique
+# (student_id, job_id) index backs this up across processes.
+APPLIED = "applied"            # new application
+REPLAYED = "replayed"          # idempotency key seen before, same answer as the first time
+DUPLICATE = "duplicate"        # already applied to this drive
+KEY_REUSED = "key_reused"      # idempotency key already used for another drive
+CLOSED = "closed"              # drive not open, not approved or past its deadline
+NOT_ELIGIBLE = "not_eligible"  # student does not meet the drive's criteria
+FILLED = "filled"              # every position of the drive has been filled
+
+SUBMIT_TIMEOUT = 30
+DEFAULT_BATCH_SIZE = 500
+WRITE_ATTEMPTS = 5
+RETRY_DELAY = 0.05
+
+application_table = Application.__table__
+drive_table = PlacementDrive.__table__
+eligibility_table = DriveEligibility.__table__
+
+# Counted per drive on ix_application_job_status
+_has_open_positions = or_(
+    drive_table.c.job_no_of_positions.is_(None),
+    select(func.count())
+    .where(application_table.c.job_id == drive_table.c.drive_id, application_table.c.application_status == "Selected")
+    .scalar_subquery() < drive_table.c.job_no_of_positions,
+)
+
+_insert_application = insert(application_table).from_select(
+    ["student_id", "job_id", "application_status", "application_date", "idempotency_key"],
+    select(
+        eligibility_table.c.student_id,
+        eligibility_table.c.drive_id,
+        literal("pending"),
+        bindparam("now", type_=DateTime),
+        bindparam("key"),
+    )
+    .join(drive_table, drive_table.c.drive_id == eligibility_table.c.drive_id)
+    .where(
+        eligibility_table.c.student_id == bindparam("student"),
+        eligibility_table.c.drive_id == bindparam("drive"),
+        drive_table.c.drive_status == "open",
+        drive_table.c.drive_is_approved == True,
+        drive_table.c.application_deadline >= bindparam("today", type_=Date),
+        _has_open_positions,
+        ~exists().where(
+            application_table.c.student_id == bindparam("student"),
+            application_table.c.job_id == bindparam("drive"),
+        ),
+    )
+).returning(application_table.c.application_id)
+
+class ApplyRequest:
+    def __init__(self, student_id, drive_id, idempotency_key=None):
+        self.student_id = student_id
+        self.drive_id = drive_id
+        self.idempotency_key = idempotency_key or None
+        self.outcome = None
+        self.application_id = None
+        self.error = None
+        self.done = threading.Event()
+
+    def resolve(self, outcome, application_id=None):
+        self.outcome = outcome
+        self.application_id = application_id
+
+#Writing
+def _open_drives(connection, drive_ids, today):
+    """{drive_id: whether it still has positions} of the drives in ``drive_ids`` that take applications."""
+    return dict(connection.execute(
+        select(drive_table.c.drive_id, _has_open_positions).where(
+            drive_table.c.drive_id.in_(drive_ids),
+            drive_table.c.drive_status == "open",
+            drive_table.c.drive_is_approved == True,
+            drive_table.c.application_deadline >= today,
+        )
+    ).all())
+
+def apply_batch(connection, requests, now=None):
+    """Write ``requests`` in the current transaction and resolve each one.
+
+    Looks up earlier idempotency keys and applications with one SELECT each
+    and inserts the rest one statement at a time, each returning its id. The
+    caller commits.
+    """
+    now = now or datetime.utcnow()
+    today = date.today()
+
+    keys = {(request.student_id, request.idempotency_key) for request in requests if request.idempotency_key}
+    pairs = {(request.student_id, request.drive_id) for request in requests}
+
+    used_keys = {}
+    if keys:
+        used_keys = {
+            (student_id, key): (application_id, drive_id)
+            for application_id, student_id, drive_id, key in connection.execute(
+                select(
+                    application_table.c.application_id,
+                    application_table.c.student_id,
+                    application_table.c.job_id,
+                    application_table.c.idempotency_key,
+                ).where(tuple_(application_table.c.student_id, application_table.c.idempotency_key).in_(keys))
+            )
+        }
+    applied = {
+        (student_id, drive_id): application_id
+        for application_id, student_id, drive_id in connection.execute(
+            select(application_table.c.application_id, application_table.c.student_id, application_table.c.job_id)
+            .where(tuple_(application_table.c.student_id, application_table.c.job_id).in_(pairs))
+        )
+    }
+
+    # Requests repeated inside the batch answer like their first occurrence
+    leaders, followers, to_insert = {}, [], []
+    for request in requests:
+        pair = (request.student_id, request.drive_id)
+        key = (request.student_id, request.idempotency_key)
+
+        if request.idempotency_key and key in used_keys:
+            application_id, drive_id = used_keys[key]
+            request.resolve(REPLAYED if drive_id == request.drive_id else KEY_REUSED, application_id)
+        elif request.idempotency_key and key in leaders and leaders[key].drive_id == request.drive_id:
+            followers.append((request, leaders[key], REPLAYED))
+        elif pair in applied:
+            request.resolve(DUPLICATE, applied[pair])
+        elif pair in leaders:
+            followers.append((request, leaders[pair], DUPLICATE))
+        else:
+            # A key reused for two drives in one batch fails the unique index,
+            # and commit_batch then retries the requests one at a time
+            leaders[pair] = request
+            if request.idempotency_key:
+                leaders.setdefault(key, request)
+            to_insert.append(request)
+
+    inserted = 0
+    missing = []
+    for request in to_insert:
+        application_id = connection.execute(_insert_application, {
+            "student": request.student_id, "drive": request.drive_id, "key": request.idempotency_key,
+            "now": now, "today": today,
+        }).scalar()
+        if application_id:
+            request.resolve(APPLIED, application_id)
+            inserted += 1
+        else:
+            missing.append(request)
+
+    if missing:
+        # Either the checks failed or another process applied first
+        existing = {
+            (student_id, drive_id): (application_id, key)
+            for application_id, student_id, drive_id, key in connection.execute(
+                select(
+                    application_table.c.application_id,
+                    application_table.c.student_id,
+                    application_table.c.job_id,
+                    application_table.c.idempotency_key,
+                ).where(tuple_(application_table.c.student_id, application_table.c.job_id).in_(
+                    [(request.student_id, request.drive_id) for request in missing]
+                ))
+            )
+        }
+        open_drives = _open_drives(connection, {request.drive_id for request in missing}, today)
+
+        for request in missing:
+            pair = (request.student_id, request.drive_id)
+            if pair in existing:
+                application_id, key = existing[pair]
+                request.resolve(REPLAYED if request.idempotency_key and key == request.idempotency_key else DUPLICATE,
+                                application_id)
+            elif request.drive_id not in open_drives:
+                request.resolve(CLOSED)
+            else:
+                request.resolve(NOT_ELIGIBLE if open_drives[request.drive_id] else FILLED)
+
+    if inserted:
+        # The Core INSERT skips the flush hooks that keep these up to date
+        changes = StatisticsChanges()
+        changes.counters["total_student_applications"] += inserted
+        changes.apply(connection)
+        bump_versions(connection, [application_table.name])
+        record_applications(connection, [
+            (request.application_id, request.student_id, request.drive_id, "pending")
+            for request in to_insert if request.outcome == APPLIED
+        ])
+
+    for request, leader, outcome in followers:
+        request.resolve(outcome if leader.outcome == APPLIED else leader.outcome, leader.application_id)
+
+    return requests
+
+def commit_batch(requests, attempts=WRITE_ATTEMPTS):
+    """Apply and commit ``requests`` in one transaction, then wake their submitters."""
+    error = None
+    for attempt in range(attempts):
+        try:
+            apply_batch(db.session.connection(), requests)
+            db.session.commit()
+            error = None
+            break
+        except IntegrityError as conflict:
+            # Another process inserted the same pair or key first. Retried
+            # alone, each request sees that row and is answered from it.
+            db.session.rollback()
+            if len(requests) > 1:
+                for request in requests:
+                    commit_batch([request], attempts)
+                return
+            error = conflict
+        except OperationalError as locked:
+            # SQLite gives up on the write lock when another process keeps it
+            db.session.rollback()
+            error = locked
+            time.sleep(RETRY_DELAY * (attempt + 1))
+        except Exception as failure:
+            db.session.rollback()
+            error = failure
+            break
+
+    for request in requests:
+        request.error = error
+        request.done.set()
+
+#Queue
+class ApplicationQueue:
+    """Per-process group-commit queue in front of apply_batch.
+
+    The writer thread starts on the first submit, so CLI commands and
+    workers that never take an application never start it.
+    """
+
+    def __init__(self):
+        self.app = None
+        self.enabled = True
+        self.batch_size = DEFAULT_BATCH_SIZE
+        self.batches = 0
+        self.applications = 0
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        """APPLY_GROUP_COMMIT off makes every submit its own transaction."""
+        self.app = app
+        self.enabled = app.config.get("APPLY_GROUP_COMMIT", True)
+        self.batch_size = app.config.get("APPLY_BATCH_SIZE", DEFAULT_BATCH_SIZE)
+
+    def submit(self, student_id, drive_id, idempotency_key=None, timeout=SUBMIT_TIMEOUT):
+        """Queue one application and wait until it is committed. Returns the resolved ApplyRequest."""
+        request = ApplyRequest(student_id, drive_id, idempotency_key)
+
+        if not self.enabled:
+            commit_batch([request])
+        else:
+            self._start()
+            self._queue.put(request)
+            if not request.done.wait(timeout):
+                raise TimeoutError("Application was not written in time")
+
+        if request.error:
+            raise request.error
+        return request
+
+    def _start(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="application-writer", daemon=True)
+                self._thread.start()
+
+    def _take_batch(self):
+        # Block for the first request, then take whatever queued up behind it
+        batch = [self._queue.get()]
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._take_batch()
+            with self.app.app_context():
+                commit_batch(batch)
+            self.batches += 1
+            self.applications += len(batch)
+
+    def stats(self):
+        return {
+            "group_commit": self.enabled,
+            "batches": self.batches,
+            "applications": self.applications,
+            "queued": self._queue.qsize(),
+        }
+
+application_queue = ApplicationQueue()
@@ -0,0 +1,78 @@
+from sqlalchemy import func, update, select
+from Models.model import db, Application, PlacementDrive, Student
+from Services.live_updates import record_status_changes
+from Services.statistics import StatisticsChanges
+
+APPLICATION_STATUSES = ["Shortlisted", "Selected", "Rejected"]
+
+def bulk_update_status(company_id, application_ids, new_status):
+    """Set ``new_status`` on many applications of one company in a single transaction.
+
+    Ownership is checked with one joined SELECT and the change is one UPDATE.
+    Returns {application_id: "updated" | "unchanged" | "not_found" |
+    "positions_filled"}; ids that belong to another company are reported as
+    "not_found". A drive with job_no_of_positions gets no more Selected
+    applications than that, lowest ids first.
+    """
+    if new_status not in APPLICATION_STATUSES:
+        raise ValueError(f"Invalid status {new_status!r}")
+
+    application_ids = set(application_ids)
+    if not application_ids:
+        return {}
+
+    owned = db.session.execute(
+        select(
+            Application.application_id, Application.job_id, Application.application_status,
+            Student.student_graduation_year, PlacementDrive.job_no_of_positions
+        )
+        .join(PlacementDrive, PlacementDrive.drive_id == Application.job_id)
+        .join(Student, Student.student_id == Application.student_id)
+        .where(Application.application_id.in_(application_ids), PlacementDrive.company_id == company_id)
+        .order_by(Application.application_id)
+    ).all()
+
+    positions_left = {}
+    if new_status == "Selected":
+        limited = {row.job_id: row.job_no_of_positions for row in owned if row.job_no_of_positions is not None}
+        if limited:
+            selected = dict(db.session.execute(
+                select(Application.job_id, func.count())
+                .where(Application.job_id.in_(limited), Application.application_status == "Selected")
+                .group_by(Application.job_id)
+            ).all())
+            positions_left = {drive_id: positions - selected.get(drive_id, 0) for drive_id, positions in limited.items()}
+
+    results = {application_id: "not_found" for application_id in application_ids}
+    to_update, status_changes = [], []
+    changes = StatisticsChanges()
+
+    for application_id, drive_id, status, graduation_year, positions in owned:
+        if status == new_status:
+            results[application_id] = "unchanged"
+            continue
+        if drive_id in positions_left:
+            if positions_left[drive_id] <= 0:
+                results[application_id] = "positions_filled"
+                continue
+            positions_left[drive_id] -= 1
+        results[application_id] = "updated"
+        to_update.append(application_id)
+        status_changes.append((drive_id, status, new_status))
+        if "Selected" in (status, new_status):
+            changes.placement_years.add(graduation_year)
+
+    if to_update:
+        db.session.execute(
+            update(Application)
+            .where(Application.application_id.in_(to_update))
+            .values(application_status=new_status)
+            .execution_options(synchronize_session="fetch")
+        )
+        # The bulk UPDATE skips the ORM flush, so the rollups are updated here
+        connection = db.session.connection()
+        changes.apply(connection)
+        record_status_changes(connection, status_changes)
+        db.session.commit()
+
+    return results
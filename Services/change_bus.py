@@ -0,0 +1,175 @@
+import json
+import queue
+import threading
+import uuid
+from collections import Counter, deque
+from sqlalchemy import event
+
+# In-process publish/subscribe for the live dashboards.
+#
+# Writers record what they changed on the connection that changed it
+# (record_event / record_counters). The records move to "committed" when
+# that connection commits and are published when it goes back to the pool,
+# which is after the COMMIT has returned; a rollback drops them. The ORM
+# flush hooks and the Core write paths both go through a connection, so they
+# are published the same way.
+#
+# Every event is serialized to its Server-Sent Events message once, kept in a
+# short replay buffer for reconnecting clients and put on the bounded queue
+# of each interested subscriber, so fan-out costs no queries however many
+# dashboards are open.
+PENDING = "change_bus.pending"
+COMMITTED = "change_bus.committed"
+REPLAY_SIZE = 1000
+SUBSCRIBER_BUFFER = 1000
+
+#Recording
+def record_event(connection, kind, **data):
+    """Publish ``{"type": kind, **data}`` once the current transaction commits."""
+    connection.info.setdefault(PENDING, []).append({"type": kind, **data})
+
+def record_counters(connection, deltas):
+    deltas = {name: delta for name, delta in deltas.items() if delta}
+    if deltas:
+        record_event(connection, "counters", deltas=deltas)
+
+def _merge_counters(events):
+    """All counter deltas of a transaction as one event, ahead of the row events."""
+    deltas = Counter()
+    merged = []
+    for change in events:
+        if change["type"] == "counters" and "deltas" in change:
+            deltas.update(change["deltas"])
+        else:
+            merged.append(change)
+
+    deltas = {name: delta for name, delta in deltas.items() if delta}
+    return ([{"type": "counters", "deltas": deltas}] if deltas else []) + merged
+
+def listen(engine, bus):
+    """Publish what connections of ``engine`` recorded to ``bus`` after they commit."""
+
+    @event.listens_for(engine, "begin")
+    def clear_stale(connection):
+        connection.info.pop(PENDING, None)
+
+    @event.listens_for(engine, "commit")
+    def move_to_committed(connection):
+        pending = connection.info.pop(PENDING, None)
+        if pending:
+            connection.info.setdefault(COMMITTED, []).extend(pending)
+
+    @event.listens_for(engine, "rollback")
+    def drop_recorded(connection):
+        connection.info.pop(PENDING, None)
+        connection.info.pop(COMMITTED, None)
+
+    @event.listens_for(engine, "checkin")
+    def publish_committed(dbapi_connection, connection_record):
+        committed = connection_record.info.pop(COMMITTED, None) if connection_record else None
+        if committed:
+            bus.publish(_merge_counters(committed))
+
+#Bus
+class Subscription:
+    """A subscriber's queue of SSE messages for the events ``accepts`` lets through."""
+
+    def __init__(self, accepts):
+        self.accepts = accepts
+        self.messages = queue.Queue(SUBSCRIBER_BUFFER)
+        # Set when messages were dropped; the stream then sends a resync
+        self.lagging = False
+
+    def put(self, message):
+        try:
+            self.messages.put_nowait(message)
+        except queue.Full:
+            self.lagging = True
+
+class ChangeBus:
+    """Fan-out of committed changes to the subscribers of this process.
+
+    Event ids are "<epoch>-<sequence>", the epoch being new for every
+    process, so a client reconnecting to another worker is resynced instead
+    of being replayed the wrong events.
+    """
+
+    def __init__(self, replay_size=REPLAY_SIZE):
+        self.epoch = uuid.uuid4().hex[:8]
+        # Latest dashboard counters, once a snapshot has been seen
+        self.counters = None
+        self.published = 0
+        self._sequence = 0
+        self._replay = deque(maxlen=replay_size)
+        self._subscribers = set()
+        self._lock = threading.Lock()
+
+    def _message(self, change):
+        return f"id: {self.epoch}-{self._sequence}\nevent: {change['type']}\ndata: {json.dumps(change)}\n\n"
+
+    def _apply_counters(self, change):
+        if "values" in change:
+            self.counters = dict(change["values"])
+        elif self.counters is not None:
+            for name, delta in change["deltas"].items():
+                self.counters[name] = self.counters.get(name, 0) + delta
+
+    def publish(self, events):
+        with self._lock:
+            for change in events:
+                self._sequence += 1
+                self.published += 1
+                if change["type"] == "counters":
+                    self._apply_counters(change)
+
+                message = self._message(change)
+                self._replay.append((self._sequence, change, message))
+                for subscription in self._subscribers:
+                    if subscription.accepts(change):
+                        subscription.put(message)
+
+    def sync_counters(self, values):
+        """Publish an absolute counters snapshot when it differs from what the bus has."""
+        if values != self.counters:
+            self.publish([{"type": "counters", "values": values}])
+
+    def subscribe(self, accepts, last_event_id=None):
+        """A new Subscription, with the events after ``last_event_id`` already queued.
+
+        When those events are no longer in the replay buffer (or the id is
+        from another process) the subscription starts out lagging.
+        """
+        subscription = Subscription(accepts)
+        with self._lock:
+            if last_event_id:
+                epoch, _, sequence = last_event_id.partition("-")
+                oldest = self._replay[0][0] if self._replay else self._sequence + 1
+                if epoch != self.epoch or not sequence.isdigit() or int(sequence) + 1 < oldest:
+                    subscription.lagging = True
+                else:
+                    for number, change, message in self._replay:
+                        if number > int(sequence) and accepts(change):
+                            subscription.put(message)
+            self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    def resync_message(self):
+        """A "resync" message carrying the current counters, under the latest event id."""
+        with self._lock:
+            return self._message({"type": "resync", "counters": self.counters})
+
+    def subscriber_count(self):
+        with self._lock:
+            return len(self._subscribers)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "subscribers": len(self._subscribers),
+                "published": self.published,
+                "lagging": sum(1 for subscription in self._subscribers if subscription.lagging),
+            }
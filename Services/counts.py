@@ -0,0 +1,54 @@
+from sqlalchemy import func
+from Models.model import db, Application, PlacementDrive
+
+COUNTED_STATUSES = ("Shortlisted", "Selected")
+
+def _empty_counts():
+    counts = {"total": 0}
+    counts.update({status: 0 for status in COUNTED_STATUSES})
+    return counts
+
+def drive_application_counts(drive_ids=None, company_id=None):
+    """Applicant counts per drive from one GROUP BY, e.g.
+    {3: {"total": 120, "Shortlisted": 14, "Selected": 2}}.
+
+    Drives without applications are included with zero counts when listed in
+    ``drive_ids``.
+    """
+    query = db.session.query(
+        Application.job_id,
+        Application.application_status,
+        func.count(Application.application_id)
+    )
+
+    if company_id is not None:
+        query = query.join(
+            PlacementDrive, PlacementDrive.drive_id == Application.job_id
+        ).filter(PlacementDrive.company_id == company_id)
+
+    if drive_ids is not None:
+        if not drive_ids:
+            return {}
+        query = query.filter(Application.job_id.in_(drive_ids))
+
+    counts = {drive_id: _empty_counts() for drive_id in drive_ids or []}
+
+    for job_id, status, count in query.group_by(Application.job_id, Application.application_status):
+        drive_counts = counts.setdefault(job_id, _empty_counts())
+        drive_counts["total"] += count
+        if status in COUNTED_STATUSES:
+            drive_counts[status] += count
+
+    return counts
+
+def total_counts(drive_counts):
+    """Add up the per-drive counts returned by drive_application_counts."""
+    totals = _empty_counts()
+    for counts in drive_counts.values():
+        for key, count in counts.items():
+            totals[key] += count
+    return totals
+
+def company_application_counts(company_id, drive_ids=None):
+    """Totals over a company's drives (or only ``drive_ids``) in the same shape."""
+    return total_counts(drive_application_counts(drive_ids, company_id))
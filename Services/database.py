@@ -0,0 +1,66 @@
+import os
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+
+# Engine profiles, picked from the scheme of DATABASE_URL.
+#
+# sqlite      WAL journal so readers never block the writer, a busy timeout so
+#             concurrent writers wait for the lock instead of failing with
+#             "database is locked", and a larger page cache / memory map.
+# postgresql  A sized connection pool with pre-ping, and a statement timeout
+#             so one runaway query cannot hold a connection forever.
+#
+# Every value can be overridden from the environment.
+SQLITE_PRAGMAS = {
+    "journal_mode": os.environ.get("SQLITE_JOURNAL_MODE", "WAL"),
+    "synchronous": os.environ.get("SQLITE_SYNCHRONOUS", "NORMAL"),
+    "busy_timeout": int(os.environ.get("SQLITE_BUSY_TIMEOUT_MS", 5000)),
+    "cache_size": -int(os.environ.get("SQLITE_CACHE_SIZE_KB", 64 * 1024)),
+    "mmap_size": int(os.environ.get("SQLITE_MMAP_SIZE", 256 * 1024 * 1024)),
+    "temp_store": "MEMORY",
+}
+
+def backend_name(url):
+    return make_url(url).get_backend_name()
+
+def engine_options(url):
+    """SQLALCHEMY_ENGINE_OPTIONS for the profile matching ``url``."""
+    backend = backend_name(url)
+
+    if backend == "sqlite":
+        if make_url(url).database in (None, "", ":memory:"):
+            return {}
+        return {
+            "pool_size": int(os.environ.get("DB_POOL_SIZE", 10)),
+            "max_overflow": int(os.environ.get("DB_MAX_OVERFLOW", 20)),
+            "pool_timeout": 30,
+            # Seconds the driver waits for a lock; the busy_timeout pragma covers the rest
+            "connect_args": {"timeout": SQLITE_PRAGMAS["busy_timeout"] / 1000},
+        }
+
+    if backend == "postgresql":
+        statement_timeout = int(os.environ.get("DB_STATEMENT_TIMEOUT_MS", 10_000))
+        return {
+            "pool_size": int(os.environ.get("DB_POOL_SIZE", 10)),
+            "max_overflow": int(os.environ.get("DB_MAX_OVERFLOW", 10)),
+            "pool_timeout": 30,
+            "pool_recycle": 1800,
+            "pool_pre_ping": True,
+            "connect_args": {"options": f"-c statement_timeout={statement_timeout}"},
+        }
+
+    return {}
+
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    for name, value in SQLITE_PRAGMAS.items():
+        cursor.execute(f"PRAGMA {name} = {value}")
+    cursor.close()
+
+def apply_engine_profile(engine):
+    """Install the per-connection setup of the active profile on ``engine``.
+
+    Must run before the engine hands out its first connection.
+    """
+    if engine.dialect.name == "sqlite":
+        event.listen(engine, "connect", set_sqlite_pragmas)
@@ -0,0 +1,127 @@
+import hashlib
+from datetime import date
+from sqlalchemy import or_, select
+from Models.model import db, Company, PlacementDrive, Application
+from Services.eligibility import Criteria
+from Services.fragment_cache import MemoryCache, table_versions
+
+# The "open drives for me" feed of the student dashboard. Which drives a
+# student sees depends on their department and graduation year, so the list
+# is built once per (department, graduation year) cohort and shared by every
+# student in it; only CGPA, blacklisting and the student's own applications
+# are applied per request. Entries are keyed by the placement_drive and
+# company table versions, which approve/reject/close/update (and the expiry
+# sweep) bump in the same transaction, plus today's date for the deadline.
+FEED_TABLES = ("placement_drive", "company")
+FEED_CACHE_SIZE = 512
+
+feed_cache = MemoryCache(FEED_CACHE_SIZE)
+
+class FeedDrive:
+    """One open drive as shown in the feed, with its parsed criteria."""
+
+    def __init__(self, row):
+        (self.drive_id, self.drive_name, self.job_title, self.company_name, self.job_location, self.job_type,
+         self.job_salary_range, self.job_no_of_positions, self.application_deadline,
+         min_cgpa, departments, years, exclude_blacklisted) = row
+        self.criteria = Criteria(self.drive_id, min_cgpa, departments, years, exclude_blacklisted)
+
+    def open_to_cohort(self, department, graduation_year):
+        criteria = self.criteria
+        return ((not criteria.departments or (department or "").strip().lower() in criteria.departments)
+                and (not criteria.years or graduation_year in criteria.years))
+
+    def open_to(self, student):
+        criteria = self.criteria
+        return ((criteria.min_cgpa is None or (student.student_cgpa or 0) >= criteria.min_cgpa)
+                and not (criteria.exclude_blacklisted and student.student_is_blacklisted))
+
+    def to_dict(self, application_status=None):
+        return {
+            "drive_id": self.drive_id,
+            "drive_name": self.drive_name,
+            "job_title": self.job_title,
+            "company_name": self.company_name,
+            "job_location": self.job_location,
+            "job_type": self.job_type,
+            "job_salary_range": self.job_salary_range,
+            "job_no_of_positions": self.job_no_of_positions,
+            "application_deadline": self.application_deadline.isoformat(),
+            "application_status": application_status,
+        }
+
+def feed_version(versions=None):
+    """The part of every feed key that changes when any feed can change."""
+    versions = table_versions() if versions is None else versions
+    return "|".join([*(f"{table}={versions.get(table, 0)}" for table in FEED_TABLES), date.today().isoformat()])
+
+def _open_drives(version):
+    key = f"open|{version}"
+    drives = feed_cache.get(key)
+    if drives is None:
+        rows = db.session.execute(
+            select(
+                PlacementDrive.drive_id,
+                PlacementDrive.drive_name,
+                PlacementDrive.job_title,
+                Company.company_name,
+                PlacementDrive.job_location,
+                PlacementDrive.job_type,
+                PlacementDrive.job_salary_range,
+                PlacementDrive.job_no_of_positions,
+                PlacementDrive.application_deadline,
+                PlacementDrive.min_cgpa,
+                PlacementDrive.allowed_departments,
+                PlacementDrive.allowed_graduation_years,
+                PlacementDrive.exclude_blacklisted,
+            )
+            .join(Company, Company.company_id == PlacementDrive.company_id)
+            .where(
+                PlacementDrive.drive_status == "open",
+                PlacementDrive.drive_is_approved == True,
+                PlacementDrive.application_deadline >= date.today(),
+                or_(Company.company_is_blacklisted == False, Company.company_is_blacklisted.is_(None)),
+            )
+            .order_by(PlacementDrive.application_deadline, PlacementDrive.drive_id)
+        ).all()
+        drives = tuple(FeedDrive(row) for row in rows)
+        feed_cache.set(key, drives)
+    return drives
+
+def cohort_feed(department, graduation_year, version=None):
+    """Open drives the (department, graduation year) cohort may apply to, soonest deadline first."""
+    version = version or feed_version()
+    key = f"cohort|{version}|{(department or '').strip().lower()}|{graduation_year}"
+    drives = feed_cache.get(key)
+    if drives is None:
+        drives = tuple(drive for drive in _open_drives(version) if drive.open_to_cohort(department, graduation_year))
+        feed_cache.set(key, drives)
+    return drives
+
+def application_statuses(student_id):
+    """{drive_id: application_status} of the student, read from the (student_id, status) index."""
+    return dict(db.session.execute(
+        select(Application.job_id, Application.application_status).where(Application.student_id == student_id)
+    ).all())
+
+def feed_etag(student, version, statuses):
+    """Changes whenever the student's feed would render differently."""
+    parts = [
+        version,
+        student.student_department,
+        student.student_graduation_year,
+        student.student_cgpa,
+        student.student_is_blacklisted,
+        *(f"{drive_id}:{status}" for drive_id, status in sorted(statuses.items())),
+    ]
+    return hashlib.sha1("|".join(map(str, parts)).encode()).hexdigest()
+
+def student_feed(student, version=None, statuses=None):
+    """The student's feed as dicts, with their own application status for each drive."""
+    version = version or feed_version()
+    statuses = application_statuses(student.student_id) if statuses is None else statuses
+    return [
+        drive.to_dict(statuses.get(drive.drive_id))
+        for drive in cohort_feed(student.student_department, student.student_graduation_year, version)
+        if drive.open_to(student)
+    ]
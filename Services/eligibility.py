@@ -0,0 +1,349 @@
+import threading
+from sqlalchemy import delete, event, func, insert, select, update
+from sqlalchemy.orm import attributes
+from Models.model import db, Student, PlacementDrive, DriveEligibility
+
+try:
+    import numpy as np
+except ImportError:  # optional, the pure Python matcher gives the same results, slower
+    np = None
+
+# drive_eligibility holds the (drive, student) pairs that meet the structured
+# criteria of the pending and open drives; closing or rejecting a drive drops
+# its pairs, so the table stays as large as the live drives times the
+# students. A student change is matched against the live drives in the
+# flush that makes it. A new drive, a criteria change or a reopened drive is
+# matched against every student, so the flush only marks the drive
+# eligibility_stale and EligibilityWorker does the work after the request.
+# Such a drive is pending until an admin approves it, and approving claims
+# and refreshes any drive the worker has not reached yet. Whether a drive
+# takes applications (open, approved, before its deadline) is still checked
+# by the queries that read the table. `flask rebuild-eligibility` recomputes
+# everything.
+STUDENT_ATTRIBUTES = ("student_cgpa", "student_department", "student_graduation_year", "student_is_blacklisted")
+DRIVE_ATTRIBUTES = ("min_cgpa", "allowed_departments", "allowed_graduation_years", "exclude_blacklisted")
+LIVE_DRIVE_STATUSES = ("pending", "open")
+INSERT_BATCH_SIZE = 50_000
+REFRESH_BATCH_SIZE = 20
+POLL_INTERVAL = 60
+
+eligibility_table = DriveEligibility.__table__
+
+def parse_departments(text):
+    return {part.strip().lower() for part in (text or "").split(",") if part.strip()}
+
+def parse_years(text):
+    return {int(part) for part in (text or "").split(",") if part.strip().isdigit()}
+
+class Criteria:
+    def __init__(self, drive_id, min_cgpa, departments, years, exclude_blacklisted):
+        self.drive_id = drive_id
+        self.min_cgpa = min_cgpa
+        self.departments = parse_departments(departments)
+        self.years = parse_years(years)
+        self.exclude_blacklisted = exclude_blacklisted is not False
+
+def _load_criteria(connection, drive_ids=None):
+    query = select(
+        PlacementDrive.drive_id,
+        PlacementDrive.min_cgpa,
+        PlacementDrive.allowed_departments,
+        PlacementDrive.allowed_graduation_years,
+        PlacementDrive.exclude_blacklisted,
+    ).where(PlacementDrive.drive_status.in_(LIVE_DRIVE_STATUSES))
+    if drive_ids is not None:
+        query = query.where(PlacementDrive.drive_id.in_(drive_ids))
+    return [Criteria(*row) for row in connection.execute(query)]
+
+#Columnar student attributes
+class StudentColumns:
+    """The matched student attributes as one array per column.
+
+    Departments are stored as integer codes, so every criterion becomes a
+    vectorized comparison over all students at once.
+    """
+
+    def __init__(self, rows):
+        self.department_codes = {}
+        ids, cgpas, departments, years, blacklisted = [], [], [], [], []
+        for student_id, cgpa, department, year, is_blacklisted in rows:
+            ids.append(student_id)
+            cgpas.append(cgpa)
+            departments.append(self.department_codes.setdefault((department or "").strip().lower(), len(self.department_codes)))
+            years.append(year)
+            blacklisted.append(bool(is_blacklisted))
+
+        if np is not None:
+            self.ids = np.array(ids, dtype=np.int64)
+            self.cgpas = np.array(cgpas, dtype=np.float64)
+            self.departments = np.array(departments, dtype=np.int32)
+            self.years = np.array(years, dtype=np.int32)
+            self.blacklisted = np.array(blacklisted, dtype=bool)
+        else:
+            self.ids, self.cgpas, self.departments, self.years, self.blacklisted = ids, cgpas, departments, years, blacklisted
+
+    @classmethod
+    def load(cls, connection, student_ids=None):
+        query = select(
+            Student.student_id,
+            Student.student_cgpa,
+            Student.student_department,
+            Student.student_graduation_year,
+            Student.student_is_blacklisted,
+        )
+        if student_ids is not None:
+            query = query.where(Student.student_id.in_(student_ids))
+        return cls(connection.execute(query))
+
+    def eligible_ids(self, criteria):
+        """Ids of the students meeting ``criteria``."""
+        codes = [code for name, code in self.department_codes.items() if name in criteria.departments]
+
+        if np is None:
+            codes = set(codes)
+            return [
+                student_id
+                for student_id, cgpa, department, year, blacklisted
+                in zip(self.ids, self.cgpas, self.departments, self.years, self.blacklisted)
+                if (criteria.min_cgpa is None or cgpa >= criteria.min_cgpa)
+                and (not criteria.departments or department in codes)
+                and (not criteria.years or year in criteria.years)
+                and not (criteria.exclude_blacklisted and blacklisted)
+            ]
+
+        mask = np.ones(len(self.ids), dtype=bool)
+        if criteria.min_cgpa is not None:
+            mask &= self.cgpas >= criteria.min_cgpa
+        if criteria.departments:
+            mask &= np.isin(self.departments, codes)
+        if criteria.years:
+            mask &= np.isin(self.years, list(criteria.years))
+        if criteria.exclude_blacklisted:
+            mask &= ~self.blacklisted
+        return self.ids[mask].tolist()
+
+#Refresh
+def _insert_pairs(connection, pairs):
+    batch = []
+    for drive_id, student_id in pairs:
+        batch.append({"drive_id": drive_id, "student_id": student_id})
+        if len(batch) >= INSERT_BATCH_SIZE:
+            connection.execute(insert(eligibility_table), batch)
+            batch = []
+    if batch:
+        connection.execute(insert(eligibility_table), batch)
+
+def refresh_drives(connection, drive_ids=None, students=None):
+    """Recompute the eligible students of ``drive_ids`` (default: every drive).
+
+    Drives that are no longer pending or open are left without pairs.
+    """
+    if drive_ids is None:
+        connection.execute(delete(eligibility_table))
+    else:
+        drive_ids = list(drive_ids)
+        if not drive_ids:
+            return 0
+        connection.execute(delete(eligibility_table).where(eligibility_table.c.drive_id.in_(drive_ids)))
+
+    drives = _load_criteria(connection, drive_ids)
+    if not drives:
+        return 0
+
+    students = students or StudentColumns.load(connection)
+    count = 0
+
+    def pairs():
+        nonlocal count
+        for criteria in drives:
+            for student_id in students.eligible_ids(criteria):
+                count += 1
+                yield criteria.drive_id, student_id
+
+    _insert_pairs(connection, pairs())
+    return count
+
+def prune_drives(connection, drive_ids):
+    """Drop the pairs of drives that closed or were rejected."""
+    drive_ids = list(drive_ids)
+    if drive_ids:
+        connection.execute(delete(eligibility_table).where(eligibility_table.c.drive_id.in_(drive_ids)))
+
+def refresh_stale_drives(connection, drive_ids=None, limit=None):
+    """Claim drives marked eligibility_stale (only those in ``drive_ids``, if given) and refresh them.
+
+    Returns the ids refreshed.
+    """
+    claim = select(PlacementDrive.drive_id).where(PlacementDrive.eligibility_stale == True)
+    if drive_ids is not None:
+        drive_ids = list(drive_ids)
+        if not drive_ids:
+            return []
+        claim = claim.where(PlacementDrive.drive_id.in_(drive_ids))
+    if limit is not None:
+        claim = claim.order_by(PlacementDrive.drive_id).limit(limit)
+
+    claimed = connection.execute(
+        update(PlacementDrive.__table__)
+        .where(PlacementDrive.drive_id.in_(claim))
+        .values(eligibility_stale=False)
+        .returning(PlacementDrive.drive_id)
+    ).scalars().all()
+    refresh_drives(connection, claimed)
+    return claimed
+
+def refresh_students(connection, student_ids):
+    """Recompute the eligible drives of ``student_ids``."""
+    student_ids = list(student_ids)
+    if not student_ids:
+        return 0
+
+    connection.execute(delete(eligibility_table).where(eligibility_table.c.student_id.in_(student_ids)))
+    students = StudentColumns.load(connection, student_ids)
+
+    pairs = [
+        (criteria.drive_id, student_id)
+        for criteria in _load_criteria(connection)
+        for student_id in students.eligible_ids(criteria)
+    ]
+    _insert_pairs(connection, pairs)
+    return len(pairs)
+
+def rebuild_eligibility():
+    """Recompute every (drive, student) pair. Returns the number of eligible pairs."""
+    connection = db.session.connection()
+    connection.execute(
+        update(PlacementDrive.__table__).where(PlacementDrive.eligibility_stale == True).values(eligibility_stale=False)
+    )
+    count = refresh_drives(connection)
+    db.session.commit()
+    return count
+
+def _changed(obj, names):
+    return any(attributes.get_history(obj, name).has_changes() for name in names)
+
+def _reopened(drive):
+    """Whether a flush moves ``drive`` from closed or rejected back to pending or open."""
+    history = attributes.get_history(drive, "drive_status")
+    return (
+        bool(history.deleted) and history.deleted[0] not in LIVE_DRIVE_STATUSES
+        and drive.drive_status in LIVE_DRIVE_STATUSES
+    )
+
+@event.listens_for(db.session, "after_flush")
+def update_eligibility(session, flush_context):
+    student_ids, stale_drive_ids, finished_drive_ids = set(), set(), set()
+
+    for obj in session.new:
+        if isinstance(obj, Student):
+            student_ids.add(obj.student_id)
+        elif isinstance(obj, PlacementDrive) and obj.drive_status in LIVE_DRIVE_STATUSES:
+            stale_drive_ids.add(obj.drive_id)
+
+    for obj in session.dirty:
+        if isinstance(obj, Student) and _changed(obj, STUDENT_ATTRIBUTES):
+            student_ids.add(obj.student_id)
+        elif isinstance(obj, PlacementDrive):
+            if obj.drive_status not in LIVE_DRIVE_STATUSES:
+                if _changed(obj, ("drive_status",)):
+                    finished_drive_ids.add(obj.drive_id)
+            elif _changed(obj, DRIVE_ATTRIBUTES) or _reopened(obj):
+                stale_drive_ids.add(obj.drive_id)
+
+    connection = session.connection()
+    for obj in session.deleted:
+        if isinstance(obj, Student):
+            connection.execute(delete(eligibility_table).where(eligibility_table.c.student_id == obj.student_id))
+        elif isinstance(obj, PlacementDrive):
+            connection.execute(delete(eligibility_table).where(eligibility_table.c.drive_id == obj.drive_id))
+
+    prune_drives(connection, finished_drive_ids)
+    if stale_drive_ids and eligibility_worker.enabled:
+        connection.execute(
+            update(PlacementDrive.__table__)
+            .where(PlacementDrive.drive_id.in_(stale_drive_ids))
+            .values(eligibility_stale=True)
+        )
+        session.info["eligibility_stale"] = True
+    else:
+        refresh_drives(connection, stale_drive_ids)
+    refresh_students(connection, student_ids)
+
+@event.listens_for(db.session, "after_commit")
+def wake_eligibility_worker(session):
+    if session.info.pop("eligibility_stale", False):
+        eligibility_worker.notify()
+
+@event.listens_for(db.session, "after_rollback")
+def forget_stale_drives(session):
+    session.info.pop("eligibility_stale", None)
+
+class EligibilityWorker:
+    """Refreshes the drives marked eligibility_stale after the request that changed them.
+
+    A daemon thread, started by the first commit that marks a drive, claims
+    stale drives a few at a time and recomputes their pairs, each batch in
+    its own transaction. It also wakes every POLL_INTERVAL seconds, so drives
+    left stale by another process are picked up too.
+    """
+
+    def __init__(self):
+        self.app = None
+        self.enabled = False
+        self._wake = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        """ELIGIBILITY_WORKER off refreshes drives in the flush that changes them."""
+        self.app = app
+        self.enabled = app.config.get("ELIGIBILITY_WORKER", True)
+
+    def notify(self):
+        self._start()
+        self._wake.set()
+
+    def _start(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="drive-eligibility", daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            self._wake.wait(POLL_INTERVAL)
+            self._wake.clear()
+            with self.app.app_context():
+                try:
+                    run_stale_refreshes()
+                except Exception:
+                    db.session.rollback()
+                    self.app.logger.exception("Eligibility refresh failed")
+
+def run_stale_refreshes():
+    """Refresh every stale drive, REFRESH_BATCH_SIZE per transaction. Returns the number refreshed."""
+    count = 0
+    while True:
+        claimed = refresh_stale_drives(db.session.connection(), limit=REFRESH_BATCH_SIZE)
+        db.session.commit()
+        if not claimed:
+            return count
+        count += len(claimed)
+
+eligibility_worker = EligibilityWorker()
+
+#Reading
+def eligible_student_count(drive_ids):
+    """{drive_id: number of eligible students} from one GROUP BY."""
+    if not drive_ids:
+        return {}
+    return dict(db.session.execute(
+        select(eligibility_table.c.drive_id, func.count())
+        .where(eligibility_table.c.drive_id.in_(drive_ids))
+        .group_by(eligibility_table.c.drive_id)
+    ).all())
+
+def eligible_drive_ids(student_id):
+    return set(db.session.execute(
+        select(eligibility_table.c.drive_id).where(eligibility_table.c.student_id == student_id)
+    ).scalars())
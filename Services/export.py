@@ -0,0 +1,163 @@
+import csv
+from datetime import datetime
+from sqlalchemy import exists, select
+from Models.model import db, Student, Company, PlacementDrive, Application
+
+CHUNK_SIZE = 1000
+
+class _Line:
+    """File-like target that hands back what csv.writer wrote."""
+    def write(self, value):
+        return value
+
+def _year_range(column, year):
+    return column >= datetime(year, 1, 1), column < datetime(year + 1, 1, 1)
+
+#Exports: (columns, key column, filter function)
+def _application_filters(statement, drive_id, company_id, status, year):
+    if drive_id is not None:
+        statement = statement.where(Application.job_id == drive_id)
+    if company_id is not None:
+        statement = statement.where(PlacementDrive.company_id == company_id)
+    if status:
+        statement = statement.where(Application.application_status == status)
+    if year is not None:
+        statement = statement.where(Student.student_graduation_year == year)
+    return statement
+
+def _applications():
+    return select(
+        Application.application_id,
+        Application.application_date,
+        Application.application_status,
+        Student.student_id,
+        Student.student_name,
+        Student.student_email,
+        Student.student_department,
+        Student.student_cgpa,
+        Student.student_graduation_year,
+        PlacementDrive.drive_id,
+        PlacementDrive.drive_name,
+        PlacementDrive.job_title,
+        Company.company_id,
+        Company.company_name,
+    ).join(
+        Student, Student.student_id == Application.student_id
+    ).join(
+        PlacementDrive, PlacementDrive.drive_id == Application.job_id
+    ).join(
+        Company, Company.company_id == PlacementDrive.company_id
+    )
+
+def _student_filters(statement, drive_id, company_id, status, year):
+    if drive_id is not None or company_id is not None or status:
+        # Students who applied to the drive/company, optionally with that status
+        applied = exists().where(Application.student_id == Student.student_id)
+        if drive_id is not None:
+            applied = applied.where(Application.job_id == drive_id)
+        if company_id is not None:
+            applied = applied.where(
+                Application.job_id == PlacementDrive.drive_id,
+                PlacementDrive.company_id == company_id
+            )
+        if status:
+            applied = applied.where(Application.application_status == status)
+        statement = statement.where(applied)
+    if year is not None:
+        statement = statement.where(Student.student_graduation_year == year)
+    return statement
+
+def _students():
+    return select(
+        Student.student_id,
+        Student.student_name,
+        Student.student_email,
+        Student.student_phone,
+        Student.student_department,
+        Student.student_cgpa,
+        Student.student_joining_year,
+        Student.student_graduation_year,
+        Student.student_is_active,
+        Student.student_is_blacklisted,
+        Student.created_at,
+    )
+
+def _drive_filters(statement, drive_id, company_id, status, year):
+    if drive_id is not None:
+        statement = statement.where(PlacementDrive.drive_id == drive_id)
+    if company_id is not None:
+        statement = statement.where(PlacementDrive.company_id == company_id)
+    if status:
+        statement = statement.where(PlacementDrive.drive_status == status)
+    if year is not None:
+        statement = statement.where(*_year_range(PlacementDrive.drive_date_posted, year))
+    return statement
+
+def _drives():
+    return select(
+        PlacementDrive.drive_id,
+        PlacementDrive.drive_name,
+        PlacementDrive.job_title,
+        PlacementDrive.job_location,
+        PlacementDrive.job_type,
+        PlacementDrive.job_salary_range,
+        PlacementDrive.salary_min,
+        PlacementDrive.salary_max,
+        PlacementDrive.salary_currency,
+        PlacementDrive.salary_period,
+        PlacementDrive.job_no_of_positions,
+        PlacementDrive.application_deadline,
+        PlacementDrive.drive_date_posted,
+        PlacementDrive.drive_status,
+        Company.company_id,
+        Company.company_name,
+    ).join(Company, Company.company_id == PlacementDrive.company_id)
+
+EXPORTS = {
+    "applications": (_applications, Application.application_id, _application_filters),
+    "students": (_students, Student.student_id, _student_filters),
+    "drives": (_drives, PlacementDrive.drive_id, _drive_filters),
+}
+
+def export_statement(kind, drive_id=None, company_id=None, status=None, year=None):
+    columns, key_column, add_filters = EXPORTS[kind]
+    return add_filters(columns(), drive_id, company_id, status, year), key_column
+
+def export_rows(kind, chunk_size=CHUNK_SIZE, **filters):
+    """Yield the rows of an export, reading ``chunk_size`` rows per query.
+
+    Each chunk seeks past the last key of the previous one, so memory use and
+    the cost of every query stay the same however large the export is, and no
+    read transaction is held open between chunks.
+    """
+    statement, key_column = export_statement(kind, **filters)
+    last_key = None
+
+    while True:
+        chunk = statement.order_by(key_column).limit(chunk_size)
+        if last_key is not None:
+            chunk = chunk.where(key_column > last_key)
+
+        rows = db.session.execute(chunk).all()
+        db.session.commit()
+        if not rows:
+            return
+
+        yield from rows
+        last_key = getattr(rows[-1], key_column.key)
+
+def export_csv(kind, chunk_size=CHUNK_SIZE, **filters):
+    """Yield an export as CSV text, one chunk of rows at a time."""
+    writer = csv.writer(_Line())
+    statement, key_column = export_statement(kind, **filters)
+    yield writer.writerow([column.key for column in statement.selected_columns])
+
+    lines = []
+    for row in export_rows(kind, chunk_size, **filters):
+        lines.append(writer.writerow(row))
+        if len(lines) >= chunk_size:
+            yield "".join(lines)
+            lines = []
+
+    if lines:
+        yield "".join(lines)
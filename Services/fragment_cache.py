@@ -0,0 +1,188 @@
+import hashlib
+import os
+import tempfile
+import threading
+from collections import Counter, OrderedDict
+from itertools import chain
+from markupsafe import Markup
+from sqlalchemy import event, insert, select, update
+from Models.model import db, Student, Company, PlacementDrive, Application, DashboardCounter
+
+# Rendered dashboard sections are cached under a key that includes the
+# version of every table they show. Versions live in DashboardCounter as
+# "version:<table>" and are bumped in the same transaction as the change, so
+# every gunicorn worker sees a new key as soon as the change is committed and
+# stale entries are never read again (they just age out of the backend).
+VERSION_PREFIX = "version:"
+VERSIONED_TABLES = {model.__table__.name for model in (Student, Company, PlacementDrive, Application)}
+
+counter_table = DashboardCounter.__table__
+
+#Versions
+def bump_versions(connection, tables):
+    for table in sorted(set(tables) & VERSIONED_TABLES):
+        name = VERSION_PREFIX + table
+        result = connection.execute(
+            update(counter_table)
+            .where(counter_table.c.counter_name == name)
+            .values(counter_value=counter_table.c.counter_value + 1)
+        )
+        if result.rowcount == 0:
+            connection.execute(insert(counter_table).values(counter_name=name, counter_value=1))
+
+def table_versions():
+    rows = db.session.execute(
+        select(counter_table.c.counter_name, counter_table.c.counter_value)
+        .where(counter_table.c.counter_name.startswith(VERSION_PREFIX))
+    ).all()
+    return {name[len(VERSION_PREFIX):]: value for name, value in rows}
+
+@event.listens_for(db.session, "after_flush")
+def bump_flushed_versions(session, flush_context):
+    tables = {
+        obj.__table__.name
+        for obj in chain(session.new, session.dirty, session.deleted)
+        if obj in session.new or obj in session.deleted or session.is_modified(obj, include_collections=False)
+    }
+    if tables:
+        bump_versions(session.connection(), tables)
+
+@event.listens_for(db.session, "do_orm_execute")
+def bump_bulk_versions(orm_execute_state):
+    # Bulk INSERT/UPDATE/DELETE statements never reach after_flush
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        bump_versions(orm_execute_state.session.connection(), [orm_execute_state.statement.table.name])
+
+#Backends
+class MemoryCache:
+    """Per-process LRU cache holding at most ``max_entries`` fragments."""
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+class FileSystemCache:
+    """Fragments as files in ``directory``, shared by every process on the host.
+
+    When there are more than ``max_entries`` files, the least recently
+    written ones are removed.
+    """
+
+    def __init__(self, directory, max_entries=1024):
+        self.directory = directory
+        self.max_entries = max_entries
+        self._writes = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, hashlib.sha256(key.encode()).hexdigest() + ".html")
+
+    def get(self, key):
+        try:
+            with open(self._path(key), encoding="utf-8") as fragment:
+                return fragment.read()
+        except FileNotFoundError:
+            return None
+
+    def set(self, key, value):
+        handle, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".part")
+        with os.fdopen(handle, "w", encoding="utf-8") as fragment:
+            fragment.write(value)
+        os.replace(temp_path, self._path(key))
+
+        self._writes += 1
+        if self._writes % 64 == 0:
+            self._prune()
+
+    def _prune(self):
+        paths = [entry.path for entry in os.scandir(self.directory) if entry.name.endswith(".html")]
+        if len(paths) <= self.max_entries:
+            return
+        paths.sort(key=lambda path: os.stat(path).st_mtime if os.path.exists(path) else 0)
+        for path in paths[:len(paths) - self.max_entries]:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def clear(self):
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".html"):
+                os.remove(entry.path)
+
+#Cache
+class FragmentCache:
+    def __init__(self, backend=None):
+        self.backend = backend
+        self.hits = Counter()
+        self.misses = Counter()
+
+    def init_app(self, app):
+        """Pick the backend from FRAGMENT_CACHE: "memory", "filesystem" or "" (off)."""
+        kind = app.config.get("FRAGMENT_CACHE", "memory")
+        size = app.config.get("FRAGMENT_CACHE_SIZE", 256)
+
+        if kind == "memory":
+            self.backend = MemoryCache(size)
+        elif kind == "filesystem":
+            directory = app.config.get("FRAGMENT_CACHE_DIR") or os.path.join(app.instance_path, "fragment_cache")
+            self.backend = FileSystemCache(directory, size)
+        elif kind:
+            raise ValueError(f"Unknown FRAGMENT_CACHE backend: {kind}")
+        else:
+            self.backend = None
+
+    def render(self, name, tables, render, *key_parts, versions=None):
+        """Return the cached fragment ``name`` or call ``render`` and cache its result.
+
+        ``tables`` are the tables the fragment shows and ``key_parts`` anything
+        else it depends on (page cursor, current year, ...). Pass ``versions``
+        from table_versions() when rendering several fragments at once.
+        """
+        if self.backend is None:
+            return Markup(render())
+
+        if versions is None:
+            versions = table_versions()
+        key = "|".join([name, *(f"{table}={versions.get(table, 0)}" for table in tables), *map(str, key_parts)])
+
+        value = self.backend.get(key)
+        if value is not None:
+            self.hits[name] += 1
+            return Markup(value)
+
+        self.misses[name] += 1
+        value = str(render())
+        self.backend.set(key, value)
+        return Markup(value)
+
+    def stats(self):
+        """Hit/miss counts of this process, per fragment."""
+        return {
+            "backend": type(self.backend).__name__ if self.backend else None,
+            "fragments": {
+                name: {"hits": self.hits[name], "misses": self.misses[name]}
+                for name in sorted(set(self.hits) | set(self.misses))
+            },
+        }
+
+fragment_cache = FragmentCache()
@@ -0,0 +1,203 @@
+import queue
+import threading
+import time
+from collections import Counter, defaultdict
+from sqlalchemy import event, select
+from sqlalchemy.orm import attributes
+from Models.model import db, Company, PlacementDrive, Application
+from Services.change_bus import ChangeBus, listen, record_event
+from Services.counts import COUNTED_STATUSES
+from Services.statistics import dashboard_counters
+
+# Live admin and company dashboards over Server-Sent Events.
+#
+#   counters            deltas (or a snapshot) of the admin dashboard totals
+#   application         a new application, with its drive and company
+#   drive_approved      a drive opened for applications
+#   company_registered  a new company account waiting for approval
+#   applicants          per-drive changes to a company's applicant counts
+#
+# Changes made through the ORM are recorded by the flush hook below; the Core
+# write paths (group-commit queue, moderation, bulk status updates) call the
+# record_* helpers themselves. The bus is per process: with several gunicorn
+# workers a dashboard sees its own worker's changes at once and the others'
+# through the counters snapshot every worker publishes each
+# LIVE_SYNC_INTERVAL seconds while it has subscribers.
+DEFAULT_HEARTBEAT = 15
+DEFAULT_SYNC_INTERVAL = 30
+RETRY_MS = 5000
+
+ADMIN_EVENTS = {"counters", "application", "drive_approved", "company_registered"}
+COMPANY_EVENTS = {"applicants", "drive_approved"}
+
+change_bus = ChangeBus()
+
+#Recording
+def drive_details(connection, drive_ids):
+    """{drive_id: (company_id, drive_name, company_name)} from one joined SELECT."""
+    if not drive_ids:
+        return {}
+    return {
+        drive_id: (company_id, drive_name, company_name)
+        for drive_id, company_id, drive_name, company_name in connection.execute(
+            select(PlacementDrive.drive_id, PlacementDrive.company_id, PlacementDrive.drive_name, Company.company_name)
+            .join(Company, Company.company_id == PlacementDrive.company_id)
+            .where(PlacementDrive.drive_id.in_(set(drive_ids)))
+        )
+    }
+
+def record_applicants(connection, deltas, details=None):
+    """One "applicants" event per drive for ``deltas`` {drive_id: Counter of count changes}."""
+    details = details or drive_details(connection, deltas)
+    for drive_id, changes in deltas.items():
+        changes = {name: delta for name, delta in changes.items() if delta}
+        if changes and drive_id in details:
+            record_event(connection, "applicants", company_id=details[drive_id][0], drive_id=drive_id, deltas=changes)
+
+def record_applications(connection, applications):
+    """Events for new ``applications``, (application_id, student_id, drive_id, status) tuples."""
+    details = drive_details(connection, [drive_id for _, _, drive_id, _ in applications])
+    deltas = defaultdict(Counter)
+
+    for application_id, student_id, drive_id, status in applications:
+        if drive_id not in details:
+            continue
+        company_id, drive_name, company_name = details[drive_id]
+        record_event(
+            connection, "application", application_id=application_id, student_id=student_id, drive_id=drive_id,
+            drive_name=drive_name, company_id=company_id, company_name=company_name,
+        )
+        deltas[drive_id]["total"] += 1
+        if status in COUNTED_STATUSES:
+            deltas[drive_id][status] += 1
+
+    record_applicants(connection, deltas, details)
+
+def record_status_changes(connection, changes):
+    """Applicant count events for ``changes``, (drive_id, old status, new status) tuples."""
+    deltas = defaultdict(Counter)
+    for drive_id, old_status, new_status in changes:
+        if old_status in COUNTED_STATUSES:
+            deltas[drive_id][old_status] -= 1
+        if new_status in COUNTED_STATUSES:
+            deltas[drive_id][new_status] += 1
+    record_applicants(connection, deltas)
+
+def record_drive_approvals(connection, drive_ids):
+    for drive_id, (company_id, drive_name, company_name) in drive_details(connection, drive_ids).items():
+        record_event(
+            connection, "drive_approved", drive_id=drive_id, drive_name=drive_name,
+            company_id=company_id, company_name=company_name,
+        )
+
+def _changed(obj, name):
+    """(old value, new value) of an attribute changed in the current flush, or None."""
+    history = attributes.get_history(obj, name)
+    if not history.added:
+        return None
+    return (history.deleted[0] if history.deleted else None), history.added[0]
+
+@event.listens_for(db.session, "after_flush")
+def record_flushed_changes(session, flush_context):
+    connection = session.connection()
+    applications, status_changes, approved_drives = [], [], []
+
+    for obj in session.new:
+        if isinstance(obj, Application):
+            applications.append((obj.application_id, obj.student_id, obj.job_id, obj.application_status))
+        elif isinstance(obj, Company):
+            record_event(connection, "company_registered", company_id=obj.company_id, company_name=obj.company_name)
+        elif isinstance(obj, PlacementDrive) and obj.drive_is_approved:
+            approved_drives.append(obj.drive_id)
+
+    for obj in session.dirty:
+        if isinstance(obj, Application):
+            change = _changed(obj, "application_status")
+            if change and change[0] != change[1]:
+                status_changes.append((obj.job_id, *change))
+        elif isinstance(obj, PlacementDrive):
+            change = _changed(obj, "drive_is_approved")
+            if change and change[1] and not change[0]:
+                approved_drives.append(obj.drive_id)
+
+    if applications:
+        record_applications(connection, applications)
+    if status_changes:
+        record_status_changes(connection, status_changes)
+    if approved_drives:
+        record_drive_approvals(connection, approved_drives)
+
+#Streaming
+class LiveUpdates:
+    """SSE streams over ``change_bus`` and the counters resync of this process.
+
+    The resync thread starts with the first subscriber, so workers nobody
+    watches never query for it.
+    """
+
+    def __init__(self, bus):
+        self.bus = bus
+        self.app = None
+        self.heartbeat = DEFAULT_HEARTBEAT
+        self.sync_interval = DEFAULT_SYNC_INTERVAL
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        """Hook the bus to the app's engine; call inside an app context."""
+        self.app = app
+        self.heartbeat = app.config.get("LIVE_HEARTBEAT", DEFAULT_HEARTBEAT)
+        self.sync_interval = app.config.get("LIVE_SYNC_INTERVAL", DEFAULT_SYNC_INTERVAL)
+        listen(db.engine, self.bus)
+
+    def subscribe(self, kinds, company_id=None, last_event_id=None):
+        """Subscribe to ``kinds`` of events (only ``company_id``'s when given)."""
+        self._start()
+        if self.bus.counters is None:
+            # Only the first subscriber of the process pays for the snapshot
+            self.bus.sync_counters(dashboard_counters())
+
+        def accepts(change):
+            return change["type"] in kinds and (company_id is None or change.get("company_id") == company_id)
+
+        return self.bus.subscribe(accepts, last_event_id)
+
+    def stream(self, subscription):
+        """SSE messages for ``subscription`` until the client goes away."""
+        try:
+            yield f"retry: {RETRY_MS}\n\n"
+            while True:
+                if subscription.lagging:
+                    # Dropped messages are not replayed: start over from the counters
+                    subscription.lagging = False
+                    while not subscription.messages.empty():
+                        subscription.messages.get_nowait()
+                    yield self.bus.resync_message()
+
+                try:
+                    yield subscription.messages.get(timeout=self.heartbeat)
+                except queue.Empty:
+                    # Keeps proxies from closing the connection and notices gone clients
+                    yield ": keepalive\n\n"
+        finally:
+            self.bus.unsubscribe(subscription)
+
+    def _start(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="live-updates-sync", daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            time.sleep(self.sync_interval)
+            if not self.bus.subscriber_count():
+                continue
+            with self.app.app_context():
+                try:
+                    self.bus.sync_counters(dashboard_counters())
+                except Exception:
+                    db.session.rollback()
+                    self.app.logger.exception("Live counters resync failed")
+
+live_updates = LiveUpdates(change_bus)
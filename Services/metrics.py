@@ -0,0 +1,143 @@
+import bisect
+import threading
+import time
+from flask import g, has_request_context, request
+from flask.signals import before_render_template, template_rendered
+from sqlalchemy import event
+
+# Request latency buckets in seconds, as in the Prometheus client defaults
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+class EndpointStats:
+    def __init__(self):
+        self.bucket_counts = [0] * (len(BUCKETS) + 1)  # the last one is +Inf
+        self.count = 0
+        self.seconds = 0.0
+        self.queries = 0
+        self.sql_seconds = 0.0
+        self.render_seconds = 0.0
+
+class RequestMetrics:
+    """Per-endpoint latency histograms and SQL totals of this process.
+
+    Every gunicorn worker keeps its own numbers; Prometheus adds them up when
+    each worker is scraped (or use a single worker for /admin/metrics).
+    """
+
+    def __init__(self):
+        self.endpoints = {}
+        self._lock = threading.Lock()
+
+    def observe(self, endpoint, seconds, queries, sql_seconds, render_seconds):
+        with self._lock:
+            stats = self.endpoints.get(endpoint)
+            if stats is None:
+                stats = self.endpoints[endpoint] = EndpointStats()
+            stats.bucket_counts[bisect.bisect_left(BUCKETS, seconds)] += 1
+            stats.count += 1
+            stats.seconds += seconds
+            stats.queries += queries
+            stats.sql_seconds += sql_seconds
+            stats.render_seconds += render_seconds
+
+    def prometheus(self, extra_lines=()):
+        """All metrics in the Prometheus text exposition format."""
+        lines = [
+            "# HELP portal_request_duration_seconds Request latency per endpoint.",
+            "# TYPE portal_request_duration_seconds histogram",
+        ]
+        with self._lock:
+            endpoints = sorted(self.endpoints.items())
+
+            for endpoint, stats in endpoints:
+                cumulative = 0
+                for bound, count in zip(BUCKETS + ("+Inf",), stats.bucket_counts):
+                    cumulative += count
+                    lines.append(f'portal_request_duration_seconds_bucket{{endpoint="{endpoint}",le="{bound}"}} {cumulative}')
+                lines.append(f'portal_request_duration_seconds_sum{{endpoint="{endpoint}"}} {stats.seconds:.6f}')
+                lines.append(f'portal_request_duration_seconds_count{{endpoint="{endpoint}"}} {stats.count}')
+
+            for name, kind, help_text, attribute in (
+                ("portal_request_queries_total", "counter", "SQL statements issued per endpoint.", "queries"),
+                ("portal_request_sql_seconds_total", "counter", "Time spent in SQL per endpoint.", "sql_seconds"),
+                ("portal_request_render_seconds_total", "counter", "Time spent rendering templates per endpoint.", "render_seconds"),
+            ):
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} {kind}")
+                for endpoint, stats in endpoints:
+                    lines.append(f'{name}{{endpoint="{endpoint}"}} {getattr(stats, attribute)}')
+
+        lines.extend(extra_lines)
+        return "\n".join(lines) + "\n"
+
+request_metrics = RequestMetrics()
+
+#Hooks
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if has_request_context() and "request_started" in g:
+        g.statement_started = time.perf_counter()
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if has_request_context() and "statement_started" in g:
+        elapsed = time.perf_counter() - g.pop("statement_started")
+        g.query_count += 1
+        g.sql_seconds += elapsed
+        if elapsed > g.slowest_statement[0]:
+            g.slowest_statement = (elapsed, statement)
+
+def _before_render(sender, template, context, **extra):
+    if "request_started" in g:
+        g.render_depth += 1
+        if g.render_depth == 1:
+            g.render_started = time.perf_counter()
+
+def _after_render(sender, template, context, **extra):
+    if "request_started" in g:
+        g.render_depth -= 1
+        if g.render_depth == 0:
+            g.render_seconds += time.perf_counter() - g.render_started
+
+def init_request_metrics(app, engine):
+    """Record query count, SQL time, slowest statement and render time per request.
+
+    Nothing is hooked unless METRICS_ENABLED is set, so a disabled install
+    pays no overhead at all. Requests slower than SLOW_REQUEST_MS are logged.
+    """
+    if not app.config.get("METRICS_ENABLED"):
+        return False
+
+    slow_request_seconds = app.config.get("SLOW_REQUEST_MS", 500) / 1000
+
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    before_render_template.connect(_before_render, app)
+    template_rendered.connect(_after_render, app)
+
+    @app.before_request
+    def start_request_timer():
+        g.request_started = time.perf_counter()
+        g.query_count = 0
+        g.sql_seconds = 0.0
+        g.slowest_statement = (0.0, None)
+        g.render_depth = 0
+        g.render_seconds = 0.0
+
+    @app.teardown_request
+    def record_request(error=None):
+        if "request_started" not in g:
+            return
+        elapsed = time.perf_counter() - g.pop("request_started")
+        endpoint = request.endpoint or "unmatched"
+
+        request_metrics.observe(endpoint, elapsed, g.query_count, g.sql_seconds, g.render_seconds)
+
+        if elapsed >= slow_request_seconds:
+            slowest_seconds, slowest = g.slowest_statement
+            app.logger.warning(
+                "Slow request %s %s (%s): %.0f ms, %d queries in %.0f ms, render %.0f ms, slowest query %.0f ms: %s",
+                request.method, request.path, endpoint, elapsed * 1000, g.query_count,
+                g.sql_seconds * 1000, g.render_seconds * 1000, slowest_seconds * 1000,
+                " ".join((slowest or "").split())[:500]
+            )
+
+    return True
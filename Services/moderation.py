@@ -0,0 +1,152 @@
+from collections import defaultdict
+from sqlalchemy import select, update
+from Models.model import db, Student, Company, PlacementDrive
+from Services.eligibility import LIVE_DRIVE_STATUSES, prune_drives, refresh_stale_drives, refresh_students
+from Services.live_updates import record_drive_approvals
+from Services.statistics import StatisticsChanges
+
+# Admin moderation of companies, drives and students, one id or hundreds at
+# a time. The current state of every id is read with one SELECT, each
+# transition is checked against it, and the changes are applied as one
+# UPDATE per distinct set of new values, all in a single transaction.
+#
+# An action maps the current row to either the new column values or the
+# name of the rule that forbids the transition. Results per id are
+# "updated", "unchanged" (already in the target state), "not_found" or that
+# rule name.
+
+def _set(**values):
+    return lambda row: values
+
+def _unless(rule, check, **values):
+    return lambda row: rule if check(row) else values
+
+def _drive_approve(row):
+    if row.drive_is_rejected:
+        return "rejected"
+    values = {"drive_is_approved": True, "drive_is_rejected": False, "drive_status": "open"}
+    # Reopening a closed drive, its pairs were dropped when it closed
+    if row.drive_status not in LIVE_DRIVE_STATUSES:
+        values["eligibility_stale"] = True
+    return values
+
+def _drive_close(row):
+    if not row.drive_is_approved:
+        return "not_approved"
+    return {"drive_status": "closed"}
+
+class Target:
+    def __init__(self, model, key, columns, actions):
+        self.model = model
+        self.key = key
+        self.columns = columns
+        self.actions = actions
+
+TARGETS = {
+    "company": Target(
+        Company,
+        Company.company_id,
+        (Company.company_is_approved, Company.company_is_rejected, Company.company_is_blacklisted,
+         Company.approval_status),
+        {
+            "approve": _unless("blacklisted", lambda row: row.company_is_blacklisted,
+                               company_is_approved=True, approval_status="approved", company_is_rejected=False),
+            "reject": _unless("blacklisted", lambda row: row.company_is_blacklisted,
+                              company_is_rejected=True, approval_status="rejected", company_is_approved=False),
+            "blacklist": _set(company_is_blacklisted=True, approval_status="blacklisted", company_is_approved=False),
+            "unblacklist": _set(company_is_blacklisted=False, approval_status="approved", company_is_approved=True),
+            "toggle_blacklist": lambda row: {"company_is_blacklisted": not row.company_is_blacklisted},
+        },
+    ),
+    "drive": Target(
+        PlacementDrive,
+        PlacementDrive.drive_id,
+        (PlacementDrive.drive_is_approved, PlacementDrive.drive_is_rejected, PlacementDrive.drive_status,
+         PlacementDrive.application_deadline, PlacementDrive.eligibility_stale),
+        {
+            "approve": _drive_approve,
+            "reject": _set(drive_is_rejected=True, drive_is_approved=False, drive_status="rejected"),
+            "close": _drive_close,
+        },
+    ),
+    "student": Target(
+        Student,
+        Student.student_id,
+        (Student.student_is_blacklisted,),
+        {
+            "blacklist": _set(student_is_blacklisted=True),
+            "unblacklist": _set(student_is_blacklisted=False),
+            "toggle_blacklist": lambda row: {"student_is_blacklisted": not row.student_is_blacklisted},
+        },
+    ),
+}
+
+def _track(changes, target, row, values):
+    """What the change does to the rollups the flush hooks would have updated."""
+    if target.model is Company and "company_is_approved" in values:
+        if bool(row.company_is_approved) != values["company_is_approved"]:
+            changes.counters["total_companies"] += 1 if values["company_is_approved"] else -1
+
+    elif target.model is PlacementDrive and "drive_is_approved" in values:
+        if bool(row.drive_is_approved) != values["drive_is_approved"] and row.application_deadline:
+            changes.participation_years.add(row.application_deadline.year)
+
+def moderate(kind, action, ids):
+    """Apply ``action`` to the ``kind`` ("company", "drive", "student") rows in ``ids``.
+
+    Returns {id: result}. Raises KeyError for an unknown kind or action.
+    """
+    target = TARGETS[kind]
+    transition = target.actions[action]
+
+    ids = set(ids)
+    if not ids:
+        return {}
+
+    rows = db.session.execute(select(target.key, *target.columns).where(target.key.in_(ids))).all()
+
+    results = {id_: "not_found" for id_ in ids}
+    groups = defaultdict(list)
+    changes = StatisticsChanges()
+
+    for row in rows:
+        row_id = row[0]
+        values = transition(row)
+        if isinstance(values, str):
+            results[row_id] = values
+            continue
+        if all(getattr(row, name) == value for name, value in values.items()):
+            results[row_id] = "unchanged"
+            continue
+
+        results[row_id] = "updated"
+        groups[tuple(sorted(values.items()))].append(row_id)
+        _track(changes, target, row, values)
+
+    if not groups:
+        return results
+
+    for values, group_ids in groups.items():
+        db.session.execute(
+            update(target.model)
+            .where(target.key.in_(group_ids))
+            .values(dict(values))
+            .execution_options(synchronize_session="fetch")
+        )
+
+    # The bulk UPDATEs skip the flush hooks that keep these up to date
+    connection = db.session.connection()
+    changes.apply(connection)
+    updated = [row_id for group_ids in groups.values() for row_id in group_ids]
+    # Approved drives must have their pairs before students see them, the
+    # background refresh has usually done it while the drive was pending
+    if target.model is PlacementDrive and action == "approve":
+        refresh_stale_drives(connection, updated)
+        record_drive_approvals(connection, updated)
+    elif target.model is PlacementDrive:
+        prune_drives(connection, updated)
+    elif target.model is Student:
+        refresh_students(connection, updated)
+
+    db.session.commit()
+    return results
@@ -0,0 +1,45 @@
+from datetime import datetime
+from sqlalchemy import and_, or_
+
+PAGE_SIZE = 25
+
+def encode_cursor(sort_value, key):
+    return f"{sort_value.isoformat()}~{key}"
+
+def decode_cursor(cursor):
+    """Turn an ``after`` query argument back into (sort_value, key), or None."""
+    if not cursor:
+        return None
+    try:
+        sort_value, key = cursor.rsplit("~", 1)
+        return datetime.fromisoformat(sort_value), int(key)
+    except ValueError:
+        return None
+
+def keyset_page(query, sort_column, key_column, cursor=None, page_size=PAGE_SIZE):
+    """Return one page of ``query`` newest first, plus the cursor of the next page.
+
+    Seeks past the last row of the previous page on (sort_column, key_column)
+    instead of using OFFSET, so every page costs the same no matter how deep
+    into the table it is.
+    """
+    after = decode_cursor(cursor)
+    if after:
+        sort_value, key = after
+        query = query.filter(or_(
+            sort_column < sort_value,
+            and_(sort_column == sort_value, key_column < key)
+        ))
+
+    rows = query.order_by(sort_column.desc(), key_column.desc()).limit(page_size + 1).all()
+
+    next_cursor = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        last = rows[-1]
+        next_cursor = encode_cursor(
+            getattr(last, sort_column.key),
+            getattr(last, key_column.key)
+        )
+
+    return rows, next_cursor
@@ -0,0 +1,46 @@
+import re
+from contextlib import contextmanager
+from sqlalchemy import event, inspect
+
+# Tables that only ever hold a handful of rows, scanning them is expected
+SMALL_TABLES = {"dashboard_counter", "placement_statistics", "schema_version"}
+
+@contextmanager
+def recorded_statements(engine):
+    """Collect (sql, parameters) of every SELECT run on ``engine`` inside the block."""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+def full_table_scans(engine, statements):
+    """EXPLAIN QUERY PLAN every statement and return (sql, plan line) for each full table scan.
+
+    "SCAN x USING INDEX ..." walks an index in order and is fine for the keyset
+    pages; a bare "SCAN x" reads the whole table. Scans of a materialised
+    subquery ("SCAN (subquery-1)", "SCAN anon_1") read rows an inner step of
+    the same plan already narrowed, that step is checked on its own.
+    """
+    tables = set(inspect(engine).get_table_names())
+    scans = []
+    with engine.connect() as connection:
+        for statement, parameters in statements:
+            plan = connection.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters).all()
+            for row in plan:
+                detail = row[-1]
+                if not detail.startswith("SCAN ") or " USING " in detail or "VIRTUAL TABLE" in detail:
+                    continue
+                table = detail.split()[1]
+                if re.sub(r"_\d+$", "", table) not in tables:
+                    continue
+                if table in SMALL_TABLES or table == "CONSTANT":
+                    continue
+                scans.append((statement, detail))
+    return scans
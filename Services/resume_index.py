@@ -0,0 +1,218 @@
+import os
+import re
+import time
+import zlib
+from io import BytesIO
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from sqlalchemy import and_, delete, exists, insert, literal, select, update
+from Models.model import db, Student, ResumeJob, ResumeText
+from Services.resume_store import resume_folder
+from Services.search import ranked_search, use_fts5
+
+try:
+    from pypdf import PdfReader
+except ImportError:  # optional, the built-in extractor covers plain text PDFs
+    PdfReader = None
+
+MAX_ATTEMPTS = 3
+BATCH_SIZE = 20
+POLL_INTERVAL = 5
+
+#Text extraction, runs in the worker processes
+STREAM = re.compile(rb"stream\r?\n(.*?)\r?\nendstream", re.S)
+TEXT_OPERATOR = re.compile(rb"(\((?:\\.|[^\\)])*\)\s*Tj|\[(?:\\.|[^\]\\])*\]\s*TJ|T\*|Td|TD|ET)")
+TJ_PART = re.compile(rb"\((?:\\.|[^\\)])*\)|-?\d+(?:\.\d+)?")
+ESCAPES = {b"n": b"\n", b"r": b"\r", b"t": b"\t", b"b": b"\b", b"f": b"\f"}
+
+def _unescape(string):
+    def replace(match):
+        value = match.group(1)
+        if value[:1].isdigit():
+            return bytes([int(value, 8) & 0xFF])
+        return ESCAPES.get(value, value)
+    return re.sub(rb"\\([0-7]{1,3}|.)", replace, string, flags=re.S)
+
+def _extract_text_streams(data):
+    """Text of the Tj/TJ operators in a PDF's content streams.
+
+    Good enough for PDFs with standard font encodings; install pypdf for
+    anything fancier.
+    """
+    words = []
+    for stream in STREAM.finditer(data):
+        content = stream.group(1)
+        try:
+            content = zlib.decompress(content)
+        except zlib.error:
+            pass
+
+        for operator in TEXT_OPERATOR.finditer(content):
+            text = operator.group(0)
+            if not text.endswith((b"Tj", b"TJ")):
+                words.append(b" ")
+                continue
+            # Large negative kerning in TJ arrays is how PDFs write spaces
+            for part in TJ_PART.findall(text):
+                if part.startswith(b"("):
+                    words.append(_unescape(part[1:-1]))
+                elif float(part) < -200:
+                    words.append(b" ")
+            words.append(b" ")
+
+    return " ".join(b"".join(words).decode("latin-1").split())
+
+def extract_text(path):
+    with open(path, "rb") as pdf:
+        data = pdf.read()
+
+    if PdfReader is not None:
+        reader = PdfReader(BytesIO(data))
+        return " ".join(" ".join((page.extract_text() or "") for page in reader.pages).split())
+
+    return _extract_text_streams(data)
+
+#Queue
+def _needs_extraction(student_id, filename):
+    return ~exists().where(
+        ResumeText.student_id == student_id, ResumeText.resume_filename == filename
+    ) & ~exists().where(
+        ResumeJob.student_id == student_id,
+        ResumeJob.resume_filename == filename,
+        ResumeJob.job_status.in_(("pending", "running", "failed"))
+    )
+
+def enqueue_resume(student_id, filename):
+    """Queue a resume for extraction unless it is already indexed, queued or known to fail."""
+    db.session.execute(
+        insert(ResumeJob).from_select(
+            ["student_id", "resume_filename"],
+            select(literal(student_id), literal(filename)).where(_needs_extraction(student_id, filename))
+        )
+    )
+
+def enqueue_changed_resumes():
+    """Queue every student whose current resume has not been indexed yet.
+
+    Unchanged resumes are skipped, so this is cheap to run repeatedly.
+    """
+    result = db.session.execute(
+        insert(ResumeJob).from_select(
+            ["student_id", "resume_filename"],
+            select(Student.student_id, Student.student_resume_filename).where(
+                Student.student_resume_filename.isnot(None),
+                _needs_extraction(Student.student_id, Student.student_resume_filename)
+            )
+        )
+    )
+    db.session.commit()
+    return result.rowcount
+
+def _claim_jobs(limit):
+    claimed = db.session.execute(
+        update(ResumeJob)
+        .where(ResumeJob.job_id.in_(
+            select(ResumeJob.job_id)
+            .where(ResumeJob.job_status == "pending")
+            .order_by(ResumeJob.job_id)
+            .limit(limit)
+        ))
+        .values(job_status="running", attempts=ResumeJob.attempts + 1, updated_at=datetime.utcnow())
+        .returning(ResumeJob.job_id, ResumeJob.student_id, ResumeJob.resume_filename, ResumeJob.attempts)
+        .execution_options(synchronize_session=False)
+    ).all()
+    db.session.commit()
+    return claimed
+
+def _finish_job(job, text=None, error=None):
+    if error is None:
+        current = db.session.execute(
+            select(Student.student_resume_filename).where(Student.student_id == job.student_id)
+        ).scalar()
+
+        # The student may have uploaded a newer resume while this one was processed
+        if current == job.resume_filename:
+            db.session.execute(delete(ResumeText).where(ResumeText.student_id == job.student_id))
+            db.session.execute(insert(ResumeText).values(
+                student_id=job.student_id,
+                resume_filename=job.resume_filename,
+                resume_text=text
+            ))
+        status = "done"
+    else:
+        status = "failed" if job.attempts >= MAX_ATTEMPTS else "pending"
+
+    db.session.execute(
+        update(ResumeJob)
+        .where(ResumeJob.job_id == job.job_id)
+        .values(job_status=status, error=error, updated_at=datetime.utcnow())
+        .execution_options(synchronize_session=False)
+    )
+    db.session.commit()
+
+def process_pending(pool, limit=BATCH_SIZE):
+    """Extract one batch of queued resumes in ``pool``. Returns the number of jobs handled."""
+    jobs = _claim_jobs(limit)
+    folder = resume_folder()
+
+    futures = [
+        (job, pool.submit(extract_text, os.path.join(folder, os.path.basename(job.resume_filename))))
+        for job in jobs
+    ]
+    for job, future in futures:
+        try:
+            _finish_job(job, text=future.result())
+        except Exception as error:
+            db.session.rollback()
+            _finish_job(job, error=f"{type(error).__name__}: {error}")
+
+    return len(jobs)
+
+def run_worker(workers=None, once=False, poll_interval=POLL_INTERVAL):
+    """Work the extraction queue with a process pool until stopped (or drained, with ``once``).
+
+    Jobs left "running" by a worker that died are picked up again at start,
+    so run a single worker per database.
+    """
+    db.session.execute(
+        update(ResumeJob)
+        .where(ResumeJob.job_status == "running")
+        .values(job_status="pending")
+        .execution_options(synchronize_session=False)
+    )
+    db.session.commit()
+
+    handled = 0
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        while True:
+            count = process_pending(pool, limit=max(BATCH_SIZE, (workers or os.cpu_count()) * 4))
+            handled += count
+            if count:
+                continue
+            if once:
+                return handled
+            time.sleep(poll_interval)
+
+#Search
+def resume_search(query, skills, limit):
+    """Students of ``query`` whose resume mentions ``skills``, best match first."""
+    query = query.join(ResumeText, ResumeText.student_id == Student.student_id)
+
+    if use_fts5(skills):
+        return ranked_search(query, ResumeText, skills, limit)
+
+    words = skills.split()
+    return query.filter(and_(*[ResumeText.resume_text.ilike(f"%{word}%") for word in words])).limit(limit).all()
+
+def students_with_skills(student_ids, skills):
+    """The subset of ``student_ids`` whose resume mentions ``skills``."""
+    student_ids = list(student_ids)
+    if not student_ids:
+        return set()
+
+    students = resume_search(
+        Student.query.filter(Student.student_id.in_(student_ids)),
+        skills,
+        len(student_ids)
+    )
+    return {student.student_id for student in students}
@@ -0,0 +1,118 @@
+import hashlib
+import os
+import re
+import shutil
+import tempfile
+from flask import abort, current_app, send_file
+
+# Resumes are personal data, so they live outside static/ (which Flask serves
+# to anyone) and are only sent by the routes that check who is asking
+RESUME_FOLDER = "resumes"  # under the instance folder unless RESUME_FOLDER is configured
+LEGACY_RESUME_FOLDER = os.path.join("static", "uploads", "resumes")
+CHUNK_SIZE = 64 * 1024
+ONE_YEAR = 365 * 24 * 60 * 60
+
+# Stored resumes are named after the SHA-256 of their content
+CONTENT_NAME = re.compile(r"^[0-9a-f]{64}\.pdf$")
+
+class InvalidResume(ValueError):
+    pass
+
+def resume_folder():
+    return current_app.config.get("RESUME_FOLDER") or os.path.join(current_app.instance_path, RESUME_FOLDER)
+
+def move_legacy_resumes():
+    """Move resumes stored under static/ by older versions into the store. Returns how many moved."""
+    legacy = os.path.join(current_app.root_path, LEGACY_RESUME_FOLDER)
+    if not os.path.isdir(legacy):
+        return 0
+
+    folder = resume_folder()
+    os.makedirs(folder, exist_ok=True)
+    moved = 0
+    for filename in os.listdir(legacy):
+        source = os.path.join(legacy, filename)
+        if not os.path.isfile(source):
+            continue
+        target = os.path.join(folder, filename)
+        if os.path.exists(target):
+            os.remove(source)
+        else:
+            shutil.move(source, target)
+        moved += 1
+    return moved
+
+def is_content_addressed(filename):
+    return bool(filename and CONTENT_NAME.match(filename))
+
+def save_resume(stream, max_size=None):
+    """Copy an uploaded PDF to the store in CHUNK_SIZE pieces and return its file name.
+
+    The file is named after its SHA-256, so uploading the same PDF twice (from
+    one student or many) keeps a single copy on disk.
+    """
+    folder = resume_folder()
+    os.makedirs(folder, exist_ok=True)
+
+    digest = hashlib.sha256()
+    size = 0
+    handle, temp_path = tempfile.mkstemp(dir=folder, suffix=".part")
+
+    try:
+        with os.fdopen(handle, "wb") as temp_file:
+            while True:
+                chunk = stream.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                if size == 0 and not chunk.startswith(b"%PDF"):
+                    raise InvalidResume("Resume must be a PDF file.")
+                size += len(chunk)
+                if max_size and size > max_size:
+                    raise InvalidResume("Resume is too large.")
+                digest.update(chunk)
+                temp_file.write(chunk)
+
+        if size == 0:
+            raise InvalidResume("Resume file is empty.")
+
+        filename = f"{digest.hexdigest()}.pdf"
+        target = os.path.join(folder, filename)
+        if os.path.exists(target):
+            os.remove(temp_path)
+        else:
+            os.replace(temp_path, target)
+        return filename
+
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+def send_resume(filename):
+    """Serve a stored resume with ETag/Last-Modified validation and Range support.
+
+    Content-addressed files never change, so browsers may keep them for a
+    year without revalidating. Files uploaded before the store existed are
+    still revalidated on every request.
+    """
+    path = os.path.join(resume_folder(), os.path.basename(filename))
+    if not os.path.isfile(path):
+        abort(404)
+    content_addressed = is_content_addressed(filename)
+
+    response = send_file(
+        path,
+        mimetype="application/pdf",
+        conditional=True,
+        etag=filename[:-4] if content_addressed else True,
+        max_age=ONE_YEAR if content_addressed else 0,
+    )
+
+    # Resumes are personal data: browsers may cache them, shared proxies may not
+    response.cache_control.private = True
+    response.cache_control.public = False
+    if content_addressed:
+        response.cache_control.immutable = True
+    else:
+        response.cache_control.no_cache = True
+    return response
@@ -0,0 +1,108 @@
+import re
+from collections import namedtuple
+from sqlalchemy import bindparam, event, select, update
+from Models.model import PlacementDrive
+
+# job_salary_range stays the free text the company typed; salary_min/max,
+# salary_currency and salary_period are parsed from it whenever it is set, so
+# salaries can be filtered, sorted and aggregated in SQL. Amounts are in whole
+# currency units per period, e.g. "8-12 LPA" -> 800000..1200000 INR per year.
+# The company form asks for the package in LPA, so bare numbers below
+# BARE_LPA_LIMIT ("8-12") are read as lakhs per annum.
+LAKH = 100_000
+BARE_LPA_LIMIT = 100
+DEFAULT_CURRENCY = "INR"
+BACKFILL_BATCH_SIZE = 1000
+
+SalaryRange = namedtuple("SalaryRange", "minimum maximum currency period")
+
+CURRENCIES = [
+    (re.compile(r"₹|\brs\.?|\binr\b"), "INR"),
+    (re.compile(r"\$|\busd\b"), "USD"),
+    (re.compile(r"€|\beur\b"), "EUR"),
+    (re.compile(r"£|\bgbp\b"), "GBP"),
+]
+PERIODS = [
+    (re.compile(r"per\s*month|/\s*mo(nth)?\b|\bp\.?m\b|monthly|stipend"), "month"),
+    (re.compile(r"per\s*hour|/\s*h(ou)?r\b|hourly"), "hour"),
+]
+MULTIPLIERS = {
+    "lpa": LAKH, "lakh": LAKH, "lakhs": LAKH, "lac": LAKH, "lacs": LAKH, "l": LAKH,
+    "cr": 100 * LAKH, "crore": 100 * LAKH, "crores": 100 * LAKH,
+    "k": 1000, "thousand": 1000,
+    "m": 1_000_000, "mn": 1_000_000, "million": 1_000_000,
+}
+AMOUNT = re.compile(r"(\d+(?:,\d+)*(?:\.\d+)?)\s*(lpa|lakhs?|lacs?|crores?|cr|thousand|million|mn|[lkm])?\b")
+
+def parse_salary_range(text):
+    """SalaryRange parsed from free text such as '8-12 LPA', '₹50k/month' or '$120,000', or None."""
+    text = (text or "").lower()
+    amounts = [(float(number.replace(",", "")), unit) for number, unit in AMOUNT.findall(text)]
+    if not amounts:
+        return None
+
+    currency = next((code for pattern, code in CURRENCIES if pattern.search(text)), DEFAULT_CURRENCY)
+    period = next((name for pattern, name in PERIODS if pattern.search(text)), "year")
+
+    # A unit covers the bare numbers before it: "8-12 LPA" is 8 LPA to 12 LPA
+    values, pending = [], []
+    for number, unit in amounts:
+        pending.append(number)
+        if unit:
+            values += [value * MULTIPLIERS[unit] for value in pending]
+            pending = []
+    if pending:
+        bare_lpa = currency == "INR" and period == "year" and not values and max(pending) < BARE_LPA_LIMIT
+        values += [value * LAKH if bare_lpa else value for value in pending]
+
+    return SalaryRange(min(values), max(values), currency, period)
+
+def salary_columns(text):
+    """Values of the parsed salary columns for ``text`` (all None when unparseable)."""
+    salary = parse_salary_range(text)
+    return {
+        "salary_min": salary.minimum if salary else None,
+        "salary_max": salary.maximum if salary else None,
+        "salary_currency": salary.currency if salary else None,
+        "salary_period": salary.period if salary else None,
+    }
+
+@event.listens_for(PlacementDrive.job_salary_range, "set")
+def parse_salary_on_set(drive, value, old_value, initiator):
+    for name, parsed in salary_columns(value).items():
+        setattr(drive, name, parsed)
+
+def backfill_salaries(connection):
+    """Parse job_salary_range of the drives that have no parsed salary yet.
+
+    Bulk inserts and rows written before the columns existed never went
+    through the attribute event. Returns the number of drives parsed.
+    """
+    drive_table = PlacementDrive.__table__
+    statement = update(drive_table).where(drive_table.c.drive_id == bindparam("id")).values(
+        salary_min=bindparam("minimum"),
+        salary_max=bindparam("maximum"),
+        salary_currency=bindparam("currency"),
+        salary_period=bindparam("period"),
+    )
+
+    count, last_id = 0, 0
+    while True:
+        rows = connection.execute(
+            select(drive_table.c.drive_id, drive_table.c.job_salary_range)
+            .where(drive_table.c.salary_period.is_(None), drive_table.c.drive_id > last_id)
+            .order_by(drive_table.c.drive_id)
+            .limit(BACKFILL_BATCH_SIZE)
+        ).all()
+        if not rows:
+            return count
+
+        parsed = [
+            {"id": drive_id, **salary._asdict()}
+            for drive_id, salary in ((drive_id, parse_salary_range(text)) for drive_id, text in rows)
+            if salary
+        ]
+        if parsed:
+            connection.execute(statement, parsed)
+        count += len(parsed)
+        last_id = rows[-1].drive_id
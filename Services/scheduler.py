@@ -0,0 +1,77 @@
+import os
+import threading
+import time
+from datetime import date
+from sqlalchemy import update
+from Models.model import db, PlacementDrive
+from Services.eligibility import prune_drives
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+DEFAULT_INTERVAL = 3600
+
+def close_expired_drives(today=None):
+    """Close every open drive whose deadline has passed, in one UPDATE.
+
+    Returns the number of drives closed.
+    """
+    result = db.session.execute(
+        update(PlacementDrive)
+        .where(
+            PlacementDrive.drive_status == "open",
+            PlacementDrive.application_deadline < (today or date.today())
+        )
+        .values(drive_status="closed")
+        .returning(PlacementDrive.drive_id)
+        .execution_options(synchronize_session=False)
+    )
+    closed = result.scalars().all()
+    prune_drives(db.session.connection(), closed)
+    db.session.commit()
+    return len(closed)
+
+def _try_lock(lock_file):
+    try:
+        if fcntl:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+        return True
+    except OSError:
+        return False
+
+def start_drive_expiry_scheduler(app, interval=DEFAULT_INTERVAL):
+    """Run close_expired_drives every ``interval`` seconds in a daemon thread.
+
+    Only one process per instance folder gets the lock file, so with several
+    gunicorn workers exactly one of them runs the sweep. Returns True when this
+    process is the one running it.
+    """
+    os.makedirs(app.instance_path, exist_ok=True)
+    lock_file = open(os.path.join(app.instance_path, "drive_expiry.lock"), "a+")
+
+    if not _try_lock(lock_file):
+        lock_file.close()
+        return False
+
+    def run():
+        while True:
+            with app.app_context():
+                try:
+                    closed = close_expired_drives()
+                    if closed:
+                        app.logger.info("Closed %d expired drives", closed)
+                except Exception:
+                    db.session.rollback()
+                    app.logger.exception("Closing expired drives failed")
+            time.sleep(interval)
+
+    # The thread keeps a reference to the lock file so the lock lives as long as the process
+    thread = threading.Thread(target=run, name="drive-expiry", daemon=True)
+    thread.lock_file = lock_file
+    thread.start()
+    return True
@@ -0,0 +1,106 @@
+import re
+from flask import current_app
+from sqlalchemy import column, table, text
+from Models.model import db
+
+SEARCH_RESULT_LIMIT = 50
+
+# FTS5 index per searchable table: (index table, primary key, indexed columns).
+# The indexes are external-content tables, so they store only the token lists
+# and read the text itself from the base table.
+FTS_TABLES = {
+    "student": ("student_fts", "student_id", ["student_name", "student_email", "student_phone", "student_department"]),
+    "company": ("company_fts", "company_id", ["company_name", "company_email", "company_industry"]),
+    "resume_text": ("resume_fts", "student_id", ["resume_text"]),
+}
+
+def fts5_available(connection):
+    if connection.dialect.name != "sqlite":
+        return False
+    try:
+        connection.execute(text("CREATE VIRTUAL TABLE temp.fts5_probe USING fts5(probe)"))
+        connection.execute(text("DROP TABLE temp.fts5_probe"))
+        return True
+    except Exception:
+        return False
+
+def setup_search_index(engine):
+    """Create the FTS5 indexes and their sync triggers if they do not exist yet.
+
+    Returns False when the SQLite build has no FTS5, in which case searches use
+    the ilike fallback.
+    """
+    with engine.begin() as connection:
+        if not fts5_available(connection):
+            return False
+
+        for base_table, (fts_table, key, columns) in FTS_TABLES.items():
+            exists = connection.execute(
+                text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+                {"name": fts_table}
+            ).first()
+            if exists:
+                continue
+
+            column_list = ", ".join(columns)
+            new_values = ", ".join(f"new.{c}" for c in columns)
+            old_values = ", ".join(f"old.{c}" for c in columns)
+
+            connection.execute(text(
+                f"CREATE VIRTUAL TABLE {fts_table} USING fts5("
+                f"{column_list}, content='{base_table}', content_rowid='{key}')"
+            ))
+            connection.execute(text(
+                f"CREATE TRIGGER {fts_table}_ai AFTER INSERT ON {base_table} BEGIN "
+                f"INSERT INTO {fts_table}(rowid, {column_list}) VALUES (new.{key}, {new_values}); END"
+            ))
+            connection.execute(text(
+                f"CREATE TRIGGER {fts_table}_ad AFTER DELETE ON {base_table} BEGIN "
+                f"INSERT INTO {fts_table}({fts_table}, rowid, {column_list}) "
+                f"VALUES ('delete', old.{key}, {old_values}); END"
+            ))
+            connection.execute(text(
+                f"CREATE TRIGGER {fts_table}_au AFTER UPDATE OF {column_list} ON {base_table} BEGIN "
+                f"INSERT INTO {fts_table}({fts_table}, rowid, {column_list}) "
+                f"VALUES ('delete', old.{key}, {old_values}); "
+                f"INSERT INTO {fts_table}(rowid, {column_list}) VALUES (new.{key}, {new_values}); END"
+            ))
+            # Index the rows that existed before the index did
+            connection.execute(text(f"INSERT INTO {fts_table}({fts_table}) VALUES ('rebuild')"))
+
+    return True
+
+def match_expression(search_query):
+    """Prefix-match every word of the search box, e.g. 'rahul cse' -> '"rahul"* "cse"*'."""
+    tokens = re.findall(r"\w+", search_query)
+    if not tokens:
+        return None
+    return " ".join(f'"{token}"*' for token in tokens)
+
+def search_index_ready():
+    """Whether `flask init-db` built the FTS5 indexes, looked up once per process."""
+    ready = current_app.config.get("SEARCH_USE_FTS5")
+    if ready is None:
+        connection = db.session.connection()
+        ready = connection.dialect.name == "sqlite" and connection.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+            {"name": FTS_TABLES["student"][0]}
+        ).first() is not None
+        current_app.config["SEARCH_USE_FTS5"] = ready
+    return ready
+
+def use_fts5(search_query):
+    return match_expression(search_query) is not None and search_index_ready()
+
+def ranked_search(query, model, search_query, limit=SEARCH_RESULT_LIMIT):
+    """Best matches of ``search_query`` among the rows of ``query``, most relevant first."""
+    fts_table, key, columns = FTS_TABLES[model.__tablename__]
+    fts = table(fts_table, column("rowid"), column(fts_table), column("rank"))
+
+    return query.join(
+        fts, fts.c.rowid == getattr(model, key)
+    ).filter(
+        fts.c[fts_table].op("MATCH")(match_expression(search_query))
+    ).order_by(
+        fts.c.rank
+    ).limit(limit).all()
@@ -0,0 +1,60 @@
+from sqlalchemy.exc import IntegrityError
+from Models.model import db, Admin, Account, DashboardCounter, DriveEligibility
+from Models.migrations import upgrade
+from Services.accounts import backfill_accounts
+from Services.eligibility import rebuild_eligibility
+from Services.resume_store import move_legacy_resumes
+from Services.search import setup_search_index
+from Services.statistics import rebuild_statistics
+
+# One-time setup, run by `flask init-db` on deploy and never by a web worker.
+DEFAULT_ADMIN = {
+    "admin_username": "admin",
+    "admin_email": "admin@gmail.com",
+    "admin_role": "admin",
+}
+DEFAULT_ADMIN_PASSWORD = "admin123"
+
+def init_database():
+    """Create missing tables, apply migrations and fill the derived tables.
+
+    Safe to run again on an initialised database. Returns the names of the
+    migrations applied.
+    """
+    db.create_all()
+    applied = upgrade(db.engine)
+    setup_search_index(db.engine)
+
+    # Counters start from the existing rows, afterwards they are kept up to date on every flush
+    if not db.session.get(DashboardCounter, "total_students"):
+        rebuild_statistics()
+
+    # Login index over the three user tables, filled once from the existing rows
+    if not Account.query.first():
+        backfill_accounts()
+
+    if not DriveEligibility.query.first():
+        rebuild_eligibility()
+
+    # Resumes used to sit under static/, where anyone could fetch them
+    move_legacy_resumes()
+
+    return applied
+
+def create_default_admin():
+    """Add the default admin unless an admin exists. Returns True if it was created.
+
+    The unique email makes concurrent runs safe: only one insert succeeds.
+    """
+    if Admin.query.filter_by(admin_role="admin").first():
+        return False
+
+    admin = Admin(**DEFAULT_ADMIN)
+    admin.set_password(DEFAULT_ADMIN_PASSWORD)
+    db.session.add(admin)
+    try:
+        db.session.commit()
+    except IntegrityError:
+        db.session.rollback()
+        return False
+    return True
@@ -0,0 +1,272 @@
+from collections import Counter
+from sqlalchemy import and_, case, event, func, select, distinct, extract, insert, update, delete
+from sqlalchemy.orm import attributes
+from Models.model import db, Student, Company, PlacementDrive, Application, PlacementStatistics, DashboardCounter
+from Services.change_bus import record_counters, record_event
+from Services.salary import LAKH
+
+# Placement statistics are kept per graduation year:
+#   total_students         students graduating that year
+#   placed_students        of those, students with at least one "Selected" application
+#   company_participation  companies with an approved drive whose deadline falls in that year
+#   average/highest_salary over the "Selected" applications of that year's students,
+#                          upper end of the drive's annual INR salary, in lakhs (LPA)
+#
+# Whole-table totals for the admin dashboard live in DashboardCounter.
+SALARY_CURRENCY = "INR"
+COUNTERS = ("total_students", "total_companies", "total_student_applications", "total_drives")
+
+statistics_table = PlacementStatistics.__table__
+counter_table = DashboardCounter.__table__
+
+#Counter updates
+def _bump_counter(connection, name, delta):
+    result = connection.execute(
+        update(counter_table)
+        .where(counter_table.c.counter_name == name)
+        .values(counter_value=counter_table.c.counter_value + delta)
+    )
+    if result.rowcount == 0:
+        connection.execute(insert(counter_table).values(counter_name=name, counter_value=delta))
+
+def _ensure_year(connection, year):
+    exists = connection.execute(
+        select(statistics_table.c.stats_id).where(statistics_table.c.year == year)
+    ).first()
+    if not exists:
+        connection.execute(insert(statistics_table).values(
+            year=year,
+            total_students=0,
+            placed_students=0,
+            company_participation=0
+        ))
+
+def _bump_year_students(connection, year, delta):
+    _ensure_year(connection, year)
+    connection.execute(
+        update(statistics_table)
+        .where(statistics_table.c.year == year)
+        .values(total_students=statistics_table.c.total_students + delta)
+    )
+
+def _refresh_placements(connection, year):
+    """Recount placed students and salary figures for a single graduation year."""
+    _ensure_year(connection, year)
+
+    annual_salary = case(
+        (and_(PlacementDrive.salary_currency == SALARY_CURRENCY, PlacementDrive.salary_period == "year"),
+         PlacementDrive.salary_max)
+    )
+    placed, average_salary, highest_salary = connection.execute(
+        select(func.count(distinct(Application.student_id)), func.avg(annual_salary), func.max(annual_salary))
+        .select_from(Application)
+        .join(Student, Student.student_id == Application.student_id)
+        .join(PlacementDrive, PlacementDrive.drive_id == Application.job_id)
+        .where(Student.student_graduation_year == year, Application.application_status == "Selected")
+    ).one()
+
+    connection.execute(
+        update(statistics_table)
+        .where(statistics_table.c.year == year)
+        .values(
+            placed_students=placed,
+            average_salary=average_salary / LAKH if average_salary is not None else None,
+            highest_salary=highest_salary / LAKH if highest_salary is not None else None
+        )
+    )
+
+def _refresh_participation(connection, year):
+    """Recount the companies with an approved drive closing in a single year."""
+    _ensure_year(connection, year)
+
+    participation = connection.execute(
+        select(func.count(distinct(PlacementDrive.company_id)))
+        .where(PlacementDrive.drive_is_approved == True, extract("year", PlacementDrive.application_deadline) == year)
+    ).scalar()
+
+    connection.execute(
+        update(statistics_table)
+        .where(statistics_table.c.year == year)
+        .values(company_participation=participation)
+    )
+
+#Change tracking
+def _history(obj, name):
+    """(old values, new values) of an attribute changed in the current flush."""
+    history = attributes.get_history(obj, name)
+    return list(history.deleted), list(history.added)
+
+def _student_year(connection, student_id):
+    return connection.execute(
+        select(Student.student_graduation_year).where(Student.student_id == student_id)
+    ).scalar()
+
+def _drive_placement_years(connection, drive_id):
+    return set(connection.execute(
+        select(distinct(Student.student_graduation_year))
+        .join(Application, Application.student_id == Student.student_id)
+        .where(Application.job_id == drive_id, Application.application_status == "Selected")
+    ).scalars())
+
+class StatisticsChanges:
+    """What a flush (or a bulk statement) did to the rollups."""
+
+    def __init__(self):
+        self.counters = Counter()
+        self.student_years = Counter()
+        self.placement_years = set()
+        self.participation_years = set()
+
+    def apply(self, connection):
+        for name, delta in self.counters.items():
+            if delta:
+                _bump_counter(connection, name, delta)
+        record_counters(connection, self.counters)
+
+        for year, delta in self.student_years.items():
+            if delta and year is not None:
+                _bump_year_students(connection, year, delta)
+
+        for year in self.placement_years - {None}:
+            _refresh_placements(connection, year)
+
+        for year in self.participation_years - {None}:
+            _refresh_participation(connection, year)
+
+def _track_new(changes, connection, obj, sign=1):
+    if isinstance(obj, Student):
+        changes.counters["total_students"] += sign
+        changes.student_years[obj.student_graduation_year] += sign
+
+    elif isinstance(obj, Company):
+        if obj.company_is_approved:
+            changes.counters["total_companies"] += sign
+
+    elif isinstance(obj, PlacementDrive):
+        changes.counters["total_drives"] += sign
+        if obj.drive_is_approved and obj.application_deadline:
+            changes.participation_years.add(obj.application_deadline.year)
+
+    elif isinstance(obj, Application):
+        changes.counters["total_student_applications"] += sign
+        if obj.application_status == "Selected":
+            changes.placement_years.add(_student_year(connection, obj.student_id))
+
+def _track_dirty(changes, connection, obj):
+    if isinstance(obj, Student):
+        old, new = _history(obj, "student_graduation_year")
+        if new:
+            for year in old:
+                changes.student_years[year] -= 1
+                changes.placement_years.add(year)
+            for year in new:
+                changes.student_years[year] += 1
+                changes.placement_years.add(year)
+
+    elif isinstance(obj, Company):
+        old, new = _history(obj, "company_is_approved")
+        if new and bool(old and old[0]) != bool(new[0]):
+            changes.counters["total_companies"] += 1 if new[0] else -1
+
+    elif isinstance(obj, PlacementDrive):
+        old_approved, new_approved = _history(obj, "drive_is_approved")
+        old_deadline, new_deadline = _history(obj, "application_deadline")
+        if new_approved or new_deadline:
+            for deadline in old_deadline + new_deadline + [obj.application_deadline]:
+                if deadline:
+                    changes.participation_years.add(deadline.year)
+
+        if _history(obj, "job_salary_range")[1]:
+            changes.placement_years.update(_drive_placement_years(connection, obj.drive_id))
+
+    elif isinstance(obj, Application):
+        old, new = _history(obj, "application_status")
+        if new and "Selected" in old + new:
+            changes.placement_years.add(_student_year(connection, obj.student_id))
+
+@event.listens_for(db.session, "after_flush")
+def update_statistics(session, flush_context):
+    connection = session.connection()
+    changes = StatisticsChanges()
+
+    for obj in session.new:
+        _track_new(changes, connection, obj)
+
+    for obj in session.dirty:
+        if session.is_modified(obj, include_collections=False):
+            _track_dirty(changes, connection, obj)
+
+    for obj in session.deleted:
+        _track_new(changes, connection, obj, sign=-1)
+
+    changes.apply(connection)
+
+#Reading
+def dashboard_counters():
+    """The admin dashboard totals from one small query."""
+    values = dict(db.session.query(DashboardCounter.counter_name, DashboardCounter.counter_value))
+    return {name: values.get(name, 0) for name in COUNTERS}
+
+def placement_statistics():
+    return PlacementStatistics.query.order_by(PlacementStatistics.year.desc()).all()
+
+#Rebuild
+def _snapshot(connection):
+    counters = dict(connection.execute(select(counter_table.c.counter_name, counter_table.c.counter_value)).all())
+    years = {
+        row.year: (row.total_students, row.placed_students, row.company_participation, row.average_salary, row.highest_salary)
+        for row in connection.execute(select(statistics_table))
+    }
+    return counters, years
+
+def rebuild_statistics():
+    """Recompute every counter and yearly row from scratch.
+
+    Returns a list of human readable differences between the stored rollups
+    and the recomputed ones (empty when nothing had drifted).
+    """
+    connection = db.session.connection()
+    old_counters, old_years = _snapshot(connection)
+
+    connection.execute(delete(counter_table).where(counter_table.c.counter_name.in_(COUNTERS)))
+    connection.execute(delete(statistics_table))
+
+    counters = {
+        "total_students": connection.execute(select(func.count(Student.student_id))).scalar(),
+        "total_companies": connection.execute(
+            select(func.count(Company.company_id)).where(Company.company_is_approved == True)
+        ).scalar(),
+        "total_student_applications": connection.execute(select(func.count(Application.application_id))).scalar(),
+        "total_drives": connection.execute(select(func.count(PlacementDrive.drive_id))).scalar(),
+    }
+    for name, value in counters.items():
+        connection.execute(insert(counter_table).values(counter_name=name, counter_value=value))
+    record_event(connection, "counters", values=counters)
+
+    student_years = connection.execute(
+        select(Student.student_graduation_year, func.count(Student.student_id))
+        .group_by(Student.student_graduation_year)
+    ).all()
+    drive_years = connection.execute(
+        select(distinct(extract("year", PlacementDrive.application_deadline)))
+        .where(PlacementDrive.drive_is_approved == True)
+    ).scalars().all()
+
+    for year, total in student_years:
+        _bump_year_students(connection, year, total)
+        _refresh_placements(connection, year)
+
+    for year in drive_years:
+        _refresh_participation(connection, int(year))
+
+    db.session.commit()
+
+    new_counters, new_years = _snapshot(db.session.connection())
+    drift = []
+    for name in COUNTERS:
+        if old_counters.get(name) != new_counters.get(name):
+            drift.append(f"{name}: {old_counters.get(name)} -> {new_counters.get(name)}")
+    for year in sorted(set(old_years) | set(new_years)):
+        if old_years.get(year) != new_years.get(year):
+            drift.append(f"{year}: {old_years.get(year)} -> {new_years.get(year)}")
+    return drift
@@ -0,0 +1,291 @@
+import csv
+import json
+import multiprocessing
+import os
+import shutil
+import threading
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from werkzeug.security import generate_password_hash
+from Models.model import db, Student, Account, StudentImport
+from Services.eligibility import refresh_students
+from Services.statistics import StatisticsChanges
+
+BATCH_SIZE = 500
+IMPORT_FOLDER = "imports"  # queued uploads, under the instance folder unless configured
+MAX_REPORTED_ERRORS = 100
+CHUNK_SIZE = 64 * 1024
+
+REQUIRED_COLUMNS = (
+    "student_name", "student_email", "student_password", "student_department",
+    "student_cgpa", "student_joining_year", "student_graduation_year",
+)
+
+account_table = Account.__table__
+
+class ImportReport:
+    def __init__(self):
+        self.imported = 0
+        self.errors = []  # (line number, email, message)
+
+    def error(self, line, email, message):
+        self.errors.append((line, email, message))
+
+def _parse_row(line, row, report):
+    """Validate one CSV row, returning the Student column values or None."""
+    email = (row.get("student_email") or "").strip()
+
+    missing = [column for column in REQUIRED_COLUMNS if not (row.get(column) or "").strip()]
+    if missing:
+        report.error(line, email, f"missing {', '.join(missing)}")
+        return None
+
+    try:
+        values = {
+            "student_name": row["student_name"].strip(),
+            "student_email": email,
+            "student_phone": (row.get("student_phone") or "").strip() or None,
+            "student_department": row["student_department"].strip(),
+            "student_cgpa": float(row["student_cgpa"]),
+            "student_joining_year": int(row["student_joining_year"]),
+            "student_graduation_year": int(row["student_graduation_year"]),
+        }
+    except ValueError:
+        report.error(line, email, "CGPA and years must be numbers")
+        return None
+
+    if not 0 <= values["student_cgpa"] <= 10:
+        report.error(line, email, "CGPA must be between 0 and 10")
+        return None
+
+    return values
+
+def _insert_batch(batch, report):
+    """Insert validated rows (line, values) with one executemany per table."""
+    changes = StatisticsChanges()
+    inserted = db.session.execute(
+        insert(Student).returning(Student.student_id, Student.student_email),
+        [values for line, values in batch]
+    ).all()
+
+    ids = {email: student_id for student_id, email in inserted}
+    db.session.execute(insert(account_table), [
+        {
+            "account_email": values["student_email"],
+            "account_role": "student",
+            "account_user_id": ids[values["student_email"]],
+            "account_password_hash": values["student_password_hash"],
+            "account_display_name": values["student_name"],
+        }
+        for line, values in batch
+    ])
+
+    # Bulk inserts skip the ORM flush, so the rollups are updated here
+    for line, values in batch:
+        changes.counters["total_students"] += 1
+        changes.student_years[values["student_graduation_year"]] += 1
+    changes.apply(db.session.connection())
+    refresh_students(db.session.connection(), ids.values())
+
+    db.session.commit()
+    report.imported += len(batch)
+
+def _insert_rows_one_by_one(batch, report):
+    """Fallback when an email was registered while the batch was being prepared."""
+    for line, values in batch:
+        try:
+            _insert_batch([(line, values)], report)
+        except IntegrityError:
+            db.session.rollback()
+            report.error(line, values["student_email"], "email already registered")
+
+def _flush(pending, passwords, pool, report):
+    hashes = pool.map(generate_password_hash, passwords, chunksize=16)
+    for (line, values), password_hash in zip(pending, hashes):
+        values["student_password_hash"] = password_hash
+
+    try:
+        _insert_batch(pending, report)
+    except IntegrityError:
+        db.session.rollback()
+        _insert_rows_one_by_one(pending, report)
+
+def import_students(text_stream, pool, batch_size=BATCH_SIZE):
+    """Import students from a CSV stream, ``batch_size`` rows per transaction.
+
+    Rows are read lazily, so the file is never held in memory. Passwords are
+    hashed in ``pool``, a process pool. Invalid rows and emails that are
+    already registered, in the database or earlier in the same file, are
+    reported per line and skipped.
+    """
+    report = ImportReport()
+    reader = csv.DictReader(text_stream)
+
+    missing = [column for column in REQUIRED_COLUMNS if column not in (reader.fieldnames or [])]
+    if missing:
+        report.error(1, "", f"missing columns: {', '.join(missing)}")
+        return report
+
+    seen = set()
+    batch = []
+
+    def process(batch):
+        emails = [values["student_email"] for line, values, password in batch]
+        registered = set(db.session.execute(
+            select(Account.account_email).where(Account.account_email.in_(emails))
+        ).scalars())
+
+        pending, passwords = [], []
+        for line, values, password in batch:
+            if values["student_email"] in registered:
+                report.error(line, values["student_email"], "email already registered")
+                continue
+            pending.append((line, values))
+            passwords.append(password)
+
+        if pending:
+            _flush(pending, passwords, pool, report)
+
+    # Line 1 is the header
+    for line, row in enumerate(reader, start=2):
+        values = _parse_row(line, row, report)
+        if values is None:
+            continue
+
+        if values["student_email"] in seen:
+            report.error(line, values["student_email"], "duplicate email in file")
+            continue
+        seen.add(values["student_email"])
+
+        batch.append((line, values, row["student_password"]))
+        if len(batch) >= batch_size:
+            process(batch)
+            batch = []
+
+    if batch:
+        process(batch)
+
+    return report
+
+#Background imports of admin uploads
+def save_upload(stream, folder):
+    """Copy an uploaded CSV to ``folder`` in chunks. Returns the new file's name."""
+    os.makedirs(folder, exist_ok=True)
+    filename = f"{uuid.uuid4().hex}.csv"
+    with open(os.path.join(folder, filename), "wb") as csv_file:
+        shutil.copyfileobj(stream, csv_file, CHUNK_SIZE)
+    return filename
+
+def _claim_import():
+    return db.session.execute(
+        update(StudentImport)
+        .where(StudentImport.import_id == (
+            select(func.min(StudentImport.import_id))
+            .where(StudentImport.import_status == "pending")
+            .scalar_subquery()
+        ))
+        .values(import_status="running")
+        .returning(StudentImport.import_id, StudentImport.csv_filename)
+        .execution_options(synchronize_session=False)
+    ).first()
+
+def _finish_import(import_id, status, report):
+    db.session.execute(
+        update(StudentImport)
+        .where(StudentImport.import_id == import_id)
+        .values(
+            import_status=status,
+            imported=report.imported,
+            skipped=len(report.errors),
+            errors=json.dumps(report.errors[:MAX_REPORTED_ERRORS]),
+            finished_at=datetime.utcnow(),
+        )
+        .execution_options(synchronize_session=False)
+    )
+    db.session.commit()
+
+def run_pending_imports(pool, folder):
+    """Import every queued upload, one at a time. Returns the number of imports run."""
+    count = 0
+    while True:
+        claimed = _claim_import()
+        db.session.commit()
+        if claimed is None:
+            return count
+
+        import_id, filename = claimed
+        path = os.path.join(folder, filename)
+        try:
+            with open(path, newline="", encoding="utf-8") as csv_file:
+                report = import_students(csv_file, pool)
+            status = "done"
+        except Exception as error:
+            db.session.rollback()
+            report = ImportReport()
+            report.error(0, "", f"{type(error).__name__}: {error}")
+            status = "failed"
+
+        _finish_import(import_id, status, report)
+        if os.path.exists(path):
+            os.remove(path)
+        count += 1
+
+class ImportWorker:
+    """Runs admin CSV uploads after the request that queued them has returned.
+
+    Uploads are saved to the instance folder and queued as student_import
+    rows. A daemon thread, started by the first upload, claims them and hashes
+    the passwords in a process pool that stays up for the life of the process,
+    the same path `flask import-students` takes. The pool uses spawned
+    processes, forking a process that runs request threads is not safe.
+    """
+
+    def __init__(self):
+        self.app = None
+        self.workers = None
+        self.folder = None
+        self._wake = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        """IMPORT_WORKERS sets the hashing processes (default: one per core),
+        IMPORT_FOLDER where uploads wait (default: instance/imports)."""
+        self.app = app
+        self.workers = app.config.get("IMPORT_WORKERS")
+        self.folder = app.config.get("IMPORT_FOLDER") or os.path.join(app.instance_path, IMPORT_FOLDER)
+
+    def submit(self, stream, original_filename=None):
+        """Save and queue an uploaded CSV. Returns its StudentImport id right away."""
+        job = StudentImport(csv_filename=save_upload(stream, self.folder), original_filename=original_filename)
+        db.session.add(job)
+        db.session.commit()
+
+        self._start()
+        self._wake.set()
+        return job.import_id
+
+    def _start(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="student-import", daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        pool = ProcessPoolExecutor(
+            max_workers=self.workers or os.cpu_count(), mp_context=multiprocessing.get_context("spawn")
+        )
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            with self.app.app_context():
+                try:
+                    run_pending_imports(pool, self.folder)
+                except Exception:
+                    db.session.rollback()
+                    self.app.logger.exception("Student import failed")
+
+import_worker = ImportWorker()
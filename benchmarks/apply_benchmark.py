@@ -0,0 +1,190 @@
+"""Fire thousands of simultaneous applications at /student/apply and check the result.
+
+Every student applies to a few drives; some submits are retried with the same
+idempotency key and some are repeated with a new key, and one drive is past
+its deadline without having been closed yet. Afterwards the database must hold
+exactly one application per accepted (student, drive) pair, every retry must
+have been answered with the original application and the applications counter
+must match the table. Runs once with group commit and once without, and
+prints throughput per second so stalls show up.
+
+Usage: python benchmarks/apply_benchmark.py [students] [threads]
+"""
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from sqlalchemy import func, insert, select
+from app import create_app
+from Models.model import db, Student, Company, PlacementDrive, Application
+from Services.eligibility import rebuild_eligibility
+from Services.setup import init_database
+from Services.statistics import dashboard_counters
+
+DRIVES = 10
+APPLICATIONS_PER_STUDENT = 3
+RETRY_RATE = 0.2      # same request again, same idempotency key
+REPEAT_RATE = 0.1     # same drive again, new idempotency key
+
+def build_app(path, group_commit):
+    app = create_app({
+        "SQLALCHEMY_DATABASE_URI": f"sqlite:///{path}",
+        "APPLY_GROUP_COMMIT": group_commit,
+        "FRAGMENT_CACHE": "",
+    })
+    with app.app_context():
+        init_database()
+    return app
+
+def seed(students):
+    db.session.execute(insert(Student), [
+        {
+            "student_name": f"Student {i}",
+            "student_email": f"student{i}@college.edu",
+            "student_password_hash": "x",
+            "student_department": "CSE",
+            "student_cgpa": 8.0,
+            "student_joining_year": 2022,
+            "student_graduation_year": 2026,
+        }
+        for i in range(students)
+    ])
+    company = Company(
+        company_name="Bench Corp", company_email="hr@bench.com", company_password_hash="x",
+        company_hr_contact_name="HR", company_hr_contact_email="hr@bench.com", company_industry="IT",
+        approval_status="approved", company_is_approved=True,
+    )
+    db.session.add(company)
+    db.session.flush()
+
+    # The last drive's deadline has passed but the expiry sweep has not closed it yet
+    for number in range(DRIVES):
+        deadline = date.today() + timedelta(days=-1 if number == DRIVES - 1 else 7)
+        db.session.add(PlacementDrive(
+            company_id=company.company_id, drive_name=f"Drive {number}", job_title="Engineer", job_description="-",
+            job_location="Pune", job_salary_range="10 LPA", application_deadline=deadline,
+            drive_is_approved=True, drive_status="open",
+        ))
+    db.session.commit()
+    rebuild_eligibility()
+
+    student_ids = db.session.execute(select(Student.student_id)).scalars().all()
+    drive_ids = db.session.execute(select(PlacementDrive.drive_id).order_by(PlacementDrive.drive_id)).scalars().all()
+    return student_ids, drive_ids
+
+def plan(student_ids, drive_ids, rng):
+    """(student_id, drive_id, idempotency_key) submits, shuffled."""
+    submits = []
+    for student_id in student_ids:
+        for drive_id in rng.sample(drive_ids, APPLICATIONS_PER_STUDENT):
+            key = uuid.uuid4().hex
+            submits.append((student_id, drive_id, key))
+            if rng.random() < RETRY_RATE:
+                submits.append((student_id, drive_id, key))
+            if rng.random() < REPEAT_RATE:
+                submits.append((student_id, drive_id, uuid.uuid4().hex))
+    rng.shuffle(submits)
+    return submits
+
+def fire(app, submits, threads):
+    local = threading.local()
+    completed = []
+
+    def one(submit):
+        student_id, drive_id, key = submit
+        if not hasattr(local, "client"):
+            local.client = app.test_client()
+        with local.client.session_transaction() as session:
+            session.update(user_id=student_id, user_role="student")
+        response = local.client.post("/student/apply", json={"drive_id": drive_id}, headers={"Idempotency-Key": key})
+        completed.append(time.perf_counter())
+        return submit, response.status_code, response.get_json()
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        results = list(pool.map(one, submits))
+    elapsed = time.perf_counter() - start
+
+    per_second = Counter(int(finished - start) for finished in completed)
+    return results, elapsed, [per_second[second] for second in range(int(elapsed) + 1)]
+
+def check(app, results, drive_ids):
+    """Problems found in the database and the responses (empty when consistent)."""
+    problems = []
+    closed_drive = drive_ids[-1]
+    first_answer = {}
+
+    for (student_id, drive_id, key), status, body in results:
+        if status >= 500:
+            problems.append(f"{status} for student {student_id} drive {drive_id}")
+            continue
+        if drive_id == closed_drive and body["outcome"] != "closed":
+            problems.append(f"expired drive accepted student {student_id}: {body}")
+        if body["outcome"] in ("applied", "replayed"):
+            earlier = first_answer.setdefault((student_id, key), body["application_id"])
+            if earlier != body["application_id"]:
+                problems.append(f"key {key} answered with {earlier} and {body['application_id']}")
+
+    with app.app_context():
+        duplicates = db.session.execute(
+            select(Application.student_id, Application.job_id)
+            .group_by(Application.student_id, Application.job_id)
+            .having(func.count() > 1)
+        ).all()
+        if duplicates:
+            problems.append(f"{len(duplicates)} duplicate (student, drive) pairs")
+
+        total = db.session.query(Application).count()
+        expected = len({(student_id, drive_id) for (student_id, drive_id, key), status, body in results
+                        if drive_id != closed_drive})
+        if total != expected:
+            problems.append(f"{total} applications stored, {expected} expected")
+
+        counter = dashboard_counters()["total_student_applications"]
+        if counter != total:
+            problems.append(f"applications counter is {counter}, table has {total}")
+
+    return problems
+
+def main():
+    students = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    threads = int(sys.argv[2]) if len(sys.argv) > 2 else 64
+    failed = False
+
+    print(f"{students} students x {APPLICATIONS_PER_STUDENT} drives, {threads} threads")
+    print(f"{'mode':<16}{'submits':>9}{'req/s':>9}{'min/s':>9}{'max/s':>9}  outcomes")
+    for name, group_commit in (("group commit", True), ("one per commit", False)):
+        with tempfile.TemporaryDirectory() as directory:
+            app = build_app(os.path.join(directory, "apply.db"), group_commit)
+            with app.app_context():
+                student_ids, drive_ids = seed(students)
+            submits = plan(student_ids, drive_ids, random.Random(42))
+
+            results, elapsed, per_second = fire(app, submits, threads)
+            problems = check(app, results, drive_ids)
+
+            with app.app_context():
+                db.engine.dispose()
+
+        outcomes = Counter(body["outcome"] for submit, status, body in results if status < 500)
+        full_seconds = per_second[:-1] or per_second
+        print(f"{name:<16}{len(submits):>9}{len(submits) / elapsed:>9.0f}{min(full_seconds):>9}{max(full_seconds):>9}  "
+              + ", ".join(f"{outcome} {count}" for outcome, count in sorted(outcomes.items())))
+        for problem in problems:
+            print(f"  FAILED: {problem}")
+        failed = failed or bool(problems)
+
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
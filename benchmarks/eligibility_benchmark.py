@@ -0,0 +1,112 @@
+"""Time matching every student against every drive's structured criteria.
+
+Evaluation (NumPy and the pure Python fallback) is timed separately from
+writing the drive_eligibility rows.
+
+Usage: python benchmarks/eligibility_benchmark.py [number_of_students] [number_of_drives]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import Flask
+from sqlalchemy import insert
+from Models.model import db, Student, Company, PlacementDrive
+from Services import eligibility
+
+DEPARTMENTS = ["CSE", "ECE", "Mechanical", "Civil", "Electrical", "Chemical", "IT", "Biotech"]
+YEARS = [2025, 2026, 2027, 2028]
+
+def build_app(path):
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{path}"
+    db.init_app(app)
+    return app
+
+def seed(students, drives, rng):
+    db.session.execute(insert(Student), [
+        {
+            "student_name": f"Student {i}",
+            "student_email": f"student{i}@college.edu",
+            "student_password_hash": "x",
+            "student_phone": f"9{i:09d}",
+            "student_department": rng.choice(DEPARTMENTS),
+            "student_cgpa": round(rng.uniform(5.5, 10.0), 2),
+            "student_joining_year": 2022,
+            "student_graduation_year": rng.choice(YEARS),
+            "student_is_blacklisted": rng.random() < 0.01,
+        }
+        for i in range(students)
+    ])
+    db.session.execute(insert(Company), [{
+        "company_name": "Benchmark Co", "company_email": "hr@benchmark.com", "company_password_hash": "x",
+        "company_hr_contact_name": "HR", "company_hr_contact_email": "hr@benchmark.com", "company_industry": "IT",
+    }])
+    db.session.execute(insert(PlacementDrive), [
+        {
+            "company_id": 1,
+            "drive_name": f"Drive {i}",
+            "job_title": "Software Engineer",
+            "job_description": "Benchmark drive",
+            "job_location": "Remote",
+            "job_type": "Full-time",
+            "job_salary_range": "5-10",
+            "job_no_of_positions": 10,
+            "application_deadline": date.today() + timedelta(days=30),
+            "drive_status": "open",
+            "min_cgpa": rng.choice((None, 6.0, 7.0, 8.0)),
+            "allowed_departments": ", ".join(rng.sample(DEPARTMENTS, rng.randint(1, 4))) if rng.random() < 0.8 else None,
+            "allowed_graduation_years": str(rng.choice(YEARS)) if rng.random() < 0.7 else None,
+            "exclude_blacklisted": True,
+        }
+        for i in range(drives)
+    ])
+    db.session.commit()
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return result, (time.perf_counter() - start) * 1000
+
+def evaluate(students, drives):
+    return sum(len(students.eligible_ids(criteria)) for criteria in drives)
+
+def main():
+    student_count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    drive_count = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+
+    with tempfile.TemporaryDirectory() as directory:
+        app = build_app(os.path.join(directory, "bench.db"))
+        with app.app_context():
+            db.create_all()
+            seed(student_count, drive_count, random.Random(42))
+
+            connection = db.session.connection()
+            drives = eligibility._load_criteria(connection)
+            print(f"{student_count} students x {drive_count} drives")
+
+            if eligibility.np is not None:
+                students, load_ms = timed(lambda: eligibility.StudentColumns.load(connection))
+                pairs, numpy_ms = timed(lambda: evaluate(students, drives))
+                print(f"{'load columns (numpy)':<28}{load_ms:>10.0f} ms")
+                print(f"{'evaluate (numpy)':<28}{numpy_ms:>10.0f} ms  {pairs} eligible pairs")
+
+            numpy, eligibility.np = eligibility.np, None
+            try:
+                students, load_ms = timed(lambda: eligibility.StudentColumns.load(connection))
+                pairs, python_ms = timed(lambda: evaluate(students, drives))
+            finally:
+                eligibility.np = numpy
+            print(f"{'load columns (python)':<28}{load_ms:>10.0f} ms")
+            print(f"{'evaluate (python)':<28}{python_ms:>10.0f} ms  {pairs} eligible pairs")
+
+            count, write_ms = timed(eligibility.rebuild_eligibility)
+            print(f"{'rebuild (evaluate + write)':<28}{write_ms:>10.0f} ms  {count} rows")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""Fan committed changes out to many live dashboard subscribers.
+
+Each round opens a number of in-process admin subscriptions, writes the same
+number of applications (one transaction each, through apply_batch) and checks
+that every subscriber got every event without falling behind. The SQL
+statements of a round must not grow with the number of subscribers, and the
+time spent publishing shows what one more open dashboard costs per event.
+
+Usage: python benchmarks/live_updates_benchmark.py [applications] [subscribers ...]
+"""
+import os
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from sqlalchemy import event, insert, select
+from app import create_app
+from Models.model import db, Student, Company, PlacementDrive
+from Services.application_queue import ApplyRequest, commit_batch
+from Services.eligibility import rebuild_eligibility
+from Services.live_updates import ADMIN_EVENTS, live_updates
+from Services.setup import init_database
+
+def build_app(path):
+    app = create_app({"SQLALCHEMY_DATABASE_URI": f"sqlite:///{path}", "FRAGMENT_CACHE": ""})
+    with app.app_context():
+        init_database()
+    return app
+
+def seed(students, drives):
+    db.session.execute(insert(Student), [
+        {
+            "student_name": f"Student {i}",
+            "student_email": f"student{i}@college.edu",
+            "student_password_hash": "x",
+            "student_department": "CSE",
+            "student_cgpa": 8.0,
+            "student_joining_year": 2022,
+            "student_graduation_year": 2026,
+        }
+        for i in range(students)
+    ])
+    company = Company(
+        company_name="Live Corp", company_email="hr@live.com", company_password_hash="x",
+        company_hr_contact_name="HR", company_hr_contact_email="hr@live.com", company_industry="IT",
+        approval_status="approved", company_is_approved=True,
+    )
+    db.session.add(company)
+    db.session.flush()
+    for number in range(drives):
+        db.session.add(PlacementDrive(
+            company_id=company.company_id, drive_name=f"Drive {number}", job_title="Engineer", job_description="-",
+            job_location="Pune", job_salary_range="10 LPA", application_deadline=date.today() + timedelta(days=7),
+            drive_is_approved=True, drive_status="open",
+        ))
+    db.session.commit()
+    rebuild_eligibility()
+
+    student_ids = db.session.execute(select(Student.student_id).order_by(Student.student_id)).scalars().all()
+    drive_ids = db.session.execute(select(PlacementDrive.drive_id).order_by(PlacementDrive.drive_id)).scalars().all()
+    return student_ids, drive_ids
+
+def run_round(app, student_ids, drive_id, subscribers):
+    bus = live_updates.bus
+    statements = []
+    publish_seconds = []
+    accepted = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    publish = bus.publish
+    def timed_publish(events):
+        start = time.perf_counter()
+        publish(events)
+        publish_seconds.append(time.perf_counter() - start)
+        accepted.extend(change for change in events if change["type"] in ADMIN_EVENTS)
+
+    with app.app_context():
+        subscriptions = [live_updates.subscribe(ADMIN_EVENTS) for _ in range(subscribers)]
+
+        event.listen(db.engine, "before_cursor_execute", count)
+        bus.publish = timed_publish
+        start = time.perf_counter()
+        try:
+            for student_id in student_ids:
+                commit_batch([ApplyRequest(student_id, drive_id)])
+        finally:
+            elapsed = time.perf_counter() - start
+            bus.publish = publish
+            event.remove(db.engine, "before_cursor_execute", count)
+
+    events = len(accepted)
+    problems = [
+        f"subscriber got {subscription.messages.qsize()} of {events} events"
+        for subscription in subscriptions
+        if subscription.lagging or subscription.messages.qsize() != events
+    ]
+    for subscription in subscriptions:
+        bus.unsubscribe(subscription)
+
+    return events, len(statements), elapsed, sum(publish_seconds), problems[:3]
+
+def main():
+    applications = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    rounds = [int(value) for value in sys.argv[2:]] or [0, 100, 1000, 5000]
+    failed = False
+
+    with tempfile.TemporaryDirectory() as directory:
+        app = build_app(os.path.join(directory, "live.db"))
+        with app.app_context():
+            student_ids, drive_ids = seed(applications, len(rounds) + 1)
+            # Creates the counter rows a first write would, so every round runs the same statements
+            commit_batch([ApplyRequest(student_ids[0], drive_ids.pop())])
+
+        print(f"{applications} applications per round, one transaction each")
+        print(f"{'subscribers':>12}{'events':>8}{'queries':>9}{'write s':>9}{'publish s':>11}{'us/event/sub':>14}")
+        baseline_queries = None
+        for subscribers, drive_id in zip(rounds, drive_ids):
+            events, queries, elapsed, publishing, problems = run_round(app, student_ids, drive_id, subscribers)
+            per_delivery = publishing / events / subscribers * 1e6 if events and subscribers else 0
+            print(f"{subscribers:>12}{events:>8}{queries:>9}{elapsed:>9.2f}{publishing:>11.3f}{per_delivery:>14.2f}")
+
+            baseline_queries = baseline_queries if baseline_queries is not None else queries
+            if queries != baseline_queries:
+                problems.append(f"{queries} statements, {baseline_queries} without subscribers")
+            for problem in problems:
+                print(f"  FAILED: {problem}")
+            failed = failed or bool(problems)
+
+        with app.app_context():
+            db.engine.dispose()
+
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Repeat-fetch latency of a resume: plain send_from_directory vs the resume store.
+
+Usage: python benchmarks/resume_fetch_benchmark.py [runs]
+"""
+import hashlib
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from flask import Flask, send_from_directory
+from Services.resume_store import resume_folder, save_resume, send_resume
+
+SAMPLE = os.path.join(ROOT, "benchmarks", "sample_resume.pdf")
+
+def build_app():
+    app = Flask(__name__, root_path=ROOT)
+
+    @app.route("/legacy/<filename>")
+    def legacy(filename):
+        return send_from_directory(os.path.dirname(SAMPLE), filename)
+
+    @app.route("/store/<filename>")
+    def store(filename):
+        return send_resume(filename)
+
+    return app
+
+def timed(client, url, runs, headers=None):
+    start = time.perf_counter()
+    for _ in range(runs):
+        response = client.get(url, headers=headers or {})
+        size = len(response.data)
+        response.close()
+    return (time.perf_counter() - start) / runs * 1000, response.status_code, size
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    app = build_app()
+    client = app.test_client()
+
+    with app.app_context(), open(SAMPLE, "rb") as sample:
+        stored_path = os.path.join(resume_folder(), hashlib.sha256(sample.read()).hexdigest() + ".pdf")
+    created = not os.path.exists(stored_path)
+
+    with app.app_context(), open(SAMPLE, "rb") as sample:
+        filename = save_resume(sample)
+
+    try:
+        etag = client.get(f"/store/{filename}").headers["ETag"]
+
+        print(f"mean of {runs} fetches")
+        print(f"{'case':<40}{'ms':>8}{'status':>8}{'bytes':>10}")
+        cases = [
+            ("send_from_directory, full body", "/legacy/sample_resume.pdf", None),
+            ("resume store, full body", f"/store/{filename}", None),
+            ("resume store, If-None-Match (304)", f"/store/{filename}", {"If-None-Match": etag}),
+            ("resume store, 64 KiB range (206)", f"/store/{filename}", {"Range": "bytes=0-65535"}),
+        ]
+        for name, url, headers in cases:
+            ms, status, size = timed(client, url, runs, headers)
+            print(f"{name:<40}{ms:>8.3f}{status:>8}{size:>10}")
+        print("A browser holding the immutable copy skips the request entirely.")
+    finally:
+        if created:
+            os.remove(stored_path)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+"""Load test the main routes through the Flask test client and write a JSON baseline.
+
+Seed the database first with benchmarks/seed_data.py. Each route is driven
+by WORKERS concurrent clients; the report has p50/p95/p99 latency,
+throughput and SQL statements per request for every route. The moderation
+routes really change the data, so run against a scratch copy.
+
+Usage: python benchmarks/route_benchmark.py DATABASE_PATH [--requests N] [--workers N]
+           [--output baseline.json] [--compare old_baseline.json]
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from seed_data import PASSWORD, use_database
+
+ADMIN_LOGIN = ("admin@gmail.com", "admin123")
+
+class QueryCounter(threading.local):
+    count = 0
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def sample_ids(app):
+    """Ids and logins the routes are driven with, read once up front."""
+    from sqlalchemy import select
+    from Models.model import db, Student, Company, Application
+
+    with app.app_context():
+        student_ids = db.session.execute(select(Student.student_id).limit(5000)).scalars().all()
+        company_ids = db.session.execute(
+            select(Company.company_id).where(Company.company_is_approved == True).limit(500)
+        ).scalars().all()
+        company_emails = db.session.execute(
+            select(Company.company_email).where(Company.company_is_approved == True).limit(50)
+        ).scalars().all()
+        student_emails = db.session.execute(select(Student.student_email).limit(500)).scalars().all()
+        resume_application_ids = db.session.execute(
+            select(Application.application_id)
+            .join(Student, Student.student_id == Application.student_id)
+            .where(Student.student_resume_filename.isnot(None))
+            .limit(5000)
+        ).scalars().all()
+
+    return {
+        "student_ids": student_ids,
+        "company_ids": company_ids,
+        "company_emails": company_emails,
+        "student_emails": student_emails,
+        "resume_application_ids": resume_application_ids,
+    }
+
+def login(client, email, password):
+    return client.post("/login", data={"email": email, "password": password})
+
+#Routes: name -> (role of the logged in client, request function)
+def route_table(ids):
+    def student_login(client, rng):
+        client.get("/logout")
+        return login(client, rng.choice(ids["student_emails"]), PASSWORD)
+
+    def poll_drive_feed(client, rng):
+        # Revalidates like the dashboard script, so most polls are 304s
+        response = client.get("/student/drives", headers={"If-None-Match": getattr(client, "feed_etag", "")})
+        client.feed_etag = response.headers.get("ETag", "")
+        return response
+
+    return {
+        "login": (None, student_login),
+        "admin_dashboard": ("admin", lambda client, rng: client.get("/admin/dashboard")),
+        "company_dashboard": ("company", lambda client, rng: client.get("/company/dashboard")),
+        "student_dashboard": ("student", lambda client, rng: client.get("/student/dashboard")),
+        "student_drive_feed": ("student", poll_drive_feed),
+        "toggle_blacklist_student": ("admin", lambda client, rng: client.post(
+            f"/admin/student/toggle_blacklist/{rng.choice(ids['student_ids'])}")),
+        "approve_company": ("admin", lambda client, rng: client.post(
+            f"/admin/company/approve/{rng.choice(ids['company_ids'])}")),
+        "view_resume": ("admin", lambda client, rng: client.get(
+            f"/admin/view_resume/{rng.choice(ids['resume_application_ids'])}")),
+    }
+
+def run_route(app, ids, role, request, count, workers, counter):
+    local = threading.local()
+
+    def client():
+        if not hasattr(local, "client"):
+            local.client = app.test_client()
+            local.rng = random.Random(threading.get_ident())
+            if role == "admin":
+                login(local.client, *ADMIN_LOGIN)
+            elif role == "company":
+                login(local.client, local.rng.choice(ids["company_emails"]), PASSWORD)
+            elif role == "student":
+                login(local.client, local.rng.choice(ids["student_emails"]), PASSWORD)
+        return local.client, local.rng
+
+    def one(_):
+        test_client, rng = client()
+        counter.count = 0
+        start = time.perf_counter()
+        response = request(test_client, rng)
+        elapsed = time.perf_counter() - start
+        response.close()
+        return elapsed, counter.count, response.status_code < 400
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(one, range(count)))
+    wall = time.perf_counter() - started
+
+    latencies = [elapsed * 1000 for elapsed, queries, ok in results]
+    return {
+        "requests": count,
+        "errors": sum(1 for elapsed, queries, ok in results if not ok),
+        "p50_ms": round(percentile(latencies, 0.50), 2),
+        "p95_ms": round(percentile(latencies, 0.95), 2),
+        "p99_ms": round(percentile(latencies, 0.99), 2),
+        "throughput_rps": round(count / wall, 1),
+        "queries_per_request": round(statistics.mean(queries for elapsed, queries, ok in results), 2),
+    }
+
+def compare(baseline, report):
+    print(f"\n{'route':<26}{'p95 before':>12}{'p95 now':>12}{'change':>10}{'queries':>16}")
+    for name, now in report["routes"].items():
+        before = baseline["routes"].get(name)
+        if not before:
+            continue
+        change = (now["p95_ms"] - before["p95_ms"]) / before["p95_ms"] * 100 if before["p95_ms"] else 0
+        queries = f"{before['queries_per_request']} -> {now['queries_per_request']}"
+        print(f"{name:<26}{before['p95_ms']:>12}{now['p95_ms']:>12}{change:>+9.1f}%{queries:>16}")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("database", help="SQLite file seeded by seed_data.py")
+    parser.add_argument("--requests", type=int, default=200, help="Requests per route.")
+    parser.add_argument("--workers", type=int, default=4, help="Concurrent clients.")
+    parser.add_argument("--routes", nargs="*", help="Only these routes.")
+    parser.add_argument("--output", help="Write the JSON report here.")
+    parser.add_argument("--compare", help="Earlier JSON report to compare against.")
+    args = parser.parse_args()
+
+    use_database(args.database)
+    from sqlalchemy import event
+    from app import app
+    from Models.model import db, Student, Application
+
+    counter = QueryCounter()
+    with app.app_context():
+        event.listen(db.engine, "before_cursor_execute", lambda *arguments: setattr(counter, "count", counter.count + 1))
+        dataset = {"students": db.session.query(Student).count(), "applications": db.session.query(Application).count()}
+
+    ids = sample_ids(app)
+    routes = route_table(ids)
+
+    report = {"commit": git_commit(), "workers": args.workers, "dataset": dataset, "routes": {}}
+    print(f"{'route':<26}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'req/s':>10}{'queries':>10}{'errors':>8}")
+    for name, (role, request) in routes.items():
+        if args.routes and name not in args.routes:
+            continue
+        result = run_route(app, ids, role, request, args.requests, args.workers, counter)
+        report["routes"][name] = result
+        print(f"{name:<26}{result['p50_ms']:>10}{result['p95_ms']:>10}{result['p99_ms']:>10}"
+              f"{result['throughput_rps']:>10}{result['queries_per_request']:>10}{result['errors']:>8}")
+
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(report, output, indent=2)
+
+    if args.compare:
+        with open(args.compare) as baseline:
+            compare(json.load(baseline), report)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Compare the FTS5 admin search with the ilike fallback.
+
+Usage: python benchmarks/search_benchmark.py [number_of_students]
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import Flask
+from sqlalchemy import insert, or_
+from Models.model import db, Student
+from Services.search import setup_search_index, ranked_search
+
+DEPARTMENTS = ["CSE", "ECE", "Mechanical", "Civil", "Electrical", "Chemical"]
+FIRST_NAMES = ["Aarav", "Diya", "Kabir", "Meera", "Rohan", "Sneha", "Vivaan", "Ishita", "Arjun", "Priya"]
+QUERIES = ["Meera", "sneha12", "Mech", "98765", "rohan cse"]
+RUNS = 20
+
+def build_app(path):
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{path}"
+    db.init_app(app)
+    return app
+
+def seed(count):
+    rows = [
+        {
+            "student_name": f"{FIRST_NAMES[i % len(FIRST_NAMES)]} {i}",
+            "student_email": f"{FIRST_NAMES[i % len(FIRST_NAMES)].lower()}{i}@college.edu",
+            "student_password_hash": "x",
+            "student_phone": f"98765{i:05d}",
+            "student_department": DEPARTMENTS[i % len(DEPARTMENTS)],
+            "student_cgpa": 7.5,
+            "student_joining_year": 2022,
+            "student_graduation_year": 2026,
+        }
+        for i in range(count)
+    ]
+    db.session.execute(insert(Student), rows)
+    db.session.commit()
+
+def ilike_search(term):
+    return Student.query.filter(or_(
+        Student.student_name.ilike(f"%{term}%"),
+        Student.student_email.ilike(f"%{term}%"),
+        Student.student_phone.ilike(f"%{term}%"),
+        Student.student_department.ilike(f"%{term}%")
+    )).order_by(Student.created_at.desc()).limit(50).all()
+
+def timed(function, term):
+    start = time.perf_counter()
+    for _ in range(RUNS):
+        function(term)
+    return (time.perf_counter() - start) / RUNS * 1000
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    with tempfile.TemporaryDirectory() as directory:
+        app = build_app(os.path.join(directory, "bench.db"))
+        with app.app_context():
+            db.create_all()
+            if not setup_search_index(db.engine):
+                print("FTS5 is not available in this SQLite build.")
+                return
+            seed(count)
+
+            print(f"{count} students, mean of {RUNS} runs")
+            print(f"{'query':<12}{'ilike ms':>12}{'fts5 ms':>12}")
+            for term in QUERIES:
+                ilike_ms = timed(ilike_search, term)
+                fts_ms = timed(lambda t: ranked_search(Student.query, Student, t), term)
+                print(f"{term:<12}{ilike_ms:>12.2f}{fts_ms:>12.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""Fill a database with synthetic students, companies, drives and applications.
+
+Rows are written with bulk INSERTs in batches, so 200k students and 2M
+applications take minutes, not hours. Every student and company can log in
+with PASSWORD.
+
+Usage: python benchmarks/seed_data.py DATABASE_PATH [--students N]
+           [--companies N] [--drives-per-company N] [--applications-per-student N]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+PASSWORD = "password123"
+BATCH_SIZE = 10_000
+# Copied into the resume store and shared by 70% of the students
+SAMPLE_RESUME = os.path.join(ROOT, "benchmarks", "sample_resume.pdf")
+
+DEPARTMENTS = ["CSE", "ECE", "Mechanical", "Civil", "Electrical", "Chemical", "IT", "Biotech"]
+FIRST_NAMES = ["Aarav", "Diya", "Kabir", "Meera", "Rohan", "Sneha", "Vivaan", "Ishita", "Arjun", "Priya",
+               "Aditya", "Ananya", "Karan", "Nisha", "Rahul", "Pooja", "Siddharth", "Tanvi", "Yash", "Zoya"]
+LAST_NAMES = ["Sharma", "Patel", "Iyer", "Reddy", "Gupta", "Nair", "Das", "Mehta", "Joshi", "Khan"]
+INDUSTRIES = ["IT", "Finance", "Consulting", "Manufacturing", "Healthcare", "E-commerce", "Automobile"]
+JOB_TITLES = ["Software Engineer", "Data Analyst", "Design Engineer", "Business Analyst",
+              "Graduate Engineer Trainee", "Product Manager", "QA Engineer", "Site Engineer"]
+LOCATIONS = ["Bengaluru", "Pune", "Hyderabad", "Chennai", "Mumbai", "Gurugram", "Remote"]
+STATUSES = ["pending"] * 6 + ["Shortlisted"] * 2 + ["Rejected"] * 2 + ["Selected"]
+
+def use_database(path):
+    """Point app.py at ``path``; must run before app is imported."""
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.abspath(path)}"
+
+def _batches(rows, size=BATCH_SIZE):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+def _bulk_insert(statement, rows):
+    from Models.model import db
+
+    for batch in _batches(rows):
+        db.session.execute(statement, batch)
+        db.session.commit()
+
+def _student_rows(count, rng, now, resume):
+    for i in range(count):
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        joining_year = rng.choice((2021, 2022, 2023, 2024))
+        yield {
+            "student_name": f"{first} {last}",
+            "student_email": f"{first.lower()}.{last.lower()}{i}@college.edu",
+            "student_password_hash": "",
+            "student_phone": f"9{rng.randrange(10**9):09d}",
+            "student_department": rng.choice(DEPARTMENTS),
+            "student_cgpa": round(rng.uniform(5.5, 10.0), 2),
+            "student_joining_year": joining_year,
+            "student_graduation_year": joining_year + 4,
+            "student_resume_filename": resume if rng.random() < 0.7 else None,
+            "student_is_blacklisted": rng.random() < 0.01,
+            "created_at": now - timedelta(minutes=count - i),
+        }
+
+def _company_rows(count, rng, now):
+    for i in range(count):
+        approved = rng.random() < 0.85
+        yield {
+            "company_name": f"{rng.choice(LAST_NAMES)} {rng.choice(INDUSTRIES)} {i}",
+            "company_email": f"hr{i}@company{i}.com",
+            "company_password_hash": "",
+            "company_hr_contact_name": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+            "company_hr_contact_email": f"contact{i}@company{i}.com",
+            "company_industry": rng.choice(INDUSTRIES),
+            "approval_status": "approved" if approved else "pending",
+            "company_is_approved": approved,
+            "created_at": now - timedelta(hours=count - i),
+        }
+
+def _drive_rows(company_ids, per_company, rng, now):
+    today = date.today()
+    for company_id in company_ids:
+        for _ in range(per_company):
+            status = rng.choice(("open", "open", "closed", "pending"))
+            deadline = today + timedelta(days=rng.randint(1, 60) if status != "closed" else -rng.randint(1, 365))
+            yield {
+                "company_id": company_id,
+                "drive_name": f"Campus Drive {deadline.year}",
+                "job_title": rng.choice(JOB_TITLES),
+                "job_description": "Build and maintain products with a cross-functional team.",
+                "job_location": rng.choice(LOCATIONS),
+                "job_type": rng.choice(("Full-time", "Internship")),
+                "job_salary_range": f"{rng.randint(3, 12)}-{rng.randint(13, 40)} LPA",
+                "job_no_of_positions": rng.randint(1, 50),
+                "min_cgpa": rng.choice((None, 6.0, 7.0, 7.5, 8.0)),
+                "allowed_departments": ", ".join(rng.sample(DEPARTMENTS, rng.randint(1, 3))) if rng.random() < 0.8 else None,
+                "allowed_graduation_years": str(rng.choice((2025, 2026, 2027, 2028))) if rng.random() < 0.8 else None,
+                "application_deadline": deadline,
+                "drive_is_approved": status != "pending",
+                "drive_status": status,
+                "created_at": now - timedelta(minutes=rng.randrange(525_600)),
+            }
+
+def _application_rows(student_ids, drive_ids, per_student, rng, now):
+    for student_id in student_ids:
+        for drive_id in rng.sample(drive_ids, min(per_student, len(drive_ids))):
+            yield {
+                "student_id": student_id,
+                "job_id": drive_id,
+                "application_status": rng.choice(STATUSES),
+                "application_date": now - timedelta(minutes=rng.randrange(525_600)),
+            }
+
+def seed(students=20_000, companies=200, drives_per_company=5, applications_per_student=10, random_seed=42):
+    """Insert a synthetic dataset into the app's database and rebuild the rollups.
+
+    Must run inside an app context. Returns the number of rows per table.
+    """
+    from sqlalchemy import insert, select, update
+    from werkzeug.security import generate_password_hash
+    from Models.model import db, Student, Company, PlacementDrive, Application
+    from Services.accounts import backfill_accounts
+    from Services.eligibility import rebuild_eligibility
+    from Services.resume_store import save_resume
+    from Services.salary import backfill_salaries
+    from Services.statistics import rebuild_statistics
+
+    rng = random.Random(random_seed)
+    now = datetime.utcnow()
+
+    with open(SAMPLE_RESUME, "rb") as sample:
+        resume = save_resume(sample)
+    _bulk_insert(insert(Student), _student_rows(students, rng, now, resume))
+    _bulk_insert(insert(Company), _company_rows(companies, rng, now))
+
+    company_ids = db.session.execute(select(Company.company_id)).scalars().all()
+    _bulk_insert(insert(PlacementDrive), _drive_rows(company_ids, drives_per_company, rng, now))
+
+    student_ids = db.session.execute(select(Student.student_id)).scalars().all()
+    drive_ids = db.session.execute(
+        select(PlacementDrive.drive_id).where(PlacementDrive.drive_is_approved == True)
+    ).scalars().all()
+    _bulk_insert(insert(Application), _application_rows(student_ids, drive_ids, applications_per_student, rng, now))
+
+    # Hashing is slow on purpose, so every account shares one hash
+    password_hash = generate_password_hash(PASSWORD)
+    db.session.execute(update(Student).where(Student.student_password_hash == "").values(student_password_hash=password_hash))
+    db.session.execute(update(Company).where(Company.company_password_hash == "").values(company_password_hash=password_hash))
+    db.session.commit()
+
+    # Bulk inserts skip the ORM events that keep these up to date
+    backfill_salaries(db.session.connection())
+    backfill_accounts()
+    rebuild_statistics()
+    rebuild_eligibility()
+
+    return {
+        model.__tablename__: db.session.query(model).count()
+        for model in (Student, Company, PlacementDrive, Application)
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("database", help="SQLite file to create or extend")
+    parser.add_argument("--students", type=int, default=20_000)
+    parser.add_argument("--companies", type=int, default=200)
+    parser.add_argument("--drives-per-company", type=int, default=5)
+    parser.add_argument("--applications-per-student", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    use_database(args.database)
+    from app import app
+    from Services.setup import create_default_admin, init_database
+
+    start = time.perf_counter()
+    with app.app_context():
+        init_database()
+        create_default_admin()
+        counts = seed(args.students, args.companies, args.drives_per_company, args.applications_per_student, args.seed)
+
+    for table, count in counts.items():
+        print(f"{table:<16}{count:>10}")
+    print(f"Seeded in {time.perf_counter() - start:.1f}s, password for every account: {PASSWORD}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Time a fresh `import app` (what every gunicorn worker and CLI call pays).
+
+Each run is a new interpreter against an already initialised database, so
+the numbers include imports, app setup and any SQL executed at import time.
+
+Usage: python benchmarks/startup_benchmark.py [runs]
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = """
+import json, time
+start = time.perf_counter()
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+statements = []
+event.listen(Engine, "before_cursor_execute", lambda *arguments: statements.append(arguments[2]))
+import app
+print(json.dumps({"seconds": time.perf_counter() - start, "statements": len(statements)}))
+"""
+
+def probe(environment):
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE], cwd=ROOT, env=environment, capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+
+    with tempfile.TemporaryDirectory() as directory:
+        environment = dict(os.environ, DATABASE_URL=f"sqlite:///{os.path.join(directory, 'startup.db')}")
+
+        # Create the schema and default admin once, as a deployment would
+        subprocess.run([sys.executable, "-m", "flask", "--app", "app", "init-db"], cwd=ROOT, env=environment,
+                       capture_output=True)
+        probe(environment)
+
+        results = [probe(environment) for _ in range(runs)]
+
+    times = [result["seconds"] * 1000 for result in results]
+    print(f"import app, {runs} runs: median {statistics.median(times):.0f} ms, "
+          f"min {min(times):.0f} ms, SQL statements {results[0]['statements']}")
+
+if __name__ == "__main__":
+    main()
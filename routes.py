@@ -0,0 +1,1165 @@
+import json
+import click
+import os
+import uuid
+from sqlalchemy import or_
+from sqlalchemy.exc import IntegrityError
+from flask import Blueprint, Response, current_app, abort, g, jsonify, redirect, url_for, render_template, request, session, flash, stream_with_context
+from sqlalchemy import func
+from Models.model import *
+from Models.migrations import MigrationError, upgrade
+from Services.accounts import backfill_accounts, display_name, email_taken, find_account
+from Services.application_queue import APPLIED, REPLAYED, DUPLICATE, KEY_REUSED, CLOSED, NOT_ELIGIBLE, FILLED, application_queue
+from Services.application_status import bulk_update_status
+from Services.analytics import placement_analytics
+from Services.fragment_cache import fragment_cache, table_versions
+from Services.live_updates import ADMIN_EVENTS, COMPANY_EVENTS, live_updates
+from Services.drive_feed import application_statuses, feed_etag, feed_version, student_feed
+from Services.eligibility import eligible_student_count, rebuild_eligibility
+from Services.export import EXPORTS, export_csv
+from Services.counts import drive_application_counts, total_counts
+from Services.metrics import request_metrics
+from Services.moderation import moderate
+from Services.pagination import keyset_page
+from Services.statistics import dashboard_counters, placement_statistics, rebuild_statistics
+from Services.resume_index import enqueue_changed_resumes, enqueue_resume, resume_search, run_worker, students_with_skills
+from Services.resume_store import InvalidResume, is_content_addressed, save_resume, send_resume
+from Services.scheduler import close_expired_drives
+from Services.query_plans import full_table_scans, recorded_statements
+from Services.student_import import BATCH_SIZE, import_students, import_worker
+from Services.setup import create_default_admin, init_database
+from Services.search import SEARCH_RESULT_LIMIT, use_fts5, ranked_search
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, date, timedelta
+from functools import wraps
+from markupsafe import Markup
+from werkzeug.security import generate_password_hash
+
+bp = Blueprint("portal", __name__, cli_group=None)
+
+@bp.cli.command("close-expired-drives")
+def close_expired_drives_command():
+    """Close every open drive whose application deadline has passed."""
+    print(f"Closed {close_expired_drives()} expired drives.")
+
+@bp.cli.command("backfill-accounts")
+def backfill_accounts_command():
+    """Add login index rows for students, companies and admins that lack one."""
+    added, skipped = backfill_accounts()
+    for role, count in added.items():
+        print(f"Added {count} {role} accounts.")
+    for email in skipped:
+        print(f"Skipped {email}: email already used by another account.")
+
+@bp.cli.command("init-db")
+def init_db_command():
+    """Create the schema, search indexes and rollups, and the default admin."""
+    try:
+        applied = init_database()
+    except MigrationError as error:
+        print(f"Migration stopped: {error}")
+        raise SystemExit(1)
+    if applied:
+        print(f"Applied: {', '.join(applied)}")
+    if create_default_admin():
+        print("Default admin created!")
+    print("Database is ready.")
+
+@bp.cli.command("db-upgrade")
+def db_upgrade_command():
+    """Bring an existing placement_portal.db up to the current schema."""
+    try:
+        applied = upgrade(db.engine)
+    except MigrationError as error:
+        print(f"Migration stopped: {error}")
+        raise SystemExit(1)
+    print(f"Applied: {', '.join(applied)}" if applied else "Database is up to date.")
+
+@bp.cli.command("check-query-plans")
+def check_query_plans_command():
+    """Render the dashboards and fail if any of their queries scans a whole table."""
+    statements = hot_path_statements()
+    scans = full_table_scans(db.engine, statements)
+    for statement, detail in scans:
+        print(f"{detail}\n    {' '.join(statement.split())}\n")
+
+    print(f"Checked {len(statements)} queries, {len(scans)} full table scans.")
+    if scans:
+        raise SystemExit(1)
+
+def hot_path_statements():
+    """The SELECTs behind the admin dashboard, its section pages and a company dashboard with its applicant lists."""
+    client = current_app.test_client()
+    company = Company.query.first()
+    oldest_cursor = f"{datetime.now().isoformat()}~{2**31}"
+
+    with recorded_statements(db.engine) as statements:
+        with client.session_transaction() as sess:
+            sess.update(user_id=1, user_role='admin', username='admin')
+        client.get(url_for_path('portal.admin_dashboard'))
+        for section in ADMIN_SECTIONS:
+            client.get(url_for_path('portal.admin_dashboard_section', section=section, after=oldest_cursor))
+
+        if company:
+            with client.session_transaction() as sess:
+                sess.update(user_id=company.company_id, user_role='company', username=company.company_name)
+            client.get(url_for_path('portal.company_dashboard'))
+            drive = PlacementDrive.query.filter_by(company_id=company.company_id).first()
+            if drive:
+                client.get(url_for_path('portal.company_drive_applicants', drive_id=drive.drive_id))
+                client.get(url_for_path('portal.company_drive_applicants', drive_id=drive.drive_id, after=oldest_cursor))
+
+    return statements
+
+def url_for_path(endpoint, **values):
+    with current_app.test_request_context():
+        return url_for(endpoint, **values)
+
+@bp.cli.command("import-students")
+@click.argument("csv_path", type=click.Path(exists=True, dir_okay=False))
+@click.option("--workers", type=int, default=None, help="Password hashing processes (default: one per core).")
+@click.option("--batch-size", type=int, default=BATCH_SIZE, help="Rows inserted per transaction.")
+def import_students_command(csv_path, workers, batch_size):
+    """Import students from a CSV file."""
+    with open(csv_path, newline="", encoding="utf-8") as csv_file, \
+            ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        report = import_students(csv_file, pool, batch_size)
+
+    for line, email, message in report.errors:
+        print(f"Line {line} ({email}): {message}")
+    print(f"Imported {report.imported} students, skipped {len(report.errors)} rows.")
+
+@bp.cli.command("export")
+@click.argument("kind", type=click.Choice(list(EXPORTS)))
+@click.option("--output", "-o", type=click.File("w", encoding="utf-8"), default="-", help="CSV file (default: stdout).")
+@click.option("--drive", "drive_id", type=int, default=None)
+@click.option("--company", "company_id", type=int, default=None)
+@click.option("--status", default=None)
+@click.option("--year", type=int, default=None)
+def export_command(kind, output, drive_id, company_id, status, year):
+    """Export applications, students or drives as CSV."""
+    for chunk in export_csv(kind, drive_id=drive_id, company_id=company_id, status=status, year=year):
+        output.write(chunk)
+
+@bp.cli.command("resume-worker")
+@click.option("--workers", type=int, default=None, help="Extraction processes (default: one per core).")
+@click.option("--once", is_flag=True, help="Stop when the queue is empty.")
+def resume_worker_command(workers, once):
+    """Extract text from queued resumes into the resume search index."""
+    queued = enqueue_changed_resumes()
+    if queued:
+        print(f"Queued {queued} new or changed resumes.")
+    handled = run_worker(workers, once)
+    print(f"Processed {handled} resumes.")
+
+@bp.cli.command("reindex-resumes")
+def reindex_resumes_command():
+    """Queue resumes that are new or changed since they were last indexed."""
+    print(f"Queued {enqueue_changed_resumes()} resumes.")
+
+@bp.cli.command("rebuild-eligibility")
+def rebuild_eligibility_command():
+    """Recompute which students meet the criteria of every drive."""
+    print(f"{rebuild_eligibility()} eligible (drive, student) pairs.")
+
+@bp.cli.command("rebuild-statistics")
+def rebuild_statistics_command():
+    """Recompute placement statistics and dashboard counters from scratch."""
+    drift = rebuild_statistics()
+    if drift:
+        print("Rollups had drifted:")
+        for line in drift:
+            print(f"  {line}")
+    else:
+        print("Rollups were up to date.")
+
+def admin_required(f):
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        if 'user_role' not in session or session['user_role'] != 'admin':
+            flash("Unauthorized access!", "danger")
+            return redirect(url_for('portal.login'))
+        return f(*args, **kwargs)
+    return decorated_function
+
+def company_required(f):
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        if 'user_role' not in session or session['user_role'] != 'company':
+            flash("Unauthorized access!", "danger")
+            return redirect(url_for('portal.login'))
+        return f(*args, **kwargs)
+    return decorated_function
+
+def student_required(f):
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        if 'user_role' not in session or session['user_role'] != 'student':
+            flash("Unauthorized access!", "danger")
+            return redirect(url_for('portal.login'))
+        return f(*args, **kwargs)
+    return decorated_function
+    
+@bp.route('/',methods=['GET','POST'])
+def landing_page():
+    return render_template('landing_page.html')
+
+@bp.route("/signup", methods=["GET", "POST"])
+def signup():
+    role = request.args.get("role", "student")
+    return render_template("signup.html", role=role)
+
+@bp.route("/student/signup", methods=["POST", "GET"])
+def student_signup():
+    if request.method == "POST":
+        student_name = request.form.get("student_name")
+        student_email = request.form.get("student_email")
+        student_password = request.form.get("student_password")
+        student_department = request.form.get("student_department")
+        student_cgpa = float(request.form.get("student_cgpa"))
+        student_joining_year = int(request.form.get("student_joining_year"))
+        student_graduation_year = int(request.form.get("student_graduation_year"))
+
+        if email_taken(student_email):
+            flash("Email already exists. Please use a different email.", "danger")
+            return redirect(url_for('portal.signup', role='student'))
+
+        new_student = Student(
+            student_name=student_name,
+            student_email=student_email,
+            student_department=student_department,
+            student_cgpa=student_cgpa,
+            student_joining_year=student_joining_year,
+            student_graduation_year=student_graduation_year
+        )
+
+        new_student.set_password(student_password)
+
+        try:
+            db.session.add(new_student)
+            db.session.commit()
+            flash("Student registered successfully!", "success")
+            return redirect(url_for('portal.login'))
+        except IntegrityError:
+            db.session.rollback()
+            flash("Email already exists. Please use a different email.", "danger")
+    return redirect(url_for('portal.signup', role='student'))
+
+@bp.route("/company/signup", methods=["POST"])
+def company_signup():
+    if request.method == "POST":
+        company_name = request.form.get("company_name")
+        company_email = request.form.get("company_email")
+        company_password = request.form.get("company_password")
+        company_hr_contact_name = request.form.get("company_hr_contact_name")
+        company_hr_contact_email = request.form.get("company_hr_contact_email")
+        company_industry = request.form.get("company_industry")
+
+        if email_taken(company_email):
+            flash("Email already exists. Please use a different email.", "danger")
+            return redirect(url_for('portal.signup', role='company'))
+
+        new_company = Company(
+            company_name=company_name,
+            company_email=company_email,
+            company_hr_contact_name=company_hr_contact_name,
+            company_hr_contact_email=company_hr_contact_email,
+            company_industry=company_industry
+        )
+
+        new_company.set_password(company_password)
+
+        try:
+            db.session.add(new_company)
+            db.session.commit()
+            flash("Company registered successfully! Awaiting admin approval.", "success")
+            return redirect(url_for('portal.login'))
+        except IntegrityError:
+            db.session.rollback()
+            flash("Email already exists. Please use a different email.", "danger")
+    return redirect(url_for('portal.signup', role='company'))
+
+@bp.route("/login", methods=["GET", "POST"])
+def login():
+    if session.get("user_id") and session.get("user_role"):
+        if session["user_role"] == "admin":
+            return redirect(url_for("portal.admin_dashboard"))
+        elif session["user_role"] == "company":
+            return redirect(url_for("portal.company_dashboard"))
+        elif session["user_role"] == "student":
+            return redirect(url_for("portal.student_dashboard"))
+
+    if request.method == "POST":
+        session.clear() 
+
+        email = request.form.get("email")
+        password = request.form.get("password")
+
+        # One lookup in the account index finds the user whatever their role
+        account = find_account(email)
+
+        if account and account.check_password(password):
+
+            if account.account_role == 'company':
+                company = db.session.get(Company, account.account_user_id)
+
+                # Blacklisted
+                if company.company_is_blacklisted:
+                    flash("Your account has been blacklisted by admin.", "dark")
+                    return redirect(url_for('portal.login'))
+
+                # Rejected
+                if company.company_is_rejected:
+                    flash("Your registration was rejected by admin.", "danger")
+                    return redirect(url_for('portal.login'))
+
+                # Not Approved Yet
+                if not company.company_is_approved:
+                    flash("Your account is pending admin approval.", "warning")
+                    return redirect(url_for('portal.login'))
+
+            # Approved → Login Allowed
+            session['user_id'] = account.account_user_id
+            session['user_role'] = account.account_role
+            set_session_username(account.account_display_name)
+            flash(f"Logged in successfully as {account.account_role}!", "success")
+            return redirect(url_for(f"portal.{account.account_role}_dashboard"))
+
+        flash("Invalid email or password. Please try again.", "danger")
+    return render_template("login.html")
+
+@bp.route("/logout")
+def logout():
+    session.clear()
+    flash("Logged out successfully!", "success")
+    return redirect(url_for('portal.login'))
+
+def current_username():
+    """Navbar name of the logged in user.
+
+    It is written to the session at login, so rendering costs no queries. Older
+    sessions without it pay one lookup per request (memoized in g) and then
+    carry it too. Any route that renames a user should call
+    set_session_username with the new name.
+    """
+    if 'user_role' not in session:
+        return None
+
+    if 'username' not in session:
+        if 'username' not in g:
+            g.username = display_name(session['user_role'], session['user_id'])
+        session['username'] = g.username
+
+    return session['username']
+
+def set_session_username(name):
+    session['username'] = name
+    g.username = name
+
+@bp.app_context_processor
+def inject_user():
+    return dict(username=current_username())
+
+#Admin Dashboard sections: (template, collection name, sort column, key column)
+ADMIN_SECTIONS = {
+    "students": ("partials/admin_students.html", "students", Student.created_at, Student.student_id),
+    "registered_companies": ("partials/admin_registered_companies.html", "registered_companies", Company.created_at, Company.company_id),
+    "company_applications": ("partials/admin_company_applications.html", "companies", Company.created_at, Company.company_id),
+    "drives": ("partials/admin_drives.html", "drives", PlacementDrive.created_at, PlacementDrive.drive_id),
+    "applications": ("partials/admin_applications.html", "applications", Application.application_date, Application.application_id),
+}
+
+#Tables shown by each section, a change to any of them invalidates its cached pages
+ADMIN_SECTION_TABLES = {
+    "students": ("student",),
+    "registered_companies": ("company",),
+    "company_applications": ("company",),
+    "drives": ("placement_drive", "company"),
+    "applications": ("application", "student", "placement_drive", "company"),
+}
+
+def admin_section_query(section):
+    if section == "students":
+        return Student.query
+
+    if section == "registered_companies":
+        return Company.query.filter(Company.company_is_approved == True)
+
+    if section == "company_applications":
+        return Company.query
+
+    if section == "drives":
+        return PlacementDrive.query.options(
+            eager_load(PlacementDrive.company)
+        )
+
+    return Application.query.options(
+        eager_load(Application.student),
+        eager_load(Application.placement_drive, PlacementDrive.company)
+    )
+
+def admin_search_conditions(section, search_query):
+    if section == "students":
+        student_conditions = [
+            Student.student_name.ilike(f"%{search_query}%"),
+            Student.student_email.ilike(f"%{search_query}%"),
+            Student.student_phone.ilike(f"%{search_query}%"),
+            Student.student_department.ilike(f"%{search_query}%"),
+            Student.student_id.in_(
+                db.select(ResumeText.student_id).where(ResumeText.resume_text.ilike(f"%{search_query}%"))
+            )
+        ]
+
+        if search_query.isdigit():
+            student_conditions.append(Student.student_id == int(search_query))
+
+        return student_conditions
+
+    return [
+        Company.company_name.ilike(f"%{search_query}%"),
+        Company.company_email.ilike(f"%{search_query}%"),
+        Company.company_industry.ilike(f"%{search_query}%")
+    ]
+
+def admin_section_page(section, search_query, cursor=None):
+    template, name, sort_column, key_column = ADMIN_SECTIONS[section]
+    query = admin_section_query(section)
+    searchable = section in ("students", "registered_companies", "company_applications")
+
+    if search_query and searchable and use_fts5(search_query):
+        # Ranked full-text matches come back as one limited page
+        if cursor:
+            return {name: []}, None
+
+        model = Student if section == "students" else Company
+        rows = ranked_search(query, model, search_query)
+
+        if section == "students":
+            if search_query.isdigit():
+                student = db.session.get(Student, int(search_query))
+                if student and student not in rows:
+                    rows.insert(0, student)
+
+            # Then students whose resume mentions the search terms
+            for student in resume_search(query, search_query, SEARCH_RESULT_LIMIT):
+                if student not in rows:
+                    rows.append(student)
+
+        return {name: rows}, None
+
+    if search_query and searchable:
+        query = query.filter(or_(*admin_search_conditions(section, search_query)))
+
+    rows, next_cursor = keyset_page(query, sort_column, key_column, cursor)
+    return {name: rows}, next_cursor
+
+def render_admin_section(section, search_query, cursor=None, versions=None):
+    """One page of a dashboard section as HTML; pages without a search are cached."""
+    current_year = datetime.now().year
+
+    def render():
+        rows, next_cursor = admin_section_page(section, search_query, cursor)
+        return render_template(
+            ADMIN_SECTIONS[section][0],
+            current_year=current_year,
+            search_query=search_query,
+            cursor=cursor,
+            next_cursor=next_cursor,
+            **rows
+        )
+
+    if search_query:
+        return Markup(render())
+
+    return fragment_cache.render(
+        section, ADMIN_SECTION_TABLES[section], render, cursor, current_year, versions=versions
+    )
+
+#Admin Dashboard
+@bp.route("/admin/dashboard")
+@admin_required
+def admin_dashboard():
+    current_year = datetime.now().year
+    
+    #Statistics
+    counters = dashboard_counters()
+
+    #Search Functionality
+    search_query = request.args.get('search', '').strip()
+
+    #First page of every section, the rest is fetched by admin_dashboard_section
+    versions = None if search_query else table_versions()
+    sections = {
+        section: render_admin_section(section, search_query, versions=versions)
+        for section in ADMIN_SECTIONS
+    }
+
+    return render_template(
+    "admin_dashboard.html",
+    current_year=current_year,
+    placement_statistics=placement_statistics(),
+    analytics=placement_analytics(),
+    search_query=search_query,
+    sections=sections,
+    **counters
+)
+
+@bp.route("/admin/dashboard/<section>")
+@admin_required
+def admin_dashboard_section(section):
+    if section not in ADMIN_SECTIONS:
+        abort(404)
+
+    search_query = request.args.get('search', '').strip()
+    cursor = request.args.get('after')
+
+    return render_admin_section(section, search_query, cursor)
+
+@bp.route("/admin/metrics")
+@admin_required
+def metrics():
+    cache_lines = ["# TYPE portal_fragment_cache_requests_total counter"]
+    for name, counts in fragment_cache.stats()["fragments"].items():
+        for result in ("hits", "misses"):
+            cache_lines.append(f'portal_fragment_cache_requests_total{{fragment="{name}",result="{result}"}} {counts[result]}')
+
+    queue_stats = application_queue.stats()
+    live_stats = live_updates.bus.stats()
+    cache_lines += [
+        "# TYPE portal_live_subscribers gauge",
+        f"portal_live_subscribers {live_stats['subscribers']}",
+        "# TYPE portal_live_events_total counter",
+        f"portal_live_events_total {live_stats['published']}",
+        "# TYPE portal_application_batches_total counter",
+        f"portal_application_batches_total {queue_stats['batches']}",
+        "# TYPE portal_applications_written_total counter",
+        f"portal_applications_written_total {queue_stats['applications']}",
+    ]
+
+    return Response(request_metrics.prometheus(cache_lines), mimetype="text/plain; version=0.0.4")
+
+def live_response(subscription):
+    response = Response(live_updates.stream(subscription), mimetype="text/event-stream")
+    response.headers["Cache-Control"] = "no-cache"
+    # Stops nginx from buffering the stream
+    response.headers["X-Accel-Buffering"] = "no"
+    return response
+
+@bp.route("/admin/live")
+@admin_required
+def admin_live_updates():
+    return live_response(live_updates.subscribe(ADMIN_EVENTS, last_event_id=request.headers.get("Last-Event-ID")))
+
+@bp.route("/admin/analytics")
+@admin_required
+def analytics():
+    return jsonify(placement_analytics())
+
+@bp.route("/admin/cache/stats")
+@admin_required
+def fragment_cache_stats():
+    return jsonify(fragment_cache.stats())
+
+#Admin-Moderation
+# Outcome of a single-id moderation -> (flash message, flash category); an id
+# already in the target state gets the "updated" message
+MODERATION_MESSAGES = {
+    ("company", "approve"): {
+        "updated": ("Company approved successfully!", "success"),
+        "blacklisted": ("Cannot approve a blacklisted company.", "danger"),
+    },
+    ("company", "reject"): {
+        "updated": ("Company rejected successfully!", "warning"),
+        "blacklisted": ("Cannot reject a blacklisted company.", "danger"),
+    },
+    ("company", "blacklist"): {"updated": ("Company blacklisted.", "danger")},
+    ("company", "unblacklist"): {"updated": ("Company unblacklisted successfully.", "success")},
+    ("company", "toggle_blacklist"): {"updated": ("Company status updated!", "success")},
+    ("drive", "approve"): {
+        "updated": ("Drive approved successfully!", "success"),
+        "rejected": ("Rejected drive cannot be approved.", "danger"),
+    },
+    ("drive", "reject"): {"updated": ("Drive rejected successfully!", "warning")},
+    ("drive", "close"): {
+        "updated": ("Drive marked as completed.", "success"),
+        "unchanged": ("Drive already closed.", "info"),
+        "not_approved": ("Only approved drives can be closed.", "danger"),
+    },
+}
+
+def moderate_one(kind, action, id_):
+    """Moderate a single row through the batch path; 404 when it does not exist."""
+    result = moderate(kind, action, [id_])[id_]
+    if result == "not_found":
+        abort(404)
+
+    messages = MODERATION_MESSAGES.get((kind, action))
+    if messages:
+        flash(*messages.get(result, messages["updated"]))
+    return result
+
+def requested_ids(payload, name):
+    """The ``name`` ids of a JSON body (a list of integers) or of repeated form fields.
+
+    Raises ValueError for anything else, a bare string or number included.
+    """
+    if request.is_json:
+        ids = payload.get(name)
+        if not isinstance(ids, list) or not all(type(id_) is int for id_ in ids):
+            raise ValueError(f"{name} must be a list of integers")
+        return ids
+    return [int(id_) for id_ in request.form.getlist(name)]
+
+@bp.route("/admin/moderate", methods=["POST"])
+@admin_required
+def moderate_batch():
+    payload = request.get_json(silent=True) or {}
+    kind = payload.get("kind") or request.form.get("kind")
+    action = payload.get("action") or request.form.get("action")
+
+    try:
+        results = moderate(kind, action, requested_ids(payload, "ids"))
+    except (KeyError, TypeError, ValueError):
+        if request.is_json:
+            return jsonify(error="Invalid kind, action or ids."), 400
+        flash("Invalid moderation request.", "danger")
+        return redirect(url_for("portal.admin_dashboard"))
+
+    if request.is_json:
+        return jsonify(kind=kind, action=action, results=results)
+
+    outcomes = Counter(results.values())
+    flash(f"{outcomes.pop('updated', 0)} {kind} records updated.", "success")
+    for outcome, count in sorted(outcomes.items()):
+        flash(f"{count} skipped: {outcome.replace('_', ' ')}.", "warning")
+    return redirect(url_for("portal.admin_dashboard"))
+
+#Admin-Student Management Routes
+@bp.route("/admin/student/blacklist/<int:student_id>", methods=["POST"])
+@admin_required
+def blacklist_student(student_id):
+    moderate_one("student", "blacklist", student_id)
+    student = db.session.get(Student, student_id)
+    flash(f"{student.student_name} is blacklisted", "dark")
+    return redirect(url_for("portal.admin_dashboard"))
+
+@bp.route("/admin/student/toggle_blacklist/<int:student_id>", methods=["POST"])
+@admin_required
+def toggle_blacklist_student(student_id):
+    moderate_one("student", "toggle_blacklist", student_id)
+    student = db.session.get(Student, student_id)
+
+    if student.student_is_blacklisted:
+        flash(f"{student.student_name} has been blacklisted.", "danger")
+    else:
+        flash(f"{student.student_name} has been unblacklisted.", "success")
+
+    return redirect(url_for("portal.admin_dashboard"))
+
+@bp.route("/admin/student/import", methods=["POST"])
+@admin_required
+def import_students_upload():
+    upload = request.files.get("students_csv")
+
+    if not upload or not upload.filename:
+        flash("Please choose a CSV file to import.", "danger")
+        return redirect(url_for("portal.admin_dashboard"))
+
+    # Hashing thousands of passwords takes minutes, so the import runs in the background
+    import_id = import_worker.submit(upload.stream, upload.filename)
+    flash("Import started, this page shows the result when it is done.", "success")
+    return redirect(url_for("portal.import_status", import_id=import_id))
+
+@bp.route("/admin/student/import/<int:import_id>")
+@admin_required
+def import_status(import_id):
+    job = db.get_or_404(StudentImport, import_id)
+    return render_template("import_status.html", job=job, errors=json.loads(job.errors or "[]"))
+
+@bp.route("/admin/export/<kind>.csv")
+@admin_required
+def export_data(kind):
+    if kind not in EXPORTS:
+        abort(404)
+
+    filters = {
+        "drive_id": request.args.get("drive", type=int),
+        "company_id": request.args.get("company", type=int),
+        "status": request.args.get("status") or None,
+        "year": request.args.get("year", type=int),
+    }
+
+    # Rows are read and written a chunk at a time while the response is sent
+    response = Response(stream_with_context(export_csv(kind, **filters)), mimetype="text/csv")
+    response.headers["Content-Disposition"] = f"attachment; filename={kind}.csv"
+    return response
+
+#Admin-Company Management Routes
+@bp.route("/admin/company/approve/<int:company_id>", methods=["POST"])
+@admin_required
+def approve_company(company_id):
+    moderate_one("company", "approve", company_id)
+    return redirect(url_for("portal.admin_dashboard"))
+
+@bp.route("/admin/company/reject/<int:company_id>", methods=["POST"])
+@admin_required
+def reject_company(company_id):
+    moderate_one("company", "reject", company_id)
+    return redirect(url_for("portal.admin_dashboard"))
+
+@bp.route("/admin/company/blacklist/<int:company_id>", methods=["POST"])
+@admin_required
+def blacklist_company(company_id):
+    moderate_one("company", "blacklist", company_id)
+    return redirect(url_for("portal.admin_dashboard"))
+
+@bp.route("/admin/company/unblacklist/<int:company_id>", methods=["POST"])
+@admin_required
+def unblacklist_company(company_id):
+    moderate_one("company", "unblacklist", company_id)
+    return redirect(url_for("portal.admin_dashboard"))
+
+@bp.route("/admin/company/toggle_blacklist/<int:company_id>", methods=["POST"])
+@admin_required
+def toggle_blacklist_company(company_id):
+    moderate_one("company", "toggle_blacklist", company_id)
+    return redirect(url_for("portal.admin_dashboard"))
+
+#Admin-Drives
+@bp.route("/admin/drive/approve/<int:drive_id>", methods=["POST"])
+@admin_required
+def approve_drive(drive_id):
+    moderate_one("drive", "approve", drive_id)
+    return redirect(url_for("portal.admin_dashboard"))
+
+@bp.route("/admin/drive/reject/<int:drive_id>", methods=["POST"])
+@admin_required
+def reject_drive(drive_id):
+    moderate_one("drive", "reject", drive_id)
+    return redirect(url_for("portal.admin_dashboard"))
+
+@bp.route("/admin/drive/close/<int:drive_id>", methods=["POST"])
+@admin_required
+def close_drive(drive_id):
+    moderate_one("drive", "close", drive_id)
+    return redirect(url_for("portal.admin_dashboard"))
+
+#Admin-Student Application Details Modal
+@bp.route("/admin/view_resume/<int:application_id>")
+@admin_required
+def view_resume(application_id):
+
+    application = Application.query.get_or_404(application_id)
+
+    resume_filename = application.student.student_resume_filename
+
+    if not resume_filename:
+        flash("Resume not uploaded.", "warning")
+        return redirect(url_for("portal.admin_dashboard"))
+
+    # Stored resumes have a permanent URL that browsers can cache
+    if is_content_addressed(resume_filename):
+        return redirect(url_for("portal.resume_file", filename=resume_filename))
+
+    return send_resume(resume_filename)
+
+@bp.route("/resumes/<filename>")
+def resume_file(filename):
+    role = session.get("user_role")
+
+    if role == "student":
+        student = db.session.get(Student, session["user_id"])
+        allowed = student is not None and student.student_resume_filename == filename
+    elif role == "company":
+        # Only the resumes of students who applied to one of this company's drives
+        allowed = db.session.query(
+            db.select(Application.application_id)
+            .join(Student, Student.student_id == Application.student_id)
+            .join(PlacementDrive, PlacementDrive.drive_id == Application.job_id)
+            .where(Student.student_resume_filename == filename, PlacementDrive.company_id == session["user_id"])
+            .exists()
+        ).scalar()
+    else:
+        allowed = role == "admin"
+
+    if not allowed:
+        abort(404)
+
+    return send_resume(filename)
+
+#Company 
+@bp.route("/company/dashboard")
+@company_required
+def company_dashboard():
+
+    company_id = session["user_id"]
+
+    pending_drives = PlacementDrive.query.filter_by(
+        company_id=company_id,
+        drive_status="pending"
+    ).all()
+
+    approved_drives = PlacementDrive.query.filter_by(
+        company_id=company_id,
+        drive_status="open"
+    ).all()
+
+    rejected_drives = PlacementDrive.query.filter_by(
+        company_id=company_id,
+        drive_status="rejected"
+    ).all()
+
+    closed_drives = PlacementDrive.query.filter_by(
+        company_id=company_id,
+        drive_status="closed"
+    ).all()
+
+    # Counts only, the applicants of a drive are fetched page by page from
+    # company_drive_applicants when its modal opens
+    open_drive_ids = [drive.drive_id for drive in approved_drives]
+    application_counts = drive_application_counts(open_drive_ids + [drive.drive_id for drive in closed_drives])
+    drive_counts = {drive_id: application_counts[drive_id] for drive_id in open_drive_ids}
+    eligible_counts = eligible_student_count(open_drive_ids + [drive.drive_id for drive in pending_drives])
+    totals = total_counts(drive_counts)
+
+    return render_template(
+        "company_dashboard.html",
+        pending_drives=pending_drives,
+        approved_drives=approved_drives,
+        rejected_drives=rejected_drives,
+        closed_drives=closed_drives,
+        drive_counts=drive_counts,
+        application_counts=application_counts,
+        eligible_counts=eligible_counts,
+        total_applicants=totals["total"],
+        total_shortlisted=totals["Shortlisted"],
+        total_selected=totals["Selected"],
+        skills=request.args.get("skills", "").strip()
+    )
+
+def drive_applicants_page(drive_id, skills, cursor=None):
+    """One keyset page of a drive's applications with their students, newest first.
+
+    ``skills`` narrows it to students whose resume mentions them.
+    """
+    query = Application.query.options(eager_load(Application.student)).filter(Application.job_id == drive_id)
+
+    if skills:
+        applicant_ids = db.session.execute(
+            db.select(Application.student_id).where(Application.job_id == drive_id)
+        ).scalars()
+        query = query.filter(Application.student_id.in_(students_with_skills(applicant_ids, skills)))
+
+    return keyset_page(query, Application.application_date, Application.application_id, cursor)
+
+@bp.route("/company/drive/<int:drive_id>/applicants")
+@company_required
+def company_drive_applicants(drive_id):
+    drive = db.get_or_404(PlacementDrive, drive_id)
+    if drive.company_id != session["user_id"]:
+        abort(404)
+
+    skills = request.args.get("skills", "").strip()
+    cursor = request.args.get("after")
+    applications, next_cursor = drive_applicants_page(drive_id, skills, cursor)
+
+    return render_template(
+        "partials/company_applicants.html",
+        drive=drive,
+        applications=applications,
+        skills=skills,
+        cursor=cursor,
+        next_cursor=next_cursor
+    )
+
+@bp.route("/company/live")
+@company_required
+def company_live_updates():
+    return live_response(live_updates.subscribe(
+        COMPANY_EVENTS, company_id=session["user_id"], last_event_id=request.headers.get("Last-Event-ID")
+    ))
+
+def drive_criteria_from_form():
+    """Structured eligibility criteria of the create/update drive forms."""
+    try:
+        min_cgpa = float(request.form.get("min_cgpa") or "")
+    except ValueError:
+        min_cgpa = None
+
+    return {
+        "min_cgpa": min_cgpa,
+        "allowed_departments": request.form.get("allowed_departments", "").strip() or None,
+        "allowed_graduation_years": request.form.get("allowed_graduation_years", "").strip() or None,
+        "exclude_blacklisted": "exclude_blacklisted" in request.form,
+    }
+
+#Create Drive
+@bp.route("/company/drive/create", methods=["POST"])
+@company_required
+def create_drive():
+    try:
+        # Convert deadline safely
+        deadline_str = request.form.get("application_deadline")
+        deadline = datetime.strptime(deadline_str, "%Y-%m-%d").date()
+
+        if deadline < date.today():
+            flash("Application deadline cannot be in the past.", "danger")
+            return redirect(url_for("portal.company_dashboard"))
+
+        drive = PlacementDrive(
+            company_id=session['user_id'],   
+            drive_name=request.form.get("drive_name"),
+            job_title=request.form.get("job_title"),
+            job_description=request.form.get("job_description"),
+            job_location=request.form.get("job_location"),
+            job_type=request.form.get("job_type"),
+            job_salary_range=request.form.get("job_salary_range"),
+            job_eligibility_criteria=request.form.get("job_eligibility_criteria"),
+            job_no_of_positions=request.form.get("job_no_of_positions") or 1,
+            application_deadline=deadline,
+            **drive_criteria_from_form(),
+            drive_is_approved=False,
+            drive_is_rejected=False,
+            drive_status="pending"  
+        )
+
+        db.session.add(drive)
+        db.session.commit()
+
+        flash("Drive created successfully! Awaiting admin approval.", "success")
+
+    except Exception as e:
+        db.session.rollback()
+        flash("Error creating drive. Please try again.", "danger")
+
+    return redirect(url_for("portal.company_dashboard"))
+    
+@bp.route("/company/application/update/<int:application_id>", methods=["POST"])
+@company_required
+def update_application_status(application_id):
+
+    application = Application.query.get_or_404(application_id)
+
+    # SECURITY CHECK → ensure application belongs to this company
+    if application.placement_drive.company_id != session["user_id"]:
+        flash("Unauthorized action.", "danger")
+        return redirect(url_for("portal.company_dashboard"))
+
+    new_status = request.form.get("status")
+
+    if new_status not in ["Shortlisted", "Selected", "Rejected"]:
+        flash("Invalid status value.", "danger")
+        return redirect(url_for("portal.company_dashboard"))
+
+    if bulk_update_status(session["user_id"], [application_id], new_status)[application_id] == "positions_filled":
+        flash("All positions in this drive have been filled.", "warning")
+        return redirect(url_for("portal.company_dashboard"))
+
+    flash("Application status updated successfully.", "success")
+    return redirect(url_for("portal.company_dashboard"))
+
+@bp.route("/company/applications/update", methods=["POST"])
+@company_required
+def bulk_update_application_status():
+    payload = request.get_json(silent=True) or {}
+    new_status = payload.get("status") or request.form.get("status")
+
+    try:
+        results = bulk_update_status(session["user_id"], requested_ids(payload, "application_ids"), new_status)
+    except (TypeError, ValueError):
+        if request.is_json:
+            return jsonify(error="Invalid status or application ids."), 400
+        flash("Invalid status value.", "danger")
+        return redirect(url_for("portal.company_dashboard"))
+
+    if request.is_json:
+        return jsonify(status=new_status, results=results)
+
+    updated = sum(1 for result in results.values() if result == "updated")
+    not_found = sum(1 for result in results.values() if result == "not_found")
+    filled = sum(1 for result in results.values() if result == "positions_filled")
+
+    flash(f"{updated} applications marked as {new_status}.", "success")
+    if not_found:
+        flash(f"{not_found} applications were not found.", "warning")
+    if filled:
+        flash(f"{filled} applications skipped: all positions in the drive are filled.", "warning")
+    return redirect(url_for("portal.company_dashboard"))
+
+#View Drive Details
+@bp.route("/company/drive/<int:drive_id>")
+@company_required
+def view_drive(drive_id):
+
+    drive = PlacementDrive.query.get_or_404(drive_id)
+
+    # security check (important)
+    if drive.company_id != session["user_id"]:
+        flash("Unauthorized access.", "danger")
+        return redirect(url_for("portal.company_dashboard"))
+
+    return render_template("company_dashboard.html", drive=drive)
+
+#Mark As Done
+@bp.route("/company/drive/complete/<int:drive_id>")
+@company_required
+def mark_drive_complete(drive_id):
+
+    drive = PlacementDrive.query.get_or_404(drive_id)
+
+    if drive.company_id != session["user_id"]:
+        flash("Unauthorized action.", "danger")
+        return redirect(url_for("portal.company_dashboard"))
+
+    if drive.drive_status != "open":
+        flash("Only ongoing drives can be closed.", "warning")
+        return redirect(url_for("portal.company_dashboard"))
+
+    drive.drive_status = "closed"
+    db.session.commit()
+
+    flash("Drive marked as completed.", "success")
+    return redirect(url_for("portal.company_dashboard"))
+
+#Update Drive Details
+@bp.route("/company/drive/update/<int:drive_id>", methods=["POST"])
+@company_required
+def update_drive(drive_id):
+
+    drive = PlacementDrive.query.get_or_404(drive_id)
+
+    if drive.company_id != session["user_id"]:
+        flash("Unauthorized action.", "danger")
+        return redirect(url_for("portal.company_dashboard"))
+
+    drive.job_title = request.form.get("job_title")
+    drive.job_description = request.form.get("job_description")
+    drive.job_location = request.form.get("job_location")
+    drive.job_salary_range = request.form.get("job_salary_range")
+    drive.job_eligibility_criteria = request.form.get("job_eligibility_criteria")
+    drive.job_type = request.form.get("job_type")
+    drive.drive_name = request.form.get("drive_name")
+
+    drive.drive_is_approved = False
+    drive.drive_is_rejected = False
+    drive.drive_status = "pending"
+
+    drive.job_no_of_positions = int(request.form.get("job_no_of_positions") or 1)
+
+    for name, value in drive_criteria_from_form().items():
+        setattr(drive, name, value)
+
+    deadline_str = request.form.get("application_deadline")
+    if deadline_str:
+        drive.application_deadline = datetime.strptime(
+            deadline_str, "%Y-%m-%d"
+        ).date()
+
+    db.session.commit()
+
+    flash("Drive updated successfully! Awaiting admin re-approval.", "success")
+    return redirect(url_for("portal.company_dashboard"))
+
+#Student 
+@bp.route("/student/dashboard")
+def student_dashboard():
+    if 'user_role' not in session or session['user_role'] != 'student':
+        return redirect(url_for('portal.login'))
+
+    student = db.session.get(Student, session['user_id'])
+    version = feed_version()
+    statuses = application_statuses(student.student_id)
+    return render_template(
+        "student_dashboard.html",
+        student=student,
+        drives=student_feed(student, version, statuses),
+        feed_etag=feed_etag(student, version, statuses),
+        apply_key=uuid.uuid4().hex,
+    )
+
+@bp.route("/student/drives")
+@student_required
+def student_drive_feed():
+    # Polled by the dashboard: a matching If-None-Match costs three small
+    # queries (versions, student, own applications) and no rendering
+    student = db.session.get(Student, session['user_id'])
+    version = feed_version()
+    statuses = application_statuses(student.student_id)
+    etag = feed_etag(student, version, statuses)
+
+    if etag in request.if_none_match:
+        response = Response(status=304)
+    else:
+        response = jsonify(drives=student_feed(student, version, statuses))
+    response.set_etag(etag)
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response
+
+# Outcome of an apply request -> (HTTP status, flash message, flash category)
+APPLY_RESPONSES = {
+    APPLIED: (201, "Application submitted successfully!", "success"),
+    REPLAYED: (200, "Application submitted successfully!", "success"),
+    DUPLICATE: (409, "You have already applied to this drive.", "info"),
+    KEY_REUSED: (422, "This request was already used for another drive. Please try again.", "danger"),
+    CLOSED: (409, "This drive is no longer accepting applications.", "warning"),
+    NOT_ELIGIBLE: (403, "You are not eligible for this drive.", "danger"),
+    FILLED: (409, "All positions in this drive have been filled.", "warning"),
+}
+
+@bp.route("/student/apply", methods=["POST"])
+@student_required
+def apply_to_drive():
+    payload = request.get_json(silent=True) or {}
+    drive_id = payload.get("drive_id") or request.form.get("drive_id")
+    # Retrying with the same key (header or form field) returns the first answer
+    idempotency_key = request.headers.get("Idempotency-Key") or payload.get("idempotency_key") \
+        or request.form.get("idempotency_key")
+
+    try:
+        drive_id = int(drive_id)
+        if idempotency_key and len(idempotency_key) > 64:
+            raise ValueError
+    except (TypeError, ValueError):
+        if request.is_json:
+            return jsonify(error="Invalid drive id or idempotency key."), 400
+        flash("Invalid application request.", "danger")
+        return redirect(url_for("portal.student_dashboard"))
+
+    result = application_queue.submit(session["user_id"], drive_id, idempotency_key)
+    status, message, category = APPLY_RESPONSES[result.outcome]
+
+    if request.is_json:
+        return jsonify(outcome=result.outcome, application_id=result.application_id), status
+
+    flash(message, category)
+    return redirect(url_for("portal.student_dashboard"))
+
+@bp.route("/student/resume/upload", methods=["POST"])
+@student_required
+def upload_resume():
+    # Either a multipart form with a "resume" file or a raw application/pdf body
+    if request.mimetype == "application/pdf":
+        stream = request.stream
+    else:
+        upload = request.files.get("resume")
+        if not upload or not upload.filename:
+            flash("Please choose a PDF to upload.", "danger")
+            return redirect(url_for("portal.student_dashboard"))
+        stream = upload.stream
+
+    try:
+        filename = save_resume(stream, current_app.config['MAX_RESUME_SIZE'])
+    except InvalidResume as error:
+        flash(str(error), "danger")
+        return redirect(url_for("portal.student_dashboard"))
+
+    student = db.session.get(Student, session['user_id'])
+    student.student_resume_filename = filename
+    # Text extraction happens later in `flask resume-worker`, never in this request
+    enqueue_resume(student.student_id, filename)
+    db.session.commit()
+
+    flash("Resume uploaded successfully!", "success")
+    return redirect(url_for("portal.student_dashboard"))
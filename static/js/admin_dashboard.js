@@ -0,0 +1,34 @@
+// Loads the next keyset page of a dashboard section in place of its "Load More" row.
+document.addEventListener("click", function (event) {
+    const button = event.target.closest(".load-more");
+    if (!button) {
+        return;
+    }
+
+    button.disabled = true;
+    button.textContent = "Loading...";
+
+    fetch(button.dataset.url, { headers: { "X-Requested-With": "fetch" } })
+        .then(function (response) {
+            if (!response.ok) {
+                throw new Error(response.statusText);
+            }
+            return response.text();
+        })
+        .then(function (html) {
+            const row = button.closest("tr");
+            row.insertAdjacentHTML("beforebegin", html);
+            row.remove();
+        })
+        .catch(function () {
+            button.disabled = false;
+            button.textContent = "Retry";
+        });
+});
+
+// Points the export form at the endpoint of the chosen export.
+document.addEventListener("change", function (event) {
+    if (event.target.id === "exportKind") {
+        document.getElementById("exportForm").action = event.target.value;
+    }
+});
@@ -0,0 +1,48 @@
+// Applicants of a drive are not part of the dashboard page; the first page is
+// fetched when its modal opens and "Load More" appends the next one.
+function fetchApplicants(url) {
+    return fetch(url, { headers: { "X-Requested-With": "fetch" } }).then(function (response) {
+        if (!response.ok) {
+            throw new Error(response.statusText);
+        }
+        return response.text();
+    });
+}
+
+document.addEventListener("show.bs.modal", function (event) {
+    const list = event.target.querySelector(":scope > .modal-dialog [data-applicants-url]");
+    if (!list || list.dataset.loaded) {
+        return;
+    }
+
+    list.dataset.loaded = "true";
+    fetchApplicants(list.dataset.applicantsUrl)
+        .then(function (html) {
+            list.innerHTML = html;
+        })
+        .catch(function () {
+            delete list.dataset.loaded;
+            list.innerHTML = '<p class="text-danger small">Could not load the applicants, reopen to retry.</p>';
+        });
+});
+
+document.addEventListener("click", function (event) {
+    const button = event.target.closest(".load-more");
+    if (!button) {
+        return;
+    }
+
+    button.disabled = true;
+    button.textContent = "Loading...";
+
+    fetchApplicants(button.dataset.url)
+        .then(function (html) {
+            const row = button.closest(".load-more-row");
+            row.insertAdjacentHTML("beforebegin", html);
+            row.remove();
+        })
+        .catch(function () {
+            button.disabled = false;
+            button.textContent = "Retry";
+        });
+});
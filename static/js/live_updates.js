@@ -0,0 +1,122 @@
+// Follows the live updates stream of the dashboard and patches its counters and
+// activity list in place. EventSource reconnects by itself and sends the last
+// event id, so the server replays what was missed or answers with a resync.
+const LIVE_ACTIVITY_LIMIT = 20;
+
+function liveCounter(root, name) {
+    return root.querySelector(`[data-live-counter="${name}"]`);
+}
+
+function addToCounters(root, deltas) {
+    Object.entries(deltas).forEach(function ([name, delta]) {
+        const counter = liveCounter(root, name);
+        if (counter) {
+            counter.textContent = (parseInt(counter.textContent, 10) || 0) + delta;
+        }
+    });
+}
+
+function setCounters(root, values) {
+    Object.entries(values || {}).forEach(function ([name, value]) {
+        const counter = liveCounter(root, name);
+        if (counter) {
+            counter.textContent = value;
+        }
+    });
+}
+
+function addActivity(text) {
+    const list = document.getElementById("liveActivity");
+    if (!list) {
+        return;
+    }
+
+    const placeholder = list.querySelector(".live-placeholder");
+    if (placeholder) {
+        placeholder.remove();
+    }
+
+    const item = document.createElement("li");
+    item.className = "list-group-item small";
+    item.textContent = `${new Date().toLocaleTimeString()} - ${text}`;
+    list.prepend(item);
+
+    while (list.children.length > LIVE_ACTIVITY_LIMIT) {
+        list.lastElementChild.remove();
+    }
+}
+
+function addAlert(root, text) {
+    const alert = document.createElement("div");
+    alert.className = "alert alert-info alert-dismissible fade show";
+    alert.setAttribute("role", "alert");
+    alert.textContent = text;
+
+    const close = document.createElement("button");
+    close.type = "button";
+    close.className = "btn-close";
+    close.dataset.bsDismiss = "alert";
+    alert.appendChild(close);
+
+    root.before(alert);
+}
+
+function followLiveUpdates(root) {
+    const source = new EventSource(root.dataset.liveUrl);
+    // Company dashboards count the applicants of their open drives only
+    const drives = root.dataset.liveDrives === undefined
+        ? null
+        : new Set(root.dataset.liveDrives.split(",").filter(Boolean).map(Number));
+
+    function on(type, handler) {
+        source.addEventListener(type, function (event) {
+            handler(JSON.parse(event.data));
+        });
+    }
+
+    on("counters", function (change) {
+        if (change.values) {
+            setCounters(root, change.values);
+        } else {
+            addToCounters(root, change.deltas);
+        }
+    });
+
+    on("applicants", function (change) {
+        if (drives && drives.has(change.drive_id)) {
+            addToCounters(root, change.deltas);
+        }
+    });
+
+    on("application", function (change) {
+        addActivity(`New application to ${change.drive_name} (${change.company_name})`);
+    });
+
+    on("drive_approved", function (change) {
+        addActivity(`Drive approved: ${change.drive_name} (${change.company_name})`);
+        if (drives) {
+            addAlert(root, `${change.drive_name} was approved. Reload to see its applicants.`);
+        }
+    });
+
+    on("company_registered", function (change) {
+        addActivity(`Company registered: ${change.company_name}`);
+    });
+
+    // Some changes were missed: the admin counters come along, a company
+    // dashboard has to be loaded again
+    on("resync", function (change) {
+        if (drives || !change.counters) {
+            window.location.reload();
+            return;
+        }
+        setCounters(root, change.counters);
+    });
+}
+
+document.addEventListener("DOMContentLoaded", function () {
+    const root = document.getElementById("liveDashboard");
+    if (root && window.EventSource) {
+        followLiveUpdates(root);
+    }
+});
@@ -0,0 +1,93 @@
+// Polls the open drives feed and redraws the table only when its ETag changed.
+const FEED_POLL_INTERVAL = 60000;
+
+function feedCell(text) {
+    const cell = document.createElement("td");
+    cell.textContent = text == null ? "" : text;
+    return cell;
+}
+
+function feedHiddenInput(name, value) {
+    const input = document.createElement("input");
+    input.type = "hidden";
+    input.name = name;
+    input.value = value;
+    return input;
+}
+
+function feedStatusCell(table, drive) {
+    const cell = document.createElement("td");
+
+    if (drive.application_status) {
+        const label = document.createElement("span");
+        label.className = "badge bg-info text-dark";
+        label.textContent = drive.application_status;
+        cell.appendChild(label);
+        return cell;
+    }
+
+    // A fresh key per rendered form, so a double submit is answered once
+    const form = document.createElement("form");
+    form.method = "POST";
+    form.action = table.dataset.applyUrl;
+    form.appendChild(feedHiddenInput("drive_id", drive.drive_id));
+    form.appendChild(feedHiddenInput("idempotency_key", `${Date.now().toString(36)}-${Math.random().toString(36).slice(2)}-${drive.drive_id}`));
+
+    const button = document.createElement("button");
+    button.type = "submit";
+    button.className = "btn btn-success btn-sm";
+    button.textContent = "Apply";
+    form.appendChild(button);
+
+    cell.appendChild(form);
+    return cell;
+}
+
+function renderFeed(table, drives) {
+    const body = table.tBodies[0];
+    body.replaceChildren();
+
+    if (drives.length === 0) {
+        const row = body.insertRow();
+        const cell = feedCell("No open drives for you right now.");
+        cell.colSpan = 7;
+        cell.className = "text-center text-muted";
+        row.appendChild(cell);
+        return;
+    }
+
+    drives.forEach(function (drive) {
+        const row = body.insertRow();
+        [drive.company_name, drive.job_title, drive.job_location, drive.job_type,
+            drive.job_salary_range, drive.application_deadline].forEach(function (value) {
+            row.appendChild(feedCell(value));
+        });
+        row.appendChild(feedStatusCell(table, drive));
+    });
+}
+
+function pollFeed(table) {
+    // no-store keeps the browser cache out of the way, so a 304 reaches us as a 304
+    fetch(table.dataset.url, { cache: "no-store", headers: { "If-None-Match": `"${table.dataset.etag}"` } })
+        .then(function (response) {
+            if (response.status === 304 || !response.ok) {
+                return;
+            }
+            table.dataset.etag = (response.headers.get("ETag") || "").replace(/"/g, "");
+            return response.json().then(function (feed) {
+                renderFeed(table, feed.drives);
+            });
+        })
+        .catch(function () {});
+}
+
+document.addEventListener("DOMContentLoaded", function () {
+    const table = document.getElementById("driveFeed");
+    if (table) {
+        setInterval(function () {
+            if (!document.hidden) {
+                pollFeed(table);
+            }
+        }, FEED_POLL_INTERVAL);
+    }
+});
@@ -0,0 +1,110 @@
+import os
+import sys
+from contextlib import contextmanager
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import event
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from app import create_app
+from Models.model import db, Company, PlacementDrive, Student
+from Services.setup import create_default_admin, init_database
+
+@pytest.fixture
+def app(tmp_path):
+    """The portal on a fresh SQLite file, schema and default admin in place."""
+    app = create_app({
+        "TESTING": True,
+        "SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path / 'portal.db'}",
+        "RESUME_FOLDER": str(tmp_path / "resumes"),
+        "FRAGMENT_CACHE": "",
+        "APPLY_GROUP_COMMIT": False,
+        "ELIGIBILITY_WORKER": False,
+    })
+    with app.app_context():
+        init_database()
+        create_default_admin()
+    yield app
+    with app.app_context():
+        db.session.remove()
+        db.engine.dispose()
+
+@pytest.fixture
+def seeded(app):
+    """A small synthetic dataset from the benchmark seeder."""
+    from benchmarks.seed_data import seed
+
+    with app.app_context():
+        seed(students=300, companies=12, drives_per_company=3, applications_per_student=4)
+    return app
+
+def add_drive(company, name, deadline_days=7, status="open", **criteria):
+    drive = PlacementDrive(
+        company_id=company.company_id, drive_name=name, job_title="Engineer", job_description="-",
+        job_location="Pune", job_salary_range="10 LPA", application_deadline=date.today() + timedelta(days=deadline_days),
+        drive_is_approved=True, drive_status=status, **criteria,
+    )
+    db.session.add(drive)
+    return drive
+
+@pytest.fixture
+def portal(app):
+    """Two students (CGPA 8.5 and 6.0) and drives in every state apply_batch tells apart."""
+    with app.app_context():
+        students = [
+            Student(student_name=name, student_email=f"{name.lower()}@college.edu", student_password_hash="x",
+                    student_department="CSE", student_cgpa=cgpa, student_joining_year=2022,
+                    student_graduation_year=2026)
+            for name, cgpa in (("Asha", 8.5), ("Vikram", 6.0))
+        ]
+        company = Company(
+            company_name="Acme", company_email="hr@acme.com", company_password_hash="x",
+            company_hr_contact_name="HR", company_hr_contact_email="hr@acme.com", company_industry="IT",
+            approval_status="approved", company_is_approved=True,
+        )
+        db.session.add_all([*students, company])
+        db.session.flush()
+        drives = {
+            "open": add_drive(company, "Open"),
+            "other": add_drive(company, "Other"),
+            "strict": add_drive(company, "Strict", min_cgpa=7.5),
+            "closed": add_drive(company, "Closed", status="closed"),
+            "expired": add_drive(company, "Expired", deadline_days=-1),
+        }
+        db.session.commit()
+
+        app.ids = {
+            "asha": students[0].student_id,
+            "vikram": students[1].student_id,
+            **{name: drive.drive_id for name, drive in drives.items()},
+        }
+    return app
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+def log_in(client, role, user_id, username=None):
+    """Put a logged in ``role`` session on ``client`` without going through /login."""
+    with client.session_transaction() as session:
+        session.clear()
+        session.update(user_id=user_id, user_role=role)
+        if username is not None:
+            session["username"] = username
+
+@contextmanager
+def counted_statements(engine):
+    """Every SQL statement run on ``engine`` inside the block."""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
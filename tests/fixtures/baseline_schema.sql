@@ -0,0 +1,98 @@
+-- Schema of a database created by the first release of the portal (db.create_all()
+-- on the original models), before any migration existed.
+
+CREATE TABLE admin (
+	admin_id INTEGER NOT NULL,
+	admin_username VARCHAR(80) NOT NULL,
+	admin_email VARCHAR(120) NOT NULL,
+	admin_password_hash VARCHAR(128) NOT NULL,
+	admin_role VARCHAR(20) NOT NULL,
+	created_at DATETIME,
+	PRIMARY KEY (admin_id),
+	UNIQUE (admin_username),
+	UNIQUE (admin_email)
+);
+
+CREATE TABLE student (
+	student_id INTEGER NOT NULL,
+	student_name VARCHAR(80) NOT NULL,
+	student_email VARCHAR(120) NOT NULL,
+	student_password_hash VARCHAR(128) NOT NULL,
+	student_dob DATE,
+	student_phone VARCHAR(20),
+	student_department VARCHAR(50) NOT NULL,
+	student_cgpa FLOAT NOT NULL,
+	student_joining_year INTEGER NOT NULL,
+	student_graduation_year INTEGER NOT NULL,
+	student_resume_filename VARCHAR(200),
+	student_is_active BOOLEAN,
+	student_is_blacklisted BOOLEAN,
+	created_at DATETIME,
+	PRIMARY KEY (student_id),
+	UNIQUE (student_email)
+);
+
+CREATE TABLE company (
+	company_id INTEGER NOT NULL,
+	company_name VARCHAR(80) NOT NULL,
+	company_email VARCHAR(120) NOT NULL,
+	company_password_hash VARCHAR(128) NOT NULL,
+	company_hr_contact_name VARCHAR(80) NOT NULL,
+	company_hr_contact_email VARCHAR(120) NOT NULL,
+	company_website VARCHAR(200),
+	company_description TEXT,
+	company_industry VARCHAR(50) NOT NULL,
+	approval_status VARCHAR(20),
+	company_is_approved BOOLEAN,
+	company_is_rejected BOOLEAN,
+	company_is_blacklisted BOOLEAN,
+	created_at DATETIME,
+	PRIMARY KEY (company_id),
+	UNIQUE (company_name),
+	UNIQUE (company_email)
+);
+
+CREATE TABLE placement_statistics (
+	stats_id INTEGER NOT NULL,
+	year INTEGER NOT NULL,
+	total_students INTEGER NOT NULL,
+	placed_students INTEGER NOT NULL,
+	company_participation INTEGER NOT NULL,
+	average_salary FLOAT,
+	highest_salary FLOAT,
+	created_at DATETIME,
+	PRIMARY KEY (stats_id)
+);
+
+CREATE TABLE placement_drive (
+	drive_id INTEGER NOT NULL,
+	company_id INTEGER NOT NULL,
+	drive_name VARCHAR(100) NOT NULL,
+	job_title VARCHAR(100) NOT NULL,
+	job_description TEXT NOT NULL,
+	job_location VARCHAR(100) NOT NULL,
+	job_type VARCHAR(50),
+	job_salary_range VARCHAR(50) NOT NULL,
+	job_eligibility_criteria TEXT,
+	job_no_of_positions INTEGER,
+	application_deadline DATE NOT NULL,
+	drive_date_posted DATETIME,
+	drive_is_approved BOOLEAN,
+	drive_is_rejected BOOLEAN,
+	drive_status VARCHAR(20),
+	created_at DATETIME,
+	PRIMARY KEY (drive_id),
+	FOREIGN KEY(company_id) REFERENCES company (company_id)
+);
+
+CREATE TABLE application (
+	application_id INTEGER NOT NULL,
+	student_id INTEGER NOT NULL,
+	job_id INTEGER NOT NULL,
+	application_date DATETIME,
+	application_status VARCHAR(20),
+	remarks TEXT,
+	PRIMARY KEY (application_id),
+	FOREIGN KEY(student_id) REFERENCES student (student_id),
+	FOREIGN KEY(job_id) REFERENCES placement_drive (drive_id)
+);
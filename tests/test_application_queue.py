@@ -0,0 +1,137 @@
+import threading
+
+import pytest
+from sqlalchemy import func, select
+from Models.model import db, Application, PlacementDrive
+from Services.application_queue import (
+    APPLIED, CLOSED, DUPLICATE, FILLED, KEY_REUSED, NOT_ELIGIBLE, REPLAYED,
+    ApplicationQueue, ApplyRequest, apply_batch, commit_batch,
+)
+from Services.application_status import bulk_update_status
+
+def application_count(student_id, drive_id):
+    return db.session.execute(
+        select(func.count()).select_from(Application).where(
+            Application.student_id == student_id, Application.job_id == drive_id
+        )
+    ).scalar()
+
+@pytest.mark.parametrize("group_commit", [True, False], ids=["group_commit", "one_transaction_each"])
+def test_concurrent_submits_apply_once(portal, group_commit):
+    ids = portal.ids
+    queue = ApplicationQueue()
+    queue.init_app(portal)
+    queue.enabled = group_commit
+    outcomes = []
+    barrier = threading.Barrier(8)
+
+    def submit(key):
+        with portal.app_context():
+            barrier.wait()
+            outcomes.append(queue.submit(ids["asha"], ids["open"], key).outcome)
+            db.session.remove()
+
+    # Half the submits repeat one idempotency key, like a double-clicked form
+    threads = [threading.Thread(target=submit, args=("form-1" if i % 2 else None,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert outcomes.count(APPLIED) == 1
+    assert set(outcomes) <= {APPLIED, DUPLICATE, REPLAYED}
+    with portal.app_context():
+        assert application_count(ids["asha"], ids["open"]) == 1
+
+def test_idempotency_key_reused_for_another_drive(portal):
+    ids = portal.ids
+    with portal.app_context():
+        first = ApplyRequest(ids["asha"], ids["open"], "form-1")
+        commit_batch([first])
+        again = ApplyRequest(ids["asha"], ids["open"], "form-1")
+        reused = ApplyRequest(ids["asha"], ids["other"], "form-1")
+        commit_batch([again, reused])
+
+        assert first.outcome == APPLIED
+        assert (again.outcome, again.application_id) == (REPLAYED, first.application_id)
+        assert (reused.outcome, reused.application_id) == (KEY_REUSED, first.application_id)
+        assert application_count(ids["asha"], ids["other"]) == 0
+
+@pytest.mark.parametrize("drive", ["closed", "expired"])
+def test_closed_or_past_deadline_drive(portal, drive):
+    with portal.app_context():
+        request = ApplyRequest(portal.ids["asha"], portal.ids[drive])
+        commit_batch([request])
+
+        assert request.outcome == CLOSED
+        assert application_count(portal.ids["asha"], portal.ids[drive]) == 0
+
+def test_ineligible_student(portal):
+    with portal.app_context():
+        rejected = ApplyRequest(portal.ids["vikram"], portal.ids["strict"])
+        accepted = ApplyRequest(portal.ids["asha"], portal.ids["strict"])
+        commit_batch([rejected, accepted])
+
+        assert (rejected.outcome, accepted.outcome) == (NOT_ELIGIBLE, APPLIED)
+
+def test_drive_with_every_position_filled(portal):
+    ids = portal.ids
+    with portal.app_context():
+        drive = db.session.get(PlacementDrive, ids["open"])
+        drive.job_no_of_positions = 1
+        db.session.commit()
+
+        first = ApplyRequest(ids["vikram"], ids["open"])
+        second = ApplyRequest(ids["asha"], ids["other"])
+        commit_batch([first, second])
+        assert (first.outcome, second.outcome) == (APPLIED, APPLIED)
+
+        company_id = drive.company_id
+        assert bulk_update_status(company_id, [first.application_id], "Selected") == {first.application_id: "updated"}
+
+        late = ApplyRequest(ids["asha"], ids["open"])
+        commit_batch([late])
+        assert late.outcome == FILLED
+        assert application_count(ids["asha"], ids["open"]) == 0
+
+def test_selections_stop_at_the_number_of_positions(portal):
+    ids = portal.ids
+    with portal.app_context():
+        drive = db.session.get(PlacementDrive, ids["open"])
+        drive.job_no_of_positions = 1
+        db.session.commit()
+
+        requests = [ApplyRequest(ids["asha"], ids["open"]), ApplyRequest(ids["vikram"], ids["open"])]
+        commit_batch(requests)
+        first, second = sorted(request.application_id for request in requests)
+
+        assert bulk_update_status(drive.company_id, [first, second], "Selected") == {
+            first: "updated", second: "positions_filled",
+        }
+        # Moving the selected one elsewhere frees its position
+        bulk_update_status(drive.company_id, [first], "Rejected")
+        assert bulk_update_status(drive.company_id, [second], "Selected") == {second: "updated"}
+
+def test_integrity_error_retries_one_request_at_a_time(portal, monkeypatch):
+    ids = portal.ids
+    with portal.app_context():
+        calls = []
+
+        def recording_apply_batch(connection, requests, now=None):
+            calls.append(len(requests))
+            return apply_batch(connection, requests, now)
+
+        # One key for two drives in one batch passes the in-batch checks and
+        # fails the unique (student_id, idempotency_key) index
+        first = ApplyRequest(ids["asha"], ids["open"], "form-1")
+        second = ApplyRequest(ids["asha"], ids["other"], "form-1")
+        unrelated = ApplyRequest(ids["vikram"], ids["open"])
+
+        monkeypatch.setattr("Services.application_queue.apply_batch", recording_apply_batch)
+        commit_batch([first, second, unrelated])
+
+        assert calls == [3, 1, 1, 1]
+        assert (first.outcome, second.outcome, unrelated.outcome) == (APPLIED, KEY_REUSED, APPLIED)
+        assert second.application_id == first.application_id
+        assert all(request.error is None and request.done.is_set() for request in (first, second, unrelated))
+        assert application_count(ids["asha"], ids["other"]) == 0
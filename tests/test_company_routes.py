@@ -0,0 +1,91 @@
+from conftest import log_in
+from Models.model import db, Application, Company, ResumeText, Student
+from Services.application_queue import ApplyRequest, commit_batch
+from Services.pagination import PAGE_SIZE
+
+def company_client(portal):
+    with portal.app_context():
+        company = Company.query.filter_by(company_name="Acme").one()
+        company_id = company.company_id
+    client = portal.test_client()
+    log_in(client, "company", company_id, "Acme")
+    return client
+
+def test_view_drive(portal):
+    response = company_client(portal).get(f"/company/drive/{portal.ids['open']}")
+
+    assert response.status_code == 200
+    assert b"Open" in response.data
+    # The single drive page has no live counters to follow
+    assert b'id="liveDashboard"' not in response.data
+
+def test_company_dashboard_follows_live_updates(portal):
+    response = company_client(portal).get("/company/dashboard")
+
+    assert response.status_code == 200
+    assert b'id="liveDashboard"' in response.data
+    assert b"data-live-drives=" in response.data
+
+def test_dashboard_renders_counts_and_loads_applicants_per_drive(portal):
+    ids = portal.ids
+    with portal.app_context():
+        commit_batch([ApplyRequest(ids["asha"], ids["open"]), ApplyRequest(ids["vikram"], ids["open"])])
+    client = company_client(portal)
+
+    dashboard = client.get("/company/dashboard")
+    assert b"2 applied, 0 shortlisted" in dashboard.data
+    assert b"Asha" not in dashboard.data
+    assert f"/company/drive/{ids['open']}/applicants".encode() in dashboard.data
+
+    applicants = client.get(f"/company/drive/{ids['open']}/applicants")
+    assert applicants.status_code == 200
+    assert b"Asha" in applicants.data and b"Vikram" in applicants.data
+    assert b"load-more" not in applicants.data
+
+def test_applicants_are_paginated(portal):
+    ids = portal.ids
+    with portal.app_context():
+        students = [
+            Student(student_name=f"Applicant {number}", student_email=f"applicant{number}@college.edu",
+                    student_password_hash="x", student_department="CSE", student_cgpa=7.0,
+                    student_joining_year=2022, student_graduation_year=2026)
+            for number in range(PAGE_SIZE + 1)
+        ]
+        db.session.add_all(students)
+        db.session.flush()
+        db.session.add_all([Application(student_id=student.student_id, job_id=ids["open"]) for student in students])
+        db.session.commit()
+    client = company_client(portal)
+
+    first = client.get(f"/company/drive/{ids['open']}/applicants")
+    assert first.data.count(b"Review Application") == PAGE_SIZE
+    next_url = first.data.split(b'data-url="')[1].split(b'"')[0].decode().replace("&amp;", "&")
+
+    second = client.get(next_url)
+    assert second.data.count(b"Review Application") == 1
+    assert b"load-more" not in second.data
+
+def test_applicants_filtered_by_skills(portal):
+    ids = portal.ids
+    with portal.app_context():
+        commit_batch([ApplyRequest(ids["asha"], ids["open"]), ApplyRequest(ids["vikram"], ids["open"])])
+        db.session.add(ResumeText(student_id=ids["asha"], resume_filename="a.pdf", resume_text="Python and SQL"))
+        db.session.commit()
+
+    response = company_client(portal).get(f"/company/drive/{ids['open']}/applicants?skills=python")
+    assert b"Asha" in response.data and b"Vikram" not in response.data
+
+def test_applicants_of_another_company_are_not_found(portal):
+    with portal.app_context():
+        other = Company(
+            company_name="Globex", company_email="hr@globex.com", company_password_hash="x",
+            company_hr_contact_name="HR", company_hr_contact_email="hr@globex.com", company_industry="IT",
+            approval_status="approved", company_is_approved=True,
+        )
+        db.session.add(other)
+        db.session.commit()
+        other_id = other.company_id
+    client = portal.test_client()
+    log_in(client, "company", other_id, "Globex")
+
+    assert client.get(f"/company/drive/{portal.ids['open']}/applicants").status_code == 404
@@ -0,0 +1,75 @@
+import pytest
+from conftest import counted_statements, log_in
+from Models.model import db, Company, PlacementDrive, Student
+from routes import ADMIN_SECTIONS
+from Services.analytics import analytics_cache
+from Services.drive_feed import feed_cache
+
+# Statements one render may run, with the per-process caches cold. Listings
+# are eager-loaded, so none of these grow with the number of rows shown.
+MAX_STATEMENTS = {
+    "admin_dashboard": 11,
+    "admin_dashboard_section": 1,
+    "company_dashboard": 6,
+    "company_drive_applicants": 2,
+    "student_dashboard": 5,
+}
+
+@pytest.fixture(autouse=True)
+def cold_caches():
+    analytics_cache.clear()
+    feed_cache.clear()
+
+def render(app, client, path):
+    with app.app_context():
+        engine = db.engine
+    with counted_statements(engine) as statements:
+        response = client.get(path)
+    assert response.status_code == 200
+    return statements
+
+def test_admin_dashboard_statements(seeded):
+    client = seeded.test_client()
+    log_in(client, "admin", 1, "admin")
+
+    statements = render(seeded, client, "/admin/dashboard")
+    assert len(statements) <= MAX_STATEMENTS["admin_dashboard"], statements
+
+@pytest.mark.parametrize("section", ADMIN_SECTIONS)
+def test_admin_section_page_statements(seeded, section):
+    client = seeded.test_client()
+    log_in(client, "admin", 1, "admin")
+
+    statements = render(seeded, client, f"/admin/dashboard/{section}")
+    assert len(statements) <= MAX_STATEMENTS["admin_dashboard_section"], statements
+
+def test_company_dashboard_statements(seeded):
+    with seeded.app_context():
+        company = Company.query.filter_by(company_is_approved=True).first()
+        company_id, company_name = company.company_id, company.company_name
+    client = seeded.test_client()
+    log_in(client, "company", company_id, company_name)
+
+    statements = render(seeded, client, "/company/dashboard")
+    assert len(statements) <= MAX_STATEMENTS["company_dashboard"], statements
+
+def test_company_drive_applicants_statements(seeded):
+    with seeded.app_context():
+        company = Company.query.filter_by(company_is_approved=True).first()
+        company_id, company_name = company.company_id, company.company_name
+        drive_id = PlacementDrive.query.filter_by(company_id=company_id).first().drive_id
+    client = seeded.test_client()
+    log_in(client, "company", company_id, company_name)
+
+    statements = render(seeded, client, f"/company/drive/{drive_id}/applicants")
+    assert len(statements) <= MAX_STATEMENTS["company_drive_applicants"], statements
+
+def test_student_dashboard_statements(seeded):
+    with seeded.app_context():
+        student = Student.query.first()
+        student_id, student_name = student.student_id, student.student_name
+    client = seeded.test_client()
+    log_in(client, "student", student_id, student_name)
+
+    statements = render(seeded, client, "/student/dashboard")
+    assert len(statements) <= MAX_STATEMENTS["student_dashboard"], statements
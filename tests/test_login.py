@@ -0,0 +1,44 @@
+import pytest
+from flask import session
+from conftest import counted_statements
+from Models.model import db, Account, Company, Student
+
+@pytest.fixture
+def accounts(app):
+    with app.app_context():
+        student = Student(student_name="Asha Rao", student_email="asha@college.edu", student_department="CSE",
+                          student_cgpa=8.4, student_joining_year=2022, student_graduation_year=2026)
+        student.set_password("secret")
+        company = Company(company_name="Acme", company_email="hr@acme.com", company_hr_contact_name="HR",
+                          company_hr_contact_email="hr@acme.com", company_industry="IT",
+                          approval_status="approved", company_is_approved=True)
+        company.set_password("secret")
+        db.session.add_all([student, company])
+        db.session.commit()
+    return app
+
+@pytest.mark.parametrize("email, role, name", [
+    ("asha@college.edu", "student", "Asha Rao"),
+    ("hr@acme.com", "company", "Acme"),
+])
+def test_login_takes_the_name_from_the_account_row(accounts, email, role, name):
+    with accounts.app_context():
+        engine = db.engine
+    with accounts.test_client() as client:
+        with counted_statements(engine) as statements:
+            response = client.post("/login", data={"email": email, "password": "secret"})
+
+        assert response.status_code == 302
+        assert (session["user_role"], session["username"]) == (role, name)
+    # The account lookup, plus the status check of a company
+    assert len([statement for statement in statements if statement.lstrip().startswith("SELECT")]) == \
+        (2 if role == "company" else 1)
+
+def test_renaming_updates_the_account_display_name(accounts):
+    with accounts.app_context():
+        student = Student.query.filter_by(student_email="asha@college.edu").one()
+        student.student_name = "Asha R."
+        db.session.commit()
+
+        account = Account.query.filter_by(account_email="asha@college.edu").one()
+        assert account.account_display_name == "Asha R."
@@ -0,0 +1,140 @@
+import os
+import sqlite3
+
+import pytest
+from sqlalchemy import func, inspect, select, text
+from app import create_app
+from Models.migrations import (
+    MIGRATIONS, MigrationError, add_account_display_name, add_application_uniqueness, current_version, upgrade,
+)
+from Models.model import db, Account, Application, PlacementDrive
+from Services.setup import init_database
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+# Rows a baseline deployment could hold
+BASELINE_ROWS = """
+INSERT INTO student (student_id, student_name, student_email, student_password_hash, student_department,
+                     student_cgpa, student_joining_year, student_graduation_year, student_is_blacklisted)
+VALUES (1, 'Asha Rao', 'asha@college.edu', 'x', 'CSE', 8.4, 2022, 2026, 0),
+       (2, 'Vikram Das', 'vikram@college.edu', 'x', 'ECE', 7.1, 2022, 2026, 0);
+
+INSERT INTO company (company_id, company_name, company_email, company_password_hash, company_hr_contact_name,
+                     company_hr_contact_email, company_industry, approval_status, company_is_approved)
+VALUES (1, 'Acme', 'hr@acme.com', 'x', 'HR', 'hr@acme.com', 'IT', 'approved', 1);
+
+INSERT INTO placement_drive (drive_id, company_id, drive_name, job_title, job_description, job_location,
+                             job_salary_range, application_deadline, drive_is_approved, drive_status)
+VALUES (1, 1, 'Campus Drive', 'Engineer', '-', 'Pune', '8-12 LPA', '2030-01-31', 1, 'open');
+
+INSERT INTO application (application_id, student_id, job_id, application_status)
+VALUES (1, 1, 1, 'pending'), (3, 2, 1, 'Selected');
+"""
+
+def create_baseline_database(path):
+    """A SQLite file with the schema and some rows of the first release."""
+    connection = sqlite3.connect(path)
+    with open(os.path.join(FIXTURES, "baseline_schema.sql")) as schema:
+        connection.executescript(schema.read())
+    connection.executescript(BASELINE_ROWS)
+    connection.commit()
+    connection.close()
+
+def portal(path):
+    return create_app({"SQLALCHEMY_DATABASE_URI": f"sqlite:///{path}", "FRAGMENT_CACHE": ""})
+
+def schema_problems(engine):
+    """Columns and indexes of the models that the database lacks."""
+    inspector = inspect(engine)
+    problems = []
+    for name, table in db.metadata.tables.items():
+        if not inspector.has_table(name):
+            problems.append(f"table {name}")
+            continue
+        columns = {column["name"] for column in inspector.get_columns(name)}
+        problems += [f"column {name}.{column.name}" for column in table.columns if column.name not in columns]
+        indexes = {index["name"] for index in inspector.get_indexes(name)}
+        problems += [f"index {index.name}" for index in table.indexes if index.name not in indexes]
+    return problems
+
+def schema_sql(engine):
+    with engine.connect() as connection:
+        return connection.execute(text("SELECT type, name, sql FROM sqlite_master ORDER BY name")).all()
+
+@pytest.fixture
+def baseline_app(tmp_path):
+    path = tmp_path / "baseline.db"
+    create_baseline_database(path)
+    app = portal(path)
+    yield app
+    with app.app_context():
+        db.session.remove()
+        db.engine.dispose()
+
+def test_upgrade_from_baseline_schema(baseline_app):
+    with baseline_app.app_context():
+        applied = init_database()
+
+        assert applied == [step.__name__ for step in MIGRATIONS]
+        assert schema_problems(db.engine) == []
+
+        assert db.session.execute(select(func.count(Application.application_id))).scalar() == 2
+        drive = db.session.get(PlacementDrive, 1)
+        assert (drive.salary_min, drive.salary_max, drive.salary_period) == (800000, 1200000, "year")
+        assert {account.account_email: account.account_display_name for account in Account.query} == {
+            "asha@college.edu": "Asha Rao", "vikram@college.edu": "Vikram Das", "hr@acme.com": "Acme",
+        }
+
+def test_duplicate_applications_stop_the_upgrade(baseline_app):
+    with baseline_app.app_context():
+        with db.engine.begin() as connection:
+            connection.execute(text(
+                "INSERT INTO application (application_id, student_id, job_id, application_status) "
+                "VALUES (2, 1, 1, 'Shortlisted')"
+            ))
+        version = MIGRATIONS.index(add_application_uniqueness)
+
+        with pytest.raises(MigrationError, match="student 1, drive 1: applications 1, 2"):
+            upgrade(db.engine)
+
+        with db.engine.begin() as connection:
+            assert current_version(connection) == version
+            assert connection.execute(text("SELECT COUNT(*) FROM application")).scalar() == 3
+
+        # Once an admin removes the extra row the upgrade goes through
+        with db.engine.begin() as connection:
+            connection.execute(text("DELETE FROM application WHERE application_id = 2"))
+        assert init_database() == [step.__name__ for step in MIGRATIONS[version:]]
+
+def test_upgrade_of_an_up_to_date_database_is_a_no_op(baseline_app):
+    with baseline_app.app_context():
+        init_database()
+        schema = schema_sql(db.engine)
+
+        assert upgrade(db.engine) == []
+        assert init_database() == []
+        assert schema_sql(db.engine) == schema
+
+@pytest.mark.parametrize("version", range(1, len(MIGRATIONS)), ids=lambda version: f"from_version_{version}")
+def test_upgrade_from_each_intermediate_version(baseline_app, version):
+    with baseline_app.app_context():
+        assert upgrade(db.engine, target=version) == [step.__name__ for step in MIGRATIONS[:version]]
+        with db.engine.begin() as connection:
+            assert current_version(connection) == version
+
+        assert init_database() == [step.__name__ for step in MIGRATIONS[version:]]
+        assert schema_problems(db.engine) == []
+
+def test_account_display_names_are_filled_in_for_existing_accounts(baseline_app):
+    with baseline_app.app_context():
+        init_database()
+        # As left by a release before add_account_display_name
+        with db.engine.begin() as connection:
+            connection.execute(text("UPDATE account SET account_display_name = NULL"))
+            connection.execute(text("UPDATE schema_version SET version = :version"),
+                               {"version": MIGRATIONS.index(add_account_display_name)})
+
+        assert "add_account_display_name" in upgrade(db.engine)
+        assert {account.account_email: account.account_display_name for account in Account.query} == {
+            "asha@college.edu": "Asha Rao", "vikram@college.edu": "Vikram Das", "hr@acme.com": "Acme",
+        }
@@ -0,0 +1,95 @@
+import pytest
+from conftest import add_drive, counted_statements, log_in
+from sqlalchemy import func, select
+from Models.model import db, Company, DriveEligibility, PlacementDrive
+from Services.application_queue import APPLIED, CLOSED, ApplyRequest, commit_batch
+from Services.eligibility import eligibility_worker, eligible_student_count, run_stale_refreshes
+from Services.moderation import moderate
+from Services.scheduler import close_expired_drives
+
+def pair_count(drive_id):
+    return db.session.execute(
+        select(func.count()).select_from(DriveEligibility).where(DriveEligibility.drive_id == drive_id)
+    ).scalar()
+
+def test_closing_a_drive_drops_its_pairs_and_reapproving_restores_them(portal):
+    ids = portal.ids
+    with portal.app_context():
+        before = eligible_student_count([ids["open"]])
+
+        assert moderate("drive", "close", [ids["open"]]) == {ids["open"]: "updated"}
+        assert pair_count(ids["open"]) == 0
+
+        closed = ApplyRequest(ids["asha"], ids["open"])
+        commit_batch([closed])
+        assert closed.outcome == CLOSED
+
+        assert moderate("drive", "approve", [ids["open"]]) == {ids["open"]: "updated"}
+        assert eligible_student_count([ids["open"]]) == before
+        assert not db.session.get(PlacementDrive, ids["open"]).eligibility_stale
+
+        reopened = ApplyRequest(ids["asha"], ids["open"])
+        commit_batch([reopened])
+        assert reopened.outcome == APPLIED
+
+def test_rejected_and_closed_drives_hold_no_pairs(portal):
+    ids = portal.ids
+    with portal.app_context():
+        moderate("drive", "reject", [ids["other"]])
+        assert close_expired_drives() == 1
+
+        assert pair_count(ids["other"]) == 0
+        assert pair_count(ids["expired"]) == 0
+        assert pair_count(ids["closed"]) == 0
+
+@pytest.fixture
+def background(monkeypatch):
+    """Mark drives stale as deployed, with the thread left to the test."""
+    monkeypatch.setattr(eligibility_worker, "enabled", True)
+    monkeypatch.setattr(eligibility_worker, "_start", lambda: None)
+
+def test_new_drives_are_matched_after_the_request(portal, background):
+    with portal.app_context():
+        company = db.session.execute(select(Company)).scalar_one()
+
+        with counted_statements(db.engine) as statements:
+            drive = add_drive(company, "Later", status="pending")
+            db.session.commit()
+        # The flush only marks the drive, it does not read the students
+        assert not [statement for statement in statements if "FROM student" in statement]
+        assert db.session.get(PlacementDrive, drive.drive_id).eligibility_stale
+        assert pair_count(drive.drive_id) == 0
+
+        assert run_stale_refreshes() == 1
+        assert pair_count(drive.drive_id) == 2
+        assert not db.session.get(PlacementDrive, drive.drive_id).eligibility_stale
+
+def test_approving_a_drive_the_worker_has_not_reached_matches_it(portal, background):
+    with portal.app_context():
+        company = db.session.execute(select(Company)).scalar_one()
+        drive = add_drive(company, "Later", status="pending")
+        db.session.commit()
+
+        assert moderate("drive", "approve", [drive.drive_id]) == {drive.drive_id: "updated"}
+        assert pair_count(drive.drive_id) == 2
+        assert run_stale_refreshes() == 0
+
+@pytest.mark.parametrize("ids", ["12", 12, [1, "2"], [True], None], ids=repr)
+def test_batch_moderation_needs_a_list_of_integer_ids(portal, client, ids):
+    log_in(client, "admin", 1)
+    response = client.post("/admin/moderate", json={"kind": "drive", "action": "close", "ids": ids})
+
+    assert response.status_code == 400
+    with portal.app_context():
+        assert db.session.get(PlacementDrive, portal.ids["open"]).drive_status == "open"
+
+def test_batch_moderation(portal, client):
+    ids = portal.ids
+    log_in(client, "admin", 1)
+    response = client.post("/admin/moderate", json={"kind": "drive", "action": "close", "ids": [ids["open"], 999]})
+
+    assert response.status_code == 200
+    assert response.json["results"] == {str(ids["open"]): "updated", "999": "not_found"}
+
+    response = client.post("/admin/moderate", data={"kind": "drive", "action": "close", "ids": ["x"]})
+    assert response.status_code == 302
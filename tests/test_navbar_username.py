@@ -0,0 +1,30 @@
+from flask import session
+from conftest import counted_statements
+from Models.model import db
+from routes import inject_user
+
+def inject_user_statements(app, **session_values):
+    with app.test_request_context():
+        session.update(session_values)
+        with counted_statements(db.engine) as statements:
+            username = inject_user()["username"]
+        return username, statements, dict(session)
+
+def test_username_from_session_costs_no_queries(app):
+    username, statements, _ = inject_user_statements(app, user_id=1, user_role="admin", username="admin")
+
+    assert username == "admin"
+    assert statements == []
+
+def test_missing_username_is_looked_up_once_and_stored(app):
+    username, statements, stored = inject_user_statements(app, user_id=1, user_role="admin")
+
+    assert username == "admin"
+    assert len(statements) == 1
+    assert stored["username"] == "admin"
+
+def test_logged_out_costs_no_queries(app):
+    username, statements, _ = inject_user_statements(app)
+
+    assert username is None
+    assert statements == []
@@ -0,0 +1,47 @@
+import os
+
+import pytest
+from sqlalchemy import MetaData, inspect
+from app import create_app
+from conftest import log_in
+from Models.model import db
+from Services.setup import create_default_admin, init_database
+
+# Runs only when DATABASE_URL points at an empty, throwaway PostgreSQL
+# database (the driver, e.g. psycopg2, must be installed). Everything the
+# test creates there is dropped again afterwards.
+DATABASE_URL = os.environ.get("DATABASE_URL", "")
+
+pytestmark = pytest.mark.skipif(
+    not DATABASE_URL.startswith("postgresql"), reason="DATABASE_URL is not a PostgreSQL database"
+)
+
+@pytest.fixture
+def postgres_app():
+    app = create_app({
+        "TESTING": True,
+        "SQLALCHEMY_DATABASE_URI": DATABASE_URL,
+        "FRAGMENT_CACHE": "",
+        "APPLY_GROUP_COMMIT": False,
+    })
+    with app.app_context():
+        if inspect(db.engine).get_table_names():
+            pytest.skip("the DATABASE_URL database is not empty")
+        try:
+            yield app
+        finally:
+            db.session.remove()
+            tables = MetaData()
+            tables.reflect(db.engine)
+            tables.drop_all(db.engine)
+            db.engine.dispose()
+
+def test_init_database_and_admin_dashboard(postgres_app):
+    init_database()
+    assert create_default_admin()
+    # A second run finds everything in place
+    assert init_database() == []
+
+    client = postgres_app.test_client()
+    log_in(client, "admin", 1, "admin")
+    assert client.get("/admin/dashboard").status_code == 200
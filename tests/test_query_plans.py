@@ -0,0 +1,15 @@
+from Models.model import db
+from routes import hot_path_statements
+from Services.analytics import analytics_cache
+from Services.drive_feed import feed_cache
+from Services.query_plans import full_table_scans
+
+def test_dashboard_queries_use_indexes(seeded):
+    analytics_cache.clear()
+    feed_cache.clear()
+    with seeded.app_context():
+        statements = hot_path_statements()
+        scans = full_table_scans(db.engine, statements)
+
+    assert statements
+    assert [detail for _, detail in scans] == [], scans
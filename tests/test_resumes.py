@@ -0,0 +1,71 @@
+import io
+
+import pytest
+from conftest import log_in
+from Models.model import db, Company, Student
+from Services import resume_store
+from Services.application_queue import ApplyRequest, commit_batch
+from Services.resume_store import move_legacy_resumes, resume_folder, save_resume
+
+def pdf(text):
+    return io.BytesIO(b"%PDF-1.4\n" + text.encode())
+
+@pytest.fixture
+def resumes(portal):
+    """Asha applied to Acme's open drive, Vikram applied nowhere; both uploaded a resume."""
+    ids = portal.ids
+    with portal.app_context():
+        files = {}
+        for key, name in (("asha", "Asha"), ("vikram", "Vikram")):
+            student = db.session.get(Student, ids[key])
+            student.student_resume_filename = files[key] = save_resume(pdf(name))
+        other = Company(
+            company_name="Globex", company_email="hr@globex.com", company_password_hash="x",
+            company_hr_contact_name="HR", company_hr_contact_email="hr@globex.com", company_industry="IT",
+            approval_status="approved", company_is_approved=True,
+        )
+        db.session.add(other)
+        db.session.commit()
+        commit_batch([ApplyRequest(ids["asha"], ids["open"])])
+
+        portal.resumes = files
+        portal.ids["acme"] = Company.query.filter_by(company_name="Acme").one().company_id
+        portal.ids["globex"] = other.company_id
+    return portal
+
+def fetch(app, role, user_id, filename):
+    client = app.test_client()
+    log_in(client, role, user_id)
+    return client.get(f"/resumes/{filename}").status_code
+
+def test_company_sees_only_its_applicants_resumes(resumes):
+    ids, files = resumes.ids, resumes.resumes
+
+    assert fetch(resumes, "company", ids["acme"], files["asha"]) == 200
+    assert fetch(resumes, "company", ids["acme"], files["vikram"]) == 404
+    assert fetch(resumes, "company", ids["globex"], files["asha"]) == 404
+
+def test_admin_and_owner_see_a_resume(resumes):
+    ids, files = resumes.ids, resumes.resumes
+
+    assert fetch(resumes, "admin", 1, files["vikram"]) == 200
+    assert fetch(resumes, "student", ids["vikram"], files["vikram"]) == 200
+    assert fetch(resumes, "student", ids["asha"], files["vikram"]) == 404
+
+def test_resumes_are_not_served_as_static_files(resumes):
+    client = resumes.test_client()
+
+    assert client.get(f"/static/uploads/resumes/{resumes.resumes['asha']}").status_code == 404
+    with resumes.app_context():
+        assert not resume_folder().startswith(resumes.static_folder)
+
+def test_legacy_resumes_move_into_the_store(app, tmp_path, monkeypatch):
+    legacy = tmp_path / "static_resumes"
+    legacy.mkdir()
+    (legacy / "old_resume.pdf").write_bytes(b"%PDF-1.4\nold")
+    monkeypatch.setattr(resume_store, "LEGACY_RESUME_FOLDER", str(legacy))
+
+    with app.app_context():
+        assert move_legacy_resumes() == 1
+        assert (tmp_path / "resumes" / "old_resume.pdf").read_bytes() == b"%PDF-1.4\nold"
+    assert list(legacy.iterdir()) == []
@@ -0,0 +1,79 @@
+import time
+
+import pytest
+from conftest import log_in
+from Models.model import db, Account, Student, StudentImport
+from Services.student_import import import_worker
+
+CSV = (
+    "student_name,student_email,student_password,student_department,student_cgpa,"
+    "student_joining_year,student_graduation_year\n"
+    "Asha Rao,asha@college.edu,secret1,CSE,8.4,2022,2026\n"
+    "Vikram Das,vikram@college.edu,secret2,ECE,7.1,2022,2026\n"
+    "Asha Again,asha@college.edu,secret3,CSE,8.0,2022,2026\n"
+)
+
+@pytest.fixture
+def uploads(app, tmp_path):
+    app.config["IMPORT_FOLDER"] = str(tmp_path / "imports")
+    import_worker.init_app(app)
+    return tmp_path / "imports"
+
+def upload(client, tmp_path):
+    csv_path = tmp_path / "students.csv"
+    csv_path.write_text(CSV)
+    with open(csv_path, "rb") as csv_file:
+        return client.post("/admin/student/import", data={"students_csv": (csv_file, "students.csv")})
+
+def wait_for_import(app, import_id, timeout=60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        with app.app_context():
+            job = db.session.get(StudentImport, import_id)
+            if job.import_status not in ("pending", "running"):
+                return job
+        time.sleep(0.1)
+    raise AssertionError("the import did not finish in time")
+
+def test_upload_returns_before_hashing(app, client, uploads, tmp_path, monkeypatch):
+    monkeypatch.setattr(import_worker, "_start", lambda: None)
+    log_in(client, "admin", 1, "admin")
+
+    response = upload(client, tmp_path)
+
+    assert response.status_code == 302
+    with app.app_context():
+        job = StudentImport.query.one()
+        assert response.headers["Location"].endswith(f"/admin/student/import/{job.import_id}")
+        assert job.import_status == "pending"
+        assert (uploads / job.csv_filename).exists()
+        assert Student.query.count() == 0
+
+def test_upload_is_imported_in_the_background(app, client, uploads, tmp_path):
+    log_in(client, "admin", 1, "admin")
+
+    response = upload(client, tmp_path)
+    import_id = int(response.headers["Location"].rsplit("/", 1)[1])
+    job = wait_for_import(app, import_id)
+
+    assert (job.import_status, job.imported, job.skipped) == ("done", 2, 1)
+    assert not (uploads / job.csv_filename).exists()
+    with app.app_context():
+        students = {student.student_email: student for student in Student.query.all()}
+        assert set(students) == {"asha@college.edu", "vikram@college.edu"}
+        assert students["vikram@college.edu"].check_password("secret2")
+        assert Account.query.filter_by(account_email="vikram@college.edu").one().account_display_name == "Vikram Das"
+
+    page = client.get(f"/admin/student/import/{import_id}")
+    assert b"imported 2 students, skipped 1 rows" in page.data
+    assert b"duplicate email in file" in page.data
+
+def test_cli_import(app, tmp_path):
+    csv_path = tmp_path / "students.csv"
+    csv_path.write_text(CSV)
+
+    result = app.test_cli_runner().invoke(args=["import-students", str(csv_path), "--workers", "2"])
+
+    assert "Imported 2 students, skipped 1 rows." in result.output
+    with app.app_context():
+        assert db.session.query(Student).count() == 2